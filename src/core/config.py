@@ -1,5 +1,7 @@
+import concurrent.futures
 import sys
 import sysconfig
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -22,6 +24,61 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 10    # 풀 초과 시 추가로 열 수 있는 커넥션 수
     DB_ECHO: bool = False        # SQL 쿼리 로깅
 
+    # 워커 풀 설정 (lifespan에서 생성, 앱 종료 시까지 재사용)
+    POOL_ENABLED: bool = True
+    THREAD_POOL_WORKERS: int = 4       # threading 기본 풀 크기 (시작 시 워밍업)
+    PROCESS_POOL_WORKERS: int = 4      # multiprocessing 기본 풀 크기
+    FRETHREAD_POOL_WORKERS: int = 4    # frethread 기본 풀 크기 (GIL=0에서만 생성)
+    INTERPRETER_POOL_WORKERS: int = 4  # interpreter 기본 풀 크기 (Python 3.14+에서만 생성)
+    ASYNC_POOL_WORKERS: int = 4        # async method가 이벤트 루프에서 위임하는 스레드풀 크기
+    ASYNC_MAX_INFLIGHT: int = 16       # 이벤트 루프 전체에서 동시에 스레드풀에 위임할 작업 수
+    MP_TRANSPORT: Literal["pickle", "shm"] = "pickle"  # multiprocessing 결과 전송 방식
+    MP_CHUNKSIZE: int = 0              # multiprocessing 청크 크기 (0이면 자동 결정)
+    MP_AUTO_WORKERS: bool = False      # 자체 풀 생성 시 workers를 상한으로 워커 수 자동 결정
+    # 워커 프로세스 시작 방식 (auto: GIL=1이면 fork, GIL=0이면 forkserver)
+    MP_START_METHOD: Literal["auto", "fork", "forkserver", "spawn"] = "auto"
+    # forkserver가 워커 fork 전에 한 번 import할 모듈 (Pillow/operation/폰트 준비)
+    MP_PRELOAD: list[str] = ["processor.preload"]
+    # frethread 스케줄링: steal(큰 이미지부터 + work stealing) / fifo(공유 큐, 입력 순서)
+    FRETHREAD_SCHEDULER: Literal["steal", "fifo"] = "steal"
+
+    # 메모리 상한: 모든 러너가 동시에 처리 중인 입력 이미지 메가픽셀 합 (0이면 무제한)
+    # RGB 디코드 기준 1MP ≈ 3MB. 예산이 모자라면 새 작업 제출이 기다린다.
+    MAX_INFLIGHT_MEGAPIXELS: float = 512.0
+
+    # 디코드 캐시: 같은 원본을 반복 처리할 때 디코드된 RGB 이미지를 재사용 (프로세스별 LRU)
+    DECODE_CACHE_ENABLED: bool = True
+    DECODE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # 픽셀 바이트 합 상한
+
+    # 결과 캐시: 같은 원본(sha256) + 같은 operation/params면 기존 출력 파일을 재사용
+    RESULT_CACHE_ENABLED: bool = True
+    # 같은 결과 키를 동시에 처리하는 요청은 하나만 계산하고 나머지는 결과를 기다림
+    COALESCE_REQUESTS: bool = True
+
+    # 배치 작업 실행 위치
+    #   background: API 프로세스의 BackgroundTasks (재시작하면 대기 중 작업 유실)
+    #   db: Job 테이블을 큐로 쓰고 별도 워커 프로세스(worker.py)가 lease를 잡고 실행
+    JOB_QUEUE: Literal["background", "db"] = "background"
+    JOB_LEASE_SECONDS: float = 60.0      # 이 시간 안에 연장하지 않은 lease는 다른 워커가 회수
+    JOB_HEARTBEAT_SECONDS: float = 15.0  # 처리 중인 워커의 lease 연장 주기
+    JOB_MAX_ATTEMPTS: int = 3            # lease 만료로 다시 claim된 횟수 상한 (넘으면 failed)
+    JOB_POLL_SECONDS: float = 1.0        # 큐가 비었을 때 워커의 재조회 간격
+    JOB_PROGRESS_FLUSH_COUNT: int = 32       # 완료 이미지를 이만큼 모아 한 번에 commit
+    JOB_PROGRESS_FLUSH_SECONDS: float = 0.5  # 또는 마지막 기록 후 이 시간이 지나면 commit
+
+    # 배치 작업 공정 스케줄링 (processor.fair_scheduler: 사용자별 deficit round-robin)
+    JOB_FAIR_SCHEDULING: bool = True
+    JOB_SLICE_IMAGES: int = 8       # 작업을 이 장수씩 나눠 차례를 받는다 (DRR quantum)
+    JOB_SCHEDULER_SLOTS: int = 2    # 동시에 풀에 제출할 수 있는 조각 수
+
+    # 단일 이미지 타일 병렬 처리 (blur/sharpen/grayscale, 큰 이미지에만 적용)
+    TILE_ENABLED: bool = True
+    TILE_MIN_MEGAPIXELS: float = 4.0   # 이 크기 이상이면 strip으로 나눠 병렬 처리
+    TILE_WORKERS: int = 4
+
+    # resize가 첫 단계면 JPEG를 목표 크기에 가깝게 축소 디코드 (draft)
+    DECODE_DRAFT: bool = True
+
     # 파일 저장 경로
     UPLOAD_DIR: str = "/app/uploads"
     OUTPUT_DIR: str = "/app/outputs"
@@ -44,6 +101,20 @@ class Settings(BaseSettings):
     def gil_enabled(self) -> bool:
         return sys._is_gil_enabled()
 
+    @property
+    def pool_prewarm(self) -> dict[str, int]:
+        """lifespan에서 미리 띄울 method별 풀 크기."""
+        sizes = {
+            "threading": self.THREAD_POOL_WORKERS,
+            "multiprocessing": self.PROCESS_POOL_WORKERS,
+            "async": self.ASYNC_POOL_WORKERS,
+        }
+        if not self.gil_enabled:
+            sizes["frethread"] = self.FRETHREAD_POOL_WORKERS
+        if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+            sizes["interpreter"] = self.INTERPRETER_POOL_WORKERS
+        return sizes
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
 
@@ -1,7 +1,8 @@
 """프로젝트 전역 상수 및 타입 별칭.
 
-지원하는 이미지 처리 작업(operation)과 동시성 방식(method)의
-이름 집합과 Literal 타입을 한곳에서 정의한다.
+지원하는 동시성 방식(method)의 이름 집합과 Literal 타입을 한곳에서 정의한다.
+operation 이름/Literal/기본 파라미터는 레지스트리에서 파생되므로 processor.operations
+(OperationType, OPERATION_NAMES)와 processor.registry(get_default_params)에 있다.
 
 주의: Literal 타입과 set은 Python 타입 시스템의 제약으로
      자동 동기화가 불가능하므로, 값을 추가/삭제할 때 둘 다 수정해야 한다.
@@ -9,28 +10,16 @@
 
 from typing import Literal
 
-# --- 이미지 처리 작업(operation) ---
-
-OperationType = Literal["blur", "grayscale", "resize", "rotate", "sharpen", "watermark"]
-
-OPERATION_NAMES: set[str] = {"blur", "grayscale", "resize", "rotate", "sharpen", "watermark"}
-
 # --- 동시성 방식(method) ---
 
-MethodType = Literal["sync", "threading", "multiprocessing", "frethread"]
-
-METHOD_NAMES: set[str] = {"sync", "threading", "multiprocessing", "frethread"}
-
-# --- operation별 기본 파라미터 ---
+MethodType = Literal[
+    "sync", "threading", "multiprocessing", "frethread", "interpreter", "async", "auto",
+]
 
-DEFAULT_PARAMS: dict[str, dict] = {
-    "resize": {"width": 200, "height": 200},
-    "blur": {"radius": 10},
+METHOD_NAMES: set[str] = {
+    "sync", "threading", "multiprocessing", "frethread", "interpreter", "async", "auto",
 }
 
+# 비용 모델(processor/cost_model.py)이 실제 method와 workers를 골라 주는 가상 method
+AUTO_METHOD = "auto"
 
-def get_default_params(operation: str, params: dict | None) -> dict:
-    """params가 비어있으면 operation에 맞는 기본값을 반환한다."""
-    if params:
-        return params
-    return DEFAULT_PARAMS.get(operation, {})
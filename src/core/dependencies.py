@@ -26,6 +26,14 @@ def get_current_user(
     3. payload["sub"] (이메일)로 DB에서 사용자 조회
     4. 실패 시 InvalidToken 예외 → 전역 핸들러가 401 응답
     """
+    return authenticate(token, session)
+
+
+def authenticate(token: str, session: Session) -> User:
+    """토큰을 검증하고 사용자를 조회한다 (get_current_user 본체).
+
+    세션 수명을 직접 정해야 하는 엔드포인트(SSE 스트림 등)에서 호출한다.
+    """
     payload = verify_token(token)
     if not payload:
         raise InvalidToken
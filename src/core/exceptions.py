@@ -109,6 +109,18 @@ class JobNotCompleted(AppException):
     message = "작업이 아직 완료되지 않았습니다"
 
 
+class JobNotCancellable(AppException):
+    status_code = 409
+    error_code = "JOB_NOT_CANCELLABLE"
+    message = "이미 끝난 작업은 취소할 수 없습니다"
+
+
+class JobNotRetryable(AppException):
+    status_code = 409
+    error_code = "JOB_NOT_RETRYABLE"
+    message = "다시 처리할 이미지가 없습니다"
+
+
 # --- OpenAPI 공통 응답 스키마 ---
 
 AUTH_401 = {"model": ErrorResponse, "description": "인증 실패 (토큰 누락/만료)"}
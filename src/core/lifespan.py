@@ -5,6 +5,7 @@ from loguru import logger
 
 from core.config import settings
 from model.database import create_db_and_tables
+from processor.pool_manager import pool_manager
 
 
 @asynccontextmanager
@@ -20,9 +21,15 @@ async def lifespan(app: FastAPI):
     if db_type == "PostgreSQL":
         logger.info(f"  pool_size={settings.DB_POOL_SIZE}, max_overflow={settings.DB_MAX_OVERFLOW}")
 
+    if settings.POOL_ENABLED:
+        pool_manager.start(settings.pool_prewarm)
+        logger.info(f"Worker pools ready: {settings.pool_prewarm}")
+
     app.state.settings = settings
+    app.state.pools = pool_manager
 
     yield
 
     # === 종료 ===
     logger.info("Shutting down")
+    pool_manager.shutdown()
@@ -11,18 +11,24 @@ from core.exceptions import AppException
 from core.lifespan import lifespan
 from core.middleware import RequestLoggingMiddleware
 from core.openapi import create_custom_openapi
+from processor.decode_cache import cache as decode_cache
+from processor.fair_scheduler import scheduler
+from processor.result_cache import cache as result_cache
+from processor.singleflight import inflight
 from router.auth_router import router as auth_router
 from router.benchmark_router import router as benchmark_router
 from router.image_router import router as image_router
 from router.job_router import router as job_router
+from service.job_events import events as job_events
+from service.job_events import pollers as job_pollers
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description=(
         "Free-threaded Python(3.14t, GIL=0) 백엔드 벤치마크 프로젝트.\n\n"
-        "이미지 프로세싱 API를 통해 4가지 동시성 모델"
-        "(sync, threading, multiprocessing, free-threaded)의 성능을 비교한다.\n\n"
+        "이미지 프로세싱 API를 통해 여러 동시성 모델(sync, threading, multiprocessing, "
+        "free-threaded, subinterpreter, 이벤트 루프 위의 async)의 성능을 비교한다.\n\n"
         "**주요 기능:**\n"
         "- JWT 인증 (회원가입/로그인)\n"
         "- 이미지 업로드, 처리(blur, resize, grayscale 등), 다운로드\n"
@@ -57,7 +63,11 @@ app.include_router(job_router)
     "/health",
     tags=["system"],
     summary="헬스체크",
-    description="서버 상태, Python 버전, GIL 활성화 여부를 반환한다.",
+    description=(
+        "서버 상태, Python 버전, GIL 활성화 여부, "
+        "디코드/결과 캐시 적중률, 요청 합치기 횟수, 작업 이벤트 구독 수, "
+        "배치 스케줄러 상태를 반환한다."
+    ),
 )
 async def health():
     return {
@@ -65,6 +75,11 @@ async def health():
         "python_version": settings.python_version,
         "free_threaded": settings.gil_disabled,
         "gil_enabled": settings.gil_enabled,
+        "decode_cache": decode_cache.stats(),
+        "result_cache": result_cache.stats(),
+        "coalescing": inflight.stats(),
+        "job_events": {**job_events.stats(), **job_pollers.stats()},
+        "scheduler": scheduler.stats(),
     }
 
 
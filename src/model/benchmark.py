@@ -5,11 +5,27 @@ from sqlmodel import Field, SQLModel
 
 class BenchmarkResult(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
-    method: str  # sync, threading, multiprocessing, frethread
+    method: str  # runners.METHODS의 키 (sync, threading, ..., interpreter, async)
     operation: str  # blur, resize, grayscale, ...
     workers: int = Field(default=1)
     image_count: int
-    duration: float  # seconds
+    duration: float  # seconds (영구 풀 = warm 기준)
+    cold_duration: float | None = Field(default=None)  # 풀 생성 포함 (sync는 None)
+    decision: str | None = Field(default=None)  # method="auto"일 때 선택 근거
+    predicted_duration: float | None = Field(default=None)  # auto 비용 모델 예측 (초)
+    # 실행 동안 서버 이벤트 루프가 예정보다 늦게 깨어난 시간 (ms, API 밖에서 실행하면 None)
+    loop_lag_max_ms: float | None = Field(default=None)
+    loop_lag_mean_ms: float | None = Field(default=None)
+    decode_cache: bool = Field(default=False)  # 디코드 캐시 사용 여부 (False면 디코드 비용 포함)
+    # 실행 동안 서버 프로세스 + 자식 프로세스(multiprocessing 워커) RSS 합의 최대값 (MB)
+    peak_rss_mb: float | None = Field(default=None)
+    # 이미지당 단계별 평균 시간 (ms, duration 측정에서 워커 안에서 잰 값, processor.stages 참고)
+    # 측정하지 않았거나 해당 단계가 없으면 None (encode: 출력 저장 시, ipc: multiprocessing만)
+    decode_ms: float | None = Field(default=None)
+    convert_ms: float | None = Field(default=None)
+    op_ms: float | None = Field(default=None)
+    encode_ms: float | None = Field(default=None)
+    ipc_ms: float | None = Field(default=None)
     gil_enabled: bool
     db_backend: str | None = Field(default=None)  # "sqlite" or "postgresql"
     user_id: int | None = Field(default=None, foreign_key="user.id")
@@ -7,6 +7,7 @@ class ImageRecord(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     filename: str
     original_path: str
+    content_hash: str | None = None  # 원본 sha256 (결과 캐시 키)
     output_path: str | None = None
     operation: str | None = None
     status: str = Field(default="uploaded")  # uploaded, processing, completed, failed
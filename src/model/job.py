@@ -7,16 +7,28 @@ from sqlmodel import Field, SQLModel
 class Job(SQLModel, table=True):
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
-    status: str = Field(default="queued")  # queued, processing, completed, failed
-    method: str = Field(default="sync")  # sync, threading, multiprocessing, frethread
-    operation: str  # blur, resize, grayscale, ...
-    params: str = Field(default="{}")  # JSON string
+    # completed는 failed_count > 0일 수 있다 (일부 이미지만 실패). 모든 이미지가 실패하면 failed
+    status: str = Field(default="queued")  # queued, processing, completed, failed, cancelled
+    method: str = Field(default="sync")  # runners.METHODS의 키
+    operation: str  # blur, resize, grayscale, ... 또는 pipeline
+    params: str = Field(default="{}")  # JSON string (pipeline이면 {"steps": [...]})
     workers: int = Field(default=4)
     image_ids: str  # JSON string: [1, 2, 3]
     image_count: int
     processed_count: int = Field(default=0)
+    failed_count: int = Field(default=0)  # 처리에 실패한 이미지 수 (이미지별 결과는 JobImage)
+    priority: int = Field(default=0)  # 높을수록 먼저 (processor.fair_scheduler, job_queue.claim)
+    cancel_requested: bool = Field(default=False)  # 처리 중 취소 요청: 이미지 사이에서 멈춘다
     duration: float | None = None
+    # method="auto" 요청 시 비용 모델의 선택 근거와 예측 소요 시간 (method/workers는 선택 결과)
+    decision: str | None = None
+    predicted_duration: float | None = None
+    peak_rss_mb: float | None = None  # 처리 동안 프로세스(+자식) RSS 합의 최대값 (MB)
     error_message: str | None = None
+    # JOB_QUEUE="db"일 때 작업을 가져간 워커와 lease 만료 시각, claim 횟수 (service.job_queue)
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = Field(default=None, index=True)
+    attempts: int = Field(default=0)
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     completed_at: datetime | None = None
 
@@ -27,3 +39,14 @@ class Job(SQLModel, table=True):
     @property
     def params_dict(self) -> dict:
         return json.loads(self.params)
+
+
+class JobImage(SQLModel, table=True):
+    # 배치 작업의 이미지별 처리 결과. process_job은 completed가 아닌 행만 처리하므로
+    # 재시도(POST /api/jobs/{id}/retry)와 lease 만료 후 재처리가 끝난 이미지를 다시 계산하지 않는다.
+    job_id: int = Field(foreign_key="job.id", primary_key=True)
+    image_id: int = Field(primary_key=True)  # ImageRecord.id (Job.image_ids처럼 FK 없음)
+    status: str = Field(default="pending")  # pending, completed, failed
+    output_path: str | None = None
+    error_message: str | None = None
+    retries: int = Field(default=0)  # 재시도로 다시 pending이 된 횟수
@@ -9,14 +9,25 @@ CPU를 계속 점유하는 이미지 처리에서는 양보(await) 시점이 없
 대안: run_in_executor()로 스레드풀에 위임하면
 I/O 계층은 비동기로, 실제 처리는 스레드에서 병렬로 실행할 수 있다.
 (단, GIL=1이면 스레드풀도 순차 실행됨)
+
+LoopLagProbe는 작업이 도는 동안 이벤트 루프가 얼마나 늦게 깨어나는지(루프 지연)를 잰다.
+스레드로 위임한 CPU 작업이 GIL을 잡고 있으면 루프 스레드가 GIL을 기다리느라 지연이 커진다.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import statistics
+from collections.abc import AsyncIterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 from PIL import Image
 
-from processor import operations
+from processor import memory, operations
+from processor.image_io import process_file
+from processor.pipeline import compile_transform, size_hint
+from processor.stages import StageTimes
+from processor.streaming import default_inflight
+
+_BUDGET_POLL_SECONDS = 0.005
 
 
 async def run(
@@ -64,3 +75,119 @@ async def run_with_executor(
         results = await asyncio.gather(*futures)
 
     return list(results)
+
+
+async def iter_with_executor(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    weights: Sequence[float] | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> AsyncIterator[tuple[int, Image.Image | str]]:
+    """run_with_executor의 스트리밍 버전.
+
+    max_inflight개까지만 스레드풀에 위임하고, 끝난 순서대로 (index, result)를 yield한다.
+    semaphore를 주면 작업 하나를 위임할 때마다 permit을 얻고 작업이 끝나면 돌려준다.
+    같은 루프의 여러 요청이 semaphore를 공유하면 루프 전체의 동시 위임 수가 제한된다.
+    weights(이미지별 메가픽셀)를 주면 memory.budget도 얻고 위임한다. 예산은 스레드 간 공유라
+    루프를 막지 않도록 기다리는 동안 짧게 sleep하며 다시 시도한다.
+    """
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    outputs = output_paths or [None] * len(image_paths)
+    limit = max_inflight or default_inflight(workers)
+    loop = asyncio.get_running_loop()
+
+    own_pool = executor is None
+    pool = ThreadPoolExecutor(max_workers=workers) if own_pool else executor
+    tasks = iter(enumerate(zip(image_paths, outputs)))
+    pending: dict[asyncio.Future, int] = {}
+
+    async def _submit() -> None:
+        item = next(tasks, None)
+        if item is None:
+            return
+        idx, (path, out) = item
+        granted = 0.0
+        if weights is not None:
+            while (granted := memory.budget.try_acquire(weights[idx])) is None:
+                await asyncio.sleep(_BUDGET_POLL_SECONDS)
+        if semaphore is not None:
+            try:
+                await semaphore.acquire()
+            except BaseException:
+                memory.budget.release(granted)
+                raise
+        future = loop.run_in_executor(
+            pool, process_file, path, transform, out, hint, use_cache, timings
+        )
+        if semaphore is not None:
+            # 결과 소비 여부와 무관하게 작업이 끝나면 바로 permit을 돌려준다
+            future.add_done_callback(lambda _: semaphore.release())
+        if granted:
+            future.add_done_callback(lambda _: memory.budget.release(granted))
+        pending[future] = idx
+
+    try:
+        for _ in range(limit):
+            await _submit()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                idx = pending.pop(future)
+                await _submit()
+                yield idx, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_pool:
+            # 중간에 멈춘 경우 실행 중인 작업을 기다리느라 이벤트 루프를 막지 않는다
+            pool.shutdown(wait=not pending, cancel_futures=True)
+
+
+class LoopLagProbe:
+    """이벤트 루프 지연 측정기.
+
+    interval마다 asyncio.sleep(interval)을 걸고, 실제로 깨어난 시각이
+    예정보다 얼마나 늦었는지를 기록한다. start()/stop()은 측정할 루프 위에서 호출한다.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - scheduled))
+
+    async def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        # 첫 sleep이 걸린 뒤에 반환해야 직후의 블로킹도 지연으로 잡힌다
+        await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def max_ms(self) -> float | None:
+        return round(max(self.samples) * 1000, 3) if self.samples else None
+
+    @property
+    def mean_ms(self) -> float | None:
+        return round(statistics.mean(self.samples) * 1000, 3) if self.samples else None
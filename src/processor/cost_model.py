@@ -0,0 +1,210 @@
+"""`auto` 동시성 방식의 비용 모델.
+
+이미지 수, 이미지 크기, operation(레지스트리 메타데이터), 현재 GIL 상태와
+같은 환경(GIL 상태)에서 쌓인 BenchmarkResult 기록으로 method별 소요 시간을 예측하고
+가장 빠른 (method, workers)를 고른다. DB 조회는 서비스가 하고 이 모듈은 순수 계산만 한다.
+
+예측식 (method, workers=w, 이미지 n장):
+    per_image = scale × SECONDS_PER_UNIT × work(operation, megapixels)
+    time      = per_image × n / (1 + (min(w, n) - 1) × efficiency) + overhead
+
+  - work: 단계별 cost_per_mp × 메가픽셀 합 + 디코드/인코드 비용
+          (resize 이후 단계는 줄어든 크기 기준)
+  - scale: sync 기록의 (실측 / 사전값) 중앙값. 기록이 없으면 1.0
+  - efficiency: 해당 method 기록에서 역산한 병렬 효율 중앙값. 기록이 없으면 사전값
+  - overhead: 영구 풀이 없으면 풀 생성 비용 (기록의 cold_duration - duration 중앙값 또는 사전값)
+"""
+
+import statistics
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from processor import interpreter_runner, registry
+from processor.pipeline import PIPELINE, normalize_steps
+
+# blur(radius=10) 1MP ≈ 0.06s (3MP 노이즈 이미지, GIL=1 단일 스레드 실측)
+SECONDS_PER_UNIT = 0.06
+# JPEG/PNG 디코드 + JPEG 인코드 (blur=1.0 기준 상대값, Pillow C 코드라 GIL을 놓는다)
+IO_COST_PER_MP = 0.3
+
+# 병렬 효율 사전값: 워커 1개 추가당 얻는 속도 향상 비율
+PRIOR_EFFICIENCY = {
+    "threading": 0.8,
+    "multiprocessing": 0.85,
+    "frethread": 0.9,
+    "interpreter": 0.85,
+}
+# 풀 생성 비용 사전값 (초): 고정 + 워커당 (interpreter는 인터프리터마다 PIL을 다시 import)
+PRIOR_COLD = {
+    "threading": (0.0, 0.001),
+    "multiprocessing": (0.05, 0.02),
+    "frethread": (0.0, 0.001),
+    "interpreter": (0.0, 0.03),
+}
+# 결과 이미지를 pickle로 주고받는 method의 이미지당 IPC 비용 (초/MP)
+MP_IPC_SECONDS_PER_MP = 0.004
+_PICKLED_RESULTS = {"multiprocessing", "interpreter"}
+
+WORKER_CANDIDATES = (2, 4, 8, 16)
+
+
+class Sample(NamedTuple):
+    """비용 모델 입력으로 쓰는 벤치마크 기록 한 건 (BenchmarkResult에서 필요한 필드만)."""
+
+    method: str
+    operation: str
+    workers: int
+    image_count: int
+    duration: float
+    cold_duration: float | None = None
+
+
+class Decision(NamedTuple):
+    method: str
+    workers: int
+    predicted: float  # 예측 소요 시간 (초)
+    source: str  # "history" 또는 "prior"
+    reason: str
+
+
+def work(operation: str, params: dict | None, megapixels: float) -> tuple[float, float]:
+    """이미지 1장의 (전체 작업량, GIL을 놓는 작업량)을 blur 1MP 단위로 반환한다."""
+    params = params or {}
+    if operation == PIPELINE:
+        steps = normalize_steps(params.get("steps", []))
+    else:
+        spec = registry.get(operation)
+        steps = [(operation, spec.bind(params) if params else spec.default_params())]
+
+    total = released = IO_COST_PER_MP * megapixels
+    mp = megapixels
+    for name, step_params in steps:
+        spec = registry.get(name)
+        cost = spec.cost_per_mp * mp
+        total += cost
+        if spec.releases_gil:
+            released += cost
+        if name == "resize":
+            mp = step_params["width"] * step_params["height"] / 1_000_000
+    return total, released
+
+
+class CostModel:
+    def __init__(
+        self,
+        gil_enabled: bool,
+        samples: Iterable[Sample] = (),
+        reference_megapixels: float = 1.0,
+        warm_pools: Iterable[tuple[str, int]] = (),
+    ) -> None:
+        """samples는 현재와 같은 GIL 상태의 기록만 넘긴다.
+
+        reference_megapixels: 기록을 만든 벤치마크 이미지의 평균 메가픽셀
+        warm_pools: 이미 떠 있는 (method, workers) 풀 (풀 생성 비용 없음)
+        """
+        self.gil_enabled = gil_enabled
+        self.samples = list(samples)
+        self.reference_megapixels = reference_megapixels
+        self.warm_pools = set(warm_pools)
+
+    # --- 기록으로 보정 ---
+
+    def _sample_work(self, sample: Sample) -> float:
+        try:
+            return work(sample.operation, None, self.reference_megapixels)[0]
+        except ValueError:
+            return 0.0
+
+    def _scale(self, operation: str) -> tuple[float, int]:
+        """sync 기록의 실측/사전값 비율. 같은 operation 기록을 우선 사용한다."""
+        syncs = [s for s in self.samples if s.method == "sync" and self._sample_work(s) > 0]
+        same = [s for s in syncs if s.operation == operation] or syncs
+        ratios = [
+            s.duration / s.image_count / (SECONDS_PER_UNIT * self._sample_work(s)) for s in same
+        ]
+        return (statistics.median(ratios), len(ratios)) if ratios else (1.0, 0)
+
+    def _efficiency(self, method: str, scale: float, prior: float) -> tuple[float, int]:
+        effs = []
+        for s in self.samples:
+            parallel = min(s.workers, s.image_count)
+            if s.method != method or parallel < 2 or self._sample_work(s) <= 0:
+                continue
+            sync_estimate = scale * SECONDS_PER_UNIT * self._sample_work(s) * s.image_count
+            speedup = sync_estimate / s.duration
+            effs.append(min(1.0, max(0.0, (speedup - 1) / (parallel - 1))))
+        return (statistics.median(effs), len(effs)) if effs else (prior, 0)
+
+    def _cold_overhead(self, method: str, workers: int) -> float:
+        if (method, workers) in self.warm_pools:
+            return 0.0
+        diffs = [
+            s.cold_duration - s.duration
+            for s in self.samples
+            if s.method == method and s.workers == workers and s.cold_duration is not None
+        ]
+        if diffs:
+            return max(0.0, statistics.median(diffs))
+        fixed, per_worker = PRIOR_COLD[method]
+        return fixed + per_worker * workers
+
+    # --- 예측 ---
+
+    def methods(self) -> list[str]:
+        """현재 환경에서 고를 수 있는 method. frethread는 GIL=0에서만, interpreter는 3.14+."""
+        methods = ["sync", "threading", "multiprocessing"]
+        if not self.gil_enabled:
+            methods.append("frethread")
+        if interpreter_runner.is_available():
+            methods.append("interpreter")
+        return methods
+
+    def predict(
+        self, method: str, workers: int, operation: str, params: dict | None,
+        image_count: int, megapixels: float,
+    ) -> tuple[float, int]:
+        """(예측 소요 시간, 사용한 기록 수)를 반환한다."""
+        total, released = work(operation, params, megapixels)
+        scale, used = self._scale(operation)
+        per_image = scale * SECONDS_PER_UNIT * total
+        if method == "sync":
+            return per_image * image_count, used
+
+        prior = PRIOR_EFFICIENCY[method]
+        if method == "threading" and self.gil_enabled:
+            # GIL을 잡는 구간은 스레드끼리 직렬화된다
+            prior *= released / total
+        efficiency, eff_used = self._efficiency(method, scale, prior)
+
+        parallel = min(workers, image_count)
+        elapsed = per_image * image_count / (1 + (parallel - 1) * efficiency)
+        elapsed += self._cold_overhead(method, workers)
+        if method in _PICKLED_RESULTS:
+            elapsed += MP_IPC_SECONDS_PER_MP * megapixels * image_count
+        return elapsed, used + eff_used
+
+    def choose(
+        self, operation: str, params: dict | None, image_count: int, megapixels: float,
+        max_workers: int = 16,
+    ) -> Decision:
+        """예측 시간이 가장 짧은 (method, workers)를 고른다. 동률이면 단순한 쪽(sync, 적은 워커)."""
+        candidates = [("sync", 1)] + [
+            (method, w)
+            for method in self.methods()
+            if method != "sync"
+            for w in WORKER_CANDIDATES
+            if w <= max_workers and (w <= image_count or w == WORKER_CANDIDATES[0])
+        ]
+        predictions = []
+        for method, w in candidates:
+            predicted, used = self.predict(method, w, operation, params, image_count, megapixels)
+            predictions.append((predicted, method, w, used))
+
+        best = min(predictions, key=lambda p: p[0])
+        predicted, method, w, used = best
+        sync_time = predictions[0][0]
+        reason = (
+            f"{method} w={w} 예측 {predicted:.3f}s (sync 예측 {sync_time:.3f}s, "
+            f"GIL={'on' if self.gil_enabled else 'off'}, 기록 {used}건 반영)"
+        )
+        return Decision(method, w, round(predicted, 4), "history" if used else "prior", reason)
@@ -0,0 +1,107 @@
+"""디코드된 RGB 이미지 LRU 캐시 (프로세스 전역).
+
+같은 원본(벤치마크 fixture, 같은 업로드에 대한 반복 처리)을 매번 다시 디코드하지 않도록
+디코드 결과를 (경로, mtime_ns, 파일 크기, size_hint) 키로 보관한다.
+파일이 바뀌면 mtime/크기가 달라져 자연스럽게 새 키가 된다.
+
+  - 용량: 픽셀 바이트 합(width × height × 채널 수)이 max_bytes를 넘으면
+          가장 오래 쓰지 않은 항목부터 버린다. max_bytes보다 큰 이미지는 캐시하지 않는다.
+  - GIL=0 안전성: OrderedDict 조회/삽입/축출은 Lock 안에서 한다. 디코드는 Lock 밖에서 하므로
+          같은 이미지를 두 스레드가 동시에 처음 읽으면 둘 다 디코드하고 한쪽 결과만 남는다.
+  - 반환된 Image는 여러 요청이 공유하므로 수정하면 안 된다 (operation은 항상 새 Image를 반환).
+
+multiprocessing/interpreter 워커는 프로세스(인터프리터)마다 캐시가 따로 있다.
+러너는 use_cache=True일 때만 이 캐시를 쓰고, 디코드 비용을 재야 하는 벤치마크는 끈다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from PIL import Image
+
+from core.config import settings
+
+Key = tuple[str, int, int, tuple[int, int] | None]
+
+
+def image_bytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+class DecodeCache:
+    def __init__(self, max_bytes: int | None = None) -> None:
+        """max_bytes가 None이면 settings.DECODE_CACHE_MAX_BYTES를 따른다."""
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Key, Image.Image] = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "uncacheable": 0}
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes if self._max_bytes is not None else settings.DECODE_CACHE_MAX_BYTES
+
+    @staticmethod
+    def _key(path: str, size_hint: tuple[int, int] | None) -> Key:
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size, size_hint)
+
+    def get(
+        self,
+        path: str,
+        size_hint: tuple[int, int] | None,
+        decode: Callable[[str, tuple[int, int] | None], Image.Image],
+    ) -> Image.Image:
+        """캐시된 이미지를 반환하고, 없으면 decode(path, size_hint)로 디코드해 넣는다."""
+        key = self._key(path, size_hint)
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return image
+            self._stats["misses"] += 1
+
+        image = decode(path, size_hint)
+        self._put(key, image)
+        return image
+
+    def _put(self, key: Key, image: Image.Image) -> None:
+        size = image_bytes(image)
+        with self._lock:
+            limit = self.max_bytes
+            if size > limit:
+                self._stats["uncacheable"] += 1
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= image_bytes(previous)
+            self._entries[key] = image
+            self._bytes += size
+            while self._bytes > limit:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= image_bytes(evicted)
+                self._stats["evictions"] += 1
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_rate=round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+cache = DecodeCache()
@@ -0,0 +1,147 @@
+"""배치 작업 공정 스케줄러 (사용자별 deficit round-robin).
+
+배치 작업은 모두 같은 풀(pool_manager)을 나눠 쓴다. 작업마다 iter_run으로 전부 제출하면
+먼저 시작한 큰 작업이 풀 대기열을 채워 다른 사용자의 작은 작업이 그 뒤에서 기다린다.
+
+process_job은 남은 이미지를 JOB_SLICE_IMAGES장씩 조각(slice)으로 나누고, 조각마다
+scheduler.turn()으로 차례를 받은 뒤 풀에 제출한다. 동시에 풀을 쓰는 조각은 JOB_SCHEDULER_SLOTS개.
+차례는 사용자 단위 deficit round-robin(DRR)으로 나눈다.
+  - 사용자 차례가 오면 deficit에 quantum(= JOB_SLICE_IMAGES × (1 + priority))을 더하고,
+    deficit이 조각 비용(이미지 수) 이상인 동안 그 사용자의 조각을 내보낸 뒤 다음 사용자로 넘어간다.
+  - 같은 사용자의 조각끼리는 priority가 높은 작업, 먼저 온 조각 순서.
+  - 기다리는 조각이 없어진 사용자는 deficit을 잃는다 (쉬는 동안 몫을 쌓아 두지 못함).
+그래서 큰 작업 하나가 돌고 있어도 새 사용자의 작은 작업은 최대 한 라운드(조각 하나) 뒤에 시작한다.
+
+차례를 기다리는 동안 cancel 이벤트가 설정되면 차례를 받지 않고 돌아온다 (wake()로 깨움).
+"""
+
+import itertools
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from core.config import settings
+
+
+@dataclass(order=True)
+class _Ticket:
+    sort_key: tuple[int, int]
+    user_id: int = field(compare=False)
+    cost: int = field(compare=False)
+    priority: int = field(compare=False)
+    granted: bool = field(default=False, compare=False)
+
+
+class FairScheduler:
+    def __init__(self, slots: int | None = None, quantum: int | None = None) -> None:
+        """slots/quantum이 None이면 settings를 따른다 (실행 중 변경 반영)."""
+        self._slots = slots
+        self._quantum = quantum
+        self._cond = threading.Condition()
+        self._queues: dict[int, list[_Ticket]] = {}
+        self._deficit: dict[int, float] = {}
+        self._active: deque[int] = deque()  # 기다리는 조각이 있는 사용자 (라운드 순서)
+        self._visited = False  # _active[0]이 이번 차례의 quantum을 이미 받았는지
+        self._seq = itertools.count()
+        self.running = 0
+        self._stats = {"granted": 0, "waited": 0, "cancelled": 0}
+
+    @property
+    def slots(self) -> int:
+        return max(self._slots if self._slots is not None else settings.JOB_SCHEDULER_SLOTS, 1)
+
+    @property
+    def quantum(self) -> int:
+        return max(self._quantum if self._quantum is not None else settings.JOB_SLICE_IMAGES, 1)
+
+    def _dispatch_locked(self) -> None:
+        while self.running < self.slots and self._active:
+            user_id = self._active[0]
+            queue = self._queues[user_id]
+            head = queue[0]
+            if not self._visited:
+                self._deficit[user_id] += self.quantum * (1 + max(head.priority, 0))
+                self._visited = True
+            if self._deficit[user_id] < head.cost:
+                self._active.rotate(-1)
+                self._visited = False
+                continue
+            self._deficit[user_id] -= head.cost
+            queue.pop(0)
+            head.granted = True
+            self.running += 1
+            self._stats["granted"] += 1
+            if not queue:
+                self._forget_locked(user_id)
+
+    def _forget_locked(self, user_id: int) -> None:
+        if self._active and self._active[0] == user_id:
+            self._visited = False
+        self._active.remove(user_id)
+        del self._queues[user_id]
+        del self._deficit[user_id]
+
+    @contextmanager
+    def turn(
+        self,
+        user_id: int,
+        cost: int,
+        priority: int = 0,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[bool]:
+        """차례를 받을 때까지 기다렸다가 True를 yield한다. 기다리는 중 취소되면 False."""
+        ticket = _Ticket((-priority, next(self._seq)), user_id, max(cost, 1), priority)
+        with self._cond:
+            queue = self._queues.get(user_id)
+            if queue is None:
+                queue = self._queues[user_id] = []
+                self._deficit[user_id] = 0.0
+                self._active.append(user_id)
+            queue.append(ticket)
+            queue.sort()
+            self._dispatch_locked()
+            if not ticket.granted:
+                self._stats["waited"] += 1
+                self._cond.wait_for(
+                    lambda: ticket.granted or (cancel is not None and cancel.is_set())
+                )
+            if not ticket.granted:
+                queue.remove(ticket)
+                if not queue:
+                    self._forget_locked(user_id)
+                self._stats["cancelled"] += 1
+        if not ticket.granted:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with self._cond:
+                self.running -= 1
+                self._dispatch_locked()
+                self._cond.notify_all()
+
+    def wake(self) -> None:
+        """취소 이벤트를 설정한 뒤 기다리는 쪽이 다시 확인하도록 깨운다."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                **self._stats,
+                "slots": self.slots,
+                "running": self.running,
+                "waiting": sum(len(q) for q in self._queues.values()),
+                "users": len(self._active),
+            }
+
+    def reset_stats(self) -> None:
+        with self._cond:
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+# 프로세스 전역 인스턴스
+scheduler = FairScheduler()
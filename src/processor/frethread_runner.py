@@ -7,13 +7,70 @@ thread_runner.py와 실행 로직은 동일하지만, 런타임에 GIL 비활성
   - thread_runner: GIL=1 환경에서 threading의 한계를 보여줌
   - frethread_runner: GIL=0 환경에서 threading의 진짜 가치를 보여줌
   - 벤치마크에서 동일 코드가 GIL 설정에 따라 어떻게 달라지는지 비교
+
+스케줄링 (settings.FRETHREAD_SCHEDULER):
+  - "steal": 큰 이미지부터 워커별 deque에 나누고 work stealing (work_stealing.py, 기본)
+  - "fifo":  thread_runner와 같은 공유 큐 + 입력 순서 (비교용)
 """
 
 import sys
+from collections.abc import Iterator
+from concurrent.futures import Executor
 
 from PIL import Image
 
-from processor import thread_runner
+from core.config import settings
+from processor import memory, thread_runner
+from processor.image_io import process_file
+from processor.pipeline import compile_transform, size_hint
+from processor.stages import StageTimes
+from processor.streaming import default_inflight
+from processor.work_stealing import WorkStealingScheduler, image_weight
+
+
+def _require_gil_disabled() -> None:
+    if sys._is_gil_enabled():
+        raise RuntimeError(
+            "frethread_runner는 GIL이 비활성화된 환경에서만 사용할 수 있습니다. "
+            "PYTHON_GIL=0 환경변수와 --disable-gil 빌드가 필요합니다."
+        )
+
+
+def _scheduler(name: str | None) -> str:
+    name = name or settings.FRETHREAD_SCHEDULER
+    if name not in ("steal", "fifo"):
+        raise ValueError(f"Unknown scheduler: {name}. 가능한 값: steal, fifo")
+    return name
+
+
+def _iter_stealing(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None,
+    workers: int,
+    output_paths: list[str] | None,
+    executor: Executor | None,
+    max_inflight: int | None,
+    use_cache: bool,
+    timings: StageTimes | None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    outputs = output_paths or [None] * len(image_paths)
+
+    def process_one(task: tuple[str, str | None]) -> Image.Image | str:
+        path, out = task
+        return process_file(path, transform, out, hint, use_cache, timings)
+
+    scheduler = WorkStealingScheduler(workers)
+    yield from scheduler.run(
+        process_one,
+        list(zip(image_paths, outputs)),
+        [image_weight(p) for p in image_paths],
+        executor=executor,
+        max_inflight=max_inflight,
+        budget=memory.budget if memory.budget.enabled else None,
+    )
 
 
 def run(
@@ -21,12 +78,65 @@ def run(
     operation: str,
     params: dict | None = None,
     workers: int = 4,
-) -> list[Image.Image]:
-    """GIL=0 환경에서 ThreadPoolExecutor로 이미지를 진정한 병렬 처리한다."""
-    if sys._is_gil_enabled():
-        raise RuntimeError(
-            "frethread_runner는 GIL이 비활성화된 환경에서만 사용할 수 있습니다. "
-            "PYTHON_GIL=0 환경변수와 --disable-gil 빌드가 필요합니다."
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    scheduler: str | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> list[Image.Image] | list[str]:
+    """GIL=0 환경에서 이미지를 진정한 병렬 처리한다.
+
+    scheduler가 None이면 settings.FRETHREAD_SCHEDULER를 따른다.
+    """
+    _require_gil_disabled()
+    if _scheduler(scheduler) == "fifo":
+        return thread_runner.run(
+            image_paths, operation, params, workers, output_paths, executor, use_cache, timings
         )
 
-    return thread_runner.run(image_paths, operation, params, workers)
+    results: list = [None] * len(image_paths)
+    for idx, result in _iter_stealing(
+        image_paths, operation, params, workers, output_paths, executor, None, use_cache, timings
+    ):
+        results[idx] = result
+    return results
+
+
+def iter_run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    scheduler: str | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """GIL=0 환경에서 완료된 순서대로 (index, result)를 yield한다."""
+    _require_gil_disabled()
+    if _scheduler(scheduler) == "fifo":
+        yield from thread_runner.iter_run(
+            image_paths,
+            operation,
+            params,
+            workers,
+            output_paths,
+            executor,
+            max_inflight,
+            use_cache,
+            timings,
+        )
+        return
+    yield from _iter_stealing(
+        image_paths,
+        operation,
+        params,
+        workers,
+        output_paths,
+        executor,
+        max_inflight or default_inflight(workers),
+        use_cache,
+        timings,
+    )
@@ -0,0 +1,131 @@
+"""이미지 디코드/인코드 공통 함수.
+
+모든 러너가 같은 방식으로 파일을 열고 저장하도록 한곳에 모은다.
+워커(스레드/프로세스)에서 호출되므로 전역 상태는 decode_cache(use_cache=True일 때)에만 둔다.
+"""
+
+import contextlib
+import os
+import threading
+import time
+
+from PIL import Image
+
+from core.config import settings
+from processor.decode_cache import cache as decode_cache
+from processor.stages import StageTimes
+
+JPEG_QUALITY = 85
+
+
+def open_image(path: str, size_hint: tuple[int, int] | None = None) -> Image.Image:
+    """이미지 파일을 열어 픽셀까지 디코드한다 (모드 변환 없음).
+
+    size_hint가 있으면 JPEG는 draft 모드로 1/2, 1/4, 1/8 스케일 디코드를 요청해
+    size_hint 이상인 가장 작은 해상도만 디코드한다 (IDCT 연산 대부분 생략).
+    JPEG가 아니면 draft가 아무 일도 하지 않으므로 전체 해상도로 디코드된다.
+    """
+    image = Image.open(path)
+    if size_hint and image.format == "JPEG":
+        image.draft("RGB", size_hint)
+    image.load()
+    return image
+
+
+def decode_rgb(path: str, size_hint: tuple[int, int] | None = None) -> Image.Image:
+    """이미지 파일을 열어 RGB로 디코드한다 (open_image + RGB 변환)."""
+    return open_image(path, size_hint).convert("RGB")
+
+
+def load_rgb(
+    path: str, size_hint: tuple[int, int] | None = None, use_cache: bool = False
+) -> Image.Image:
+    """decode_rgb와 같지만 use_cache=True면 디코드 캐시를 거친다 (반환 이미지 수정 금지).
+
+    settings.DECODE_CACHE_ENABLED가 꺼져 있으면 use_cache와 무관하게 항상 디코드한다.
+    """
+    if _cache_enabled(use_cache):
+        return decode_cache.get(path, size_hint, decode_rgb)
+    return decode_rgb(path, size_hint)
+
+
+def _cache_enabled(use_cache: bool) -> bool:
+    return use_cache and settings.DECODE_CACHE_ENABLED
+
+
+def megapixels(path: str) -> float:
+    """헤더만 읽어 이미지 크기(메가픽셀)를 반환한다 (픽셀 디코드 없음)."""
+    with Image.open(path) as image:
+        width, height = image.size
+    return width * height / 1_000_000
+
+
+def save_jpeg(image: Image.Image, path: str) -> str:
+    """처리 결과를 JPEG로 인코딩해 저장하고 경로를 반환한다.
+
+    임시 파일에 쓴 뒤 os.replace로 교체하므로, 같은 경로(결과 캐시 키)를 여러 워커가
+    동시에 쓰거나 다른 요청이 읽고 있어도 반쯤 쓴 파일이 보이지 않는다.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        image.save(tmp_path, "JPEG", quality=JPEG_QUALITY)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def process_file(
+    path: str,
+    transform,
+    output_path: str | None = None,
+    size_hint: tuple[int, int] | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Image.Image | str:
+    """단일 이미지: 디코드 → 처리(transform) → (선택) 인코드.
+
+    transform은 pipeline.compile_transform()이 만든 Image → Image 함수,
+    size_hint는 pipeline.size_hint()가 계산한 디코드 목표 크기.
+    output_path가 주어지면 워커 안에서 인코딩까지 끝내고 경로만 반환한다.
+    (배치 작업에서 인코딩도 병렬로 실행되도록)
+    use_cache=True면 디코드 결과를 프로세스 전역 LRU 캐시에서 재사용한다.
+    timings를 주면 단계별 시간을 재서 더한다 (processor.stages 참고).
+    """
+    if timings is not None:
+        return _timed_process(path, transform, output_path, size_hint, use_cache, timings)
+    result = transform(load_rgb(path, size_hint, use_cache))
+    if output_path is None:
+        return result
+    return save_jpeg(result, output_path)
+
+
+def _timed_process(
+    path: str,
+    transform,
+    output_path: str | None,
+    size_hint: tuple[int, int] | None,
+    use_cache: bool,
+    timings: StageTimes,
+) -> Image.Image | str:
+    start = time.perf_counter()
+    if _cache_enabled(use_cache):
+        image = decode_cache.get(path, size_hint, decode_rgb)
+        decoded = converted = time.perf_counter()
+        stages = {}
+    else:
+        raw = open_image(path, size_hint)
+        decoded = time.perf_counter()
+        image = raw.convert("RGB")
+        converted = time.perf_counter()
+        stages = {"convert": converted - decoded}
+    result = transform(image)
+    processed = time.perf_counter()
+    stages.update(decode=decoded - start, op=processed - converted)
+    if output_path is not None:
+        result = save_jpeg(result, output_path)
+        stages["encode"] = time.perf_counter() - processed
+    timings.add(**stages)
+    return result
@@ -0,0 +1,145 @@
+"""서브인터프리터 기반 병렬 처리 러너 (Python 3.14+).
+
+concurrent.futures.InterpreterPoolExecutor는 워커마다 독립된 인터프리터(와 GIL)를
+한 프로세스 안의 스레드에서 실행한다. threading과 multiprocessing의 중간 지점:
+  - thread_runner: 같은 인터프리터 → GIL=1이면 Python 구간이 직렬화
+  - interpreter_runner: 인터프리터별 GIL → GIL=1 빌드에서도 병렬, fork 없음
+  - mp_runner: 프로세스 격리 → fork/프로세스 생성 비용 + 파이프 IPC
+
+작업과 결과는 인터프리터 사이에서 pickle로 전달되므로 처리 함수는 모듈 최상위에 있어야 하고
+(mp_runner와 같은 제약), 결과 이미지도 pickle 복사된다. output_paths를 주면 워커가
+파일로 바로 인코딩하고 경로만 돌려보낸다.
+
+주의: 각 인터프리터가 PIL 등 C 확장을 따로 import하므로 Pillow 빌드가
+      서브인터프리터 로딩을 지원해야 한다 (미지원이면 워커에서 ImportError).
+"""
+
+import sys
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from functools import partial
+
+from PIL import Image
+
+from processor import memory
+from processor.image_io import process_file
+from processor.pipeline import compile_transform, size_hint
+from processor.stages import StageTimes
+from processor.streaming import bounded_completion, collect, default_inflight
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:  # Python < 3.14
+    InterpreterPoolExecutor = None
+
+
+def is_available() -> bool:
+    return InterpreterPoolExecutor is not None
+
+
+def _require_interpreters() -> None:
+    if not is_available():
+        raise RuntimeError(
+            "interpreter_runner는 concurrent.futures.InterpreterPoolExecutor가 있는 "
+            "Python 3.14 이상에서만 사용할 수 있습니다."
+        )
+
+
+def create_executor(workers: int) -> Executor:
+    """InterpreterPoolExecutor를 만든다.
+
+    새 인터프리터는 부모의 sys.path 변경(src/ 추가 등)을 물려받지 않으므로
+    initializer로 같은 sys.path를 설정해 processor 모듈을 import할 수 있게 한다.
+    (initializer 자체는 import가 필요 없는 builtins.exec를 사용)
+    """
+    _require_interpreters()
+    script = f"import sys; sys.path[:] = {sys.path!r}"
+    return InterpreterPoolExecutor(max_workers=workers, initializer=exec, initargs=(script,))
+
+
+def _process_one(
+    operation: str, params: dict, use_cache: bool, profile: bool, task: tuple[str, str | None]
+):
+    """단일 이미지 처리 — 모듈 최상위 함수 (인터프리터 간 pickle 호환).
+
+    use_cache=True면 인터프리터마다 따로 있는 decode_cache를 쓴다.
+    profile=True면 (결과, 단계 시간 snapshot)을 반환한다 (StageTimes는 Lock이 있어 pickle 불가).
+    """
+    path, output_path = task
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    timings = StageTimes() if profile else None
+    result = process_file(path, transform, output_path, hint, use_cache, timings)
+    return (result, timings.snapshot()) if profile else result
+
+
+def _unwrap(
+    items: Iterator[tuple[int, object]], timings: StageTimes | None
+) -> Iterator[tuple[int, Image.Image | str]]:
+    if timings is None:
+        yield from items
+        return
+    for idx, (result, snapshot) in items:
+        timings.merge(snapshot)
+        yield idx, result
+
+
+def run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> list[Image.Image] | list[str]:
+    """InterpreterPoolExecutor로 이미지를 병렬 처리한다.
+
+    executor를 주면 호출마다 인터프리터를 만들지 않고 해당 풀(PoolManager의 영구 풀)을 사용한다.
+    """
+    _require_interpreters()
+    compile_transform(operation, params)  # 잘못된 작업은 워커로 보내기 전에 ValueError
+    fn = partial(_process_one, operation, params or {}, use_cache, timings is not None)
+    outputs = output_paths or [None] * len(image_paths)
+    tasks = list(zip(image_paths, outputs))
+    weights = memory.task_weights(image_paths)
+    count = len(tasks)
+
+    if executor is not None:
+        items = bounded_completion(executor, fn, tasks, count, weights)
+        return collect(_unwrap(items, timings), count)
+
+    with create_executor(workers) as pool:
+        items = bounded_completion(pool, fn, tasks, count, weights)
+        results = collect(_unwrap(items, timings), count)
+
+    return results
+
+
+def iter_run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """완료된 순서대로 (index, result)를 yield한다. (동시 제출 수 max_inflight로 제한)"""
+    _require_interpreters()
+    compile_transform(operation, params)
+    fn = partial(_process_one, operation, params or {}, use_cache, timings is not None)
+    outputs = output_paths or [None] * len(image_paths)
+    tasks = zip(image_paths, outputs)
+    limit = max_inflight or default_inflight(workers)
+    weights = memory.task_weights(image_paths)
+
+    if executor is not None:
+        yield from _unwrap(bounded_completion(executor, fn, tasks, limit, weights), timings)
+        return
+
+    with create_executor(workers) as pool:
+        yield from _unwrap(bounded_completion(pool, fn, tasks, limit, weights), timings)
@@ -0,0 +1,187 @@
+"""`async` 동시성 방식: 서버 이벤트 루프 위에서 실행하는 러너.
+
+다른 러너와 같은 run()/iter_run() 동기 인터페이스를 제공하지만, 실제 스케줄링은
+async_runner.iter_with_executor가 서버(uvicorn) 이벤트 루프에서 한다.
+CPU 작업은 run_in_executor로 스레드풀에 위임되고 루프는 완료 알림만 받는다.
+
+  - 호출 스레드가 서버의 worker 스레드(sync 엔드포인트, BackgroundTasks)면
+    anyio.from_thread로 서버 루프를 찾아 그 루프에 코루틴을 올린다.
+  - 서버 밖(스크립트, 단위 테스트)에서는 전용 스레드에 임시 루프를 띄운다.
+
+동시 위임 수는 두 단계로 제한한다.
+  - 요청 단위: max_inflight (기본 workers×2)
+  - 루프 단위: settings.ASYNC_MAX_INFLIGHT 크기의 asyncio.Semaphore (루프마다 하나)
+    여러 요청이 동시에 들어와도 루프 전체의 스레드풀 위임 수가 이 값을 넘지 않는다.
+
+measure_loop_lag()는 같은 방식으로 서버 루프에 LoopLagProbe를 올려
+작업이 도는 동안의 루프 지연을 잰다 (벤치마크가 method와 무관하게 사용).
+"""
+
+import asyncio
+import queue
+import threading
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from contextlib import aclosing, contextmanager
+
+import anyio.from_thread
+from PIL import Image
+
+from core.config import settings
+from processor import async_runner, memory
+from processor.stages import StageTimes
+from processor.streaming import collect
+
+_DONE = object()
+
+# 루프별 전역 semaphore (Semaphore는 처음 사용한 루프에 묶이므로 루프마다 따로 만든다)
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_semaphores_lock = threading.Lock()
+
+
+class _Failed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _loop_semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    with _semaphores_lock:
+        semaphore = _semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.ASYNC_MAX_INFLIGHT)
+            _semaphores[loop] = semaphore
+        return semaphore
+
+
+def _server_loop() -> asyncio.AbstractEventLoop | None:
+    """호출 스레드가 anyio worker 스레드면 그 스레드를 띄운 이벤트 루프를 반환한다."""
+    try:
+        return anyio.from_thread.run_sync(asyncio.get_running_loop)
+    except RuntimeError:
+        return None
+
+
+@contextmanager
+def _event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """서버 루프가 있으면 그 루프를, 없으면 전용 스레드에서 도는 임시 루프를 제공한다."""
+    loop = _server_loop()
+    if loop is not None:
+        yield loop
+        return
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="loop-runner", daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def iter_run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """이벤트 루프에서 처리하고 완료된 순서대로 (index, result)를 호출 스레드로 넘겨준다.
+
+    루프는 결과를 queue에 넣기만 하므로 호출 스레드(DB 기록 등)가 루프를 막지 않는다.
+    소비자가 중간에 멈추면 stop 신호를 보내고, 루프 쪽 generator가 정리를 마칠 때까지 기다린다.
+    """
+    results: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    weights = memory.task_weights(image_paths)  # 헤더 읽기는 루프 밖(호출 스레드)에서
+
+    async def pump() -> None:
+        try:
+            semaphore = _loop_semaphore(asyncio.get_running_loop())
+            stream = async_runner.iter_with_executor(
+                image_paths,
+                operation,
+                params,
+                workers=workers,
+                output_paths=output_paths,
+                executor=executor,
+                max_inflight=max_inflight,
+                semaphore=semaphore,
+                weights=weights,
+                use_cache=use_cache,
+                timings=timings,
+            )
+            # break로 빠져나와도 _DONE을 넣기 전에 generator의 finally(취소, permit/예산 반납)를
+            # 여기서 끝낸다. aclosing 없이는 asyncgen finalizer가 나중에 정리한다
+            async with aclosing(stream):
+                async for item in stream:
+                    if stop.is_set():
+                        break
+                    results.put(item)
+        except Exception as e:
+            results.put(_Failed(e))
+        finally:
+            results.put(_DONE)
+
+    with _event_loop() as loop:
+        asyncio.run_coroutine_threadsafe(pump(), loop)
+        item = None
+        try:
+            while (item := results.get()) is not _DONE:
+                if isinstance(item, _Failed):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+            # 루프 쪽 generator가 남은 작업을 정리하고 _DONE을 넣을 때까지 기다린다
+            while item is not _DONE:
+                item = results.get()
+
+
+def run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> list[Image.Image] | list[str]:
+    """iter_run 결과를 입력 순서로 모아 반환한다."""
+    items = iter_run(
+        image_paths,
+        operation,
+        params,
+        workers,
+        output_paths,
+        executor,
+        use_cache=use_cache,
+        timings=timings,
+    )
+    return collect(items, len(image_paths))
+
+
+@contextmanager
+def measure_loop_lag(interval: float = 0.005) -> Iterator[async_runner.LoopLagProbe]:
+    """with 블록 동안 서버 이벤트 루프의 지연을 잰다.
+
+    서버 worker 스레드가 아니면(스크립트, 단위 테스트) 측정하지 않고 빈 probe를 돌려준다.
+    """
+    probe = async_runner.LoopLagProbe(interval)
+    loop = _server_loop()
+    if loop is None:
+        yield probe
+        return
+
+    asyncio.run_coroutine_threadsafe(probe.start(), loop).result()
+    try:
+        yield probe
+    finally:
+        asyncio.run_coroutine_threadsafe(probe.stop(), loop).result()
@@ -0,0 +1,155 @@
+"""메모리 상한(backpressure)과 peak RSS 측정.
+
+MemoryBudget은 프로세스 전역 메가픽셀 예산이다 (settings.MAX_INFLIGHT_MEGAPIXELS, 0이면 무제한).
+러너는 작업을 제출하기 전에 입력 이미지의 메가픽셀(헤더만 읽음)만큼 예산을 얻고,
+작업이 끝나면 돌려준다. 예산이 모자라면 제출이 막히므로 동시에 요청된 여러 job/벤치마크를
+합쳐도 디코드된 이미지가 대략 예산 이하로 유지된다 (RGB 1MP ≈ 3MB, 처리 중 사본 포함 수 배).
+
+  - 예산보다 큰 이미지 하나는 예산 전체를 잡고 혼자 실행된다 (영원히 막히지 않도록).
+  - 완료됐지만 소비자가 아직 가져가지 않은 결과 이미지는 세지 않는다.
+    job 처리처럼 output_paths를 쓰면 결과가 경로라 해당 없다.
+  - 예산을 얻는 쪽은 항상 제출하는 쪽(또는 work stealing 워커)이고 반납은 작업 완료
+    콜백에서 하므로, 자기 작업이 끝나기를 기다리며 예산을 쥐고 막히는 일은 없다.
+
+RssMonitor는 with 블록 동안 이 프로세스와 자식 프로세스(multiprocessing 워커 등)의
+RSS 합을 주기적으로 샘플링해 최대값을 기록한다. 컨테이너 메모리 한도를 정하는 데 쓴다.
+"""
+
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+import psutil
+
+from core.config import settings
+from processor.image_io import megapixels
+
+
+class MemoryBudget:
+    def __init__(self, limit: float | None = None) -> None:
+        """limit이 None이면 settings.MAX_INFLIGHT_MEGAPIXELS를 따른다 (실행 중 변경 반영)."""
+        self._limit = limit
+        self._cond = threading.Condition()
+        self.in_use = 0.0
+        self.peak = 0.0
+        self.waits = 0
+
+    @property
+    def limit(self) -> float:
+        return self._limit if self._limit is not None else settings.MAX_INFLIGHT_MEGAPIXELS
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0
+
+    def _take_locked(self, need: float) -> None:
+        self.in_use += need
+        self.peak = max(self.peak, self.in_use)
+
+    def try_acquire(self, megapixels: float) -> float | None:
+        """막히지 않고 얻을 수 있으면 얻은 양을, 아니면 None을 반환한다."""
+        if not self.enabled:
+            return 0.0
+        need = min(megapixels, self.limit)
+        with self._cond:
+            if self.in_use + need > self.limit:
+                return None
+            self._take_locked(need)
+        return need
+
+    def acquire(self, megapixels: float) -> float:
+        """예산이 생길 때까지 기다렸다가 얻은 양을 반환한다. release()에 그대로 넘긴다."""
+        if not self.enabled:
+            return 0.0
+        need = min(megapixels, self.limit)
+        with self._cond:
+            if self.in_use + need > self.limit:
+                self.waits += 1
+                self._cond.wait_for(lambda: self.in_use + need <= self.limit)
+            self._take_locked(need)
+        return need
+
+    def release(self, granted: float) -> None:
+        if granted <= 0:
+            return
+        with self._cond:
+            self.in_use = max(0.0, self.in_use - granted)
+            self._cond.notify_all()
+
+    @contextmanager
+    def reserve(self, megapixels: float) -> Iterator[float]:
+        granted = self.acquire(megapixels)
+        try:
+            yield granted
+        finally:
+            self.release(granted)
+
+    def stats(self) -> dict[str, float]:
+        with self._cond:
+            return {
+                "limit": self.limit,
+                "in_use": self.in_use,
+                "peak": self.peak,
+                "waits": self.waits,
+            }
+
+
+def _weight(path: str) -> float:
+    try:
+        return megapixels(path)
+    except OSError:
+        return 0.0  # 열 수 없는 파일은 디코드 단계에서 실패한다
+
+
+def task_weights(image_paths: Sequence[str]) -> list[float] | None:
+    """이미지별 예산 무게(메가픽셀). 예산이 꺼져 있으면 헤더를 읽지 않고 None."""
+    if not budget.enabled:
+        return None
+    return [_weight(p) for p in image_paths]
+
+
+def _tree_rss(process: psutil.Process) -> int:
+    total = 0
+    for proc in [process, *process.children(recursive=True)]:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            continue  # 샘플링 사이에 종료된 워커
+    return total
+
+
+class RssMonitor:
+    """with 블록 동안 (이 프로세스 + 자식 프로세스) RSS 합의 최대값을 잰다."""
+
+    def __init__(self, interval: float = 0.02) -> None:
+        self.interval = interval
+        self.peak_bytes = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, _tree_rss(self._process))
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "RssMonitor":
+        self._sample()
+        self._thread = threading.Thread(target=self._loop, name="rss-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+    @property
+    def peak_mb(self) -> float:
+        return round(self.peak_bytes / 1024 / 1024, 1)
+
+
+budget = MemoryBudget()
@@ -5,32 +5,353 @@
 
 주의: ProcessPoolExecutor는 함수를 pickle로 직렬화하므로
       처리 함수가 모듈 최상위에 정의되어야 한다.
+      영구 풀(PoolManager)은 initializer로 작업 설정을 고정할 수 없으므로
+      operation/params를 작업마다 함께 보낸다. initializer는 폰트 캐시 워밍업
+      (resources.warm)에만 사용한다.
+
+결과 전송 방식(transport):
+  - "pickle": PIL.Image 전체를 pickle해 파이프로 보낸다 (기본)
+  - "shm":    워커가 픽셀을 multiprocessing.shared_memory 블록에 쓰고
+              (이름, mode, size)만 담은 작은 SharedImage를 돌려보낸다.
+              부모는 블록에서 Image를 만든 뒤 블록을 해제한다.
+  output_paths를 주면 워커가 파일로 바로 인코딩하므로 transport와 무관하게 경로만 전송된다.
+
+청크 제출과 워커 수 자동 결정 (plan):
+  작업을 chunksize장씩 묶어 한 번에 제출하므로 IPC 왕복은 ceil(n / chunksize)회다.
+  - chunksize: 청크 하나가 TARGET_CHUNK_SECONDS 이상 걸리도록 정하되, 부하 분산을 위해
+               워커당 CHUNKS_PER_WORKER개 이상의 청크가 나오도록 제한한다.
+  - workers:   MP_AUTO_WORKERS일 때만 min(요청값, os.cpu_count(), 작업 수) 안에서 전체 작업량에
+               비해 fork 비용이 크지 않은 수까지만 띄운다 (영구 풀을 쓰면 풀 크기 그대로).
+  이미지당 처리 시간은 워커가 청크마다 잰 실측값의 이동 평균(operation+params별)을 쓰고,
+  실측이 없으면 비용 모델(cost_model.work)의 사전값을 쓴다.
+  워커 수 자동 결정은 settings.MP_AUTO_WORKERS를 켰을 때만 한다 (기본은 요청한 workers 그대로).
+  벤치마크처럼 요청한 워커 수로 재야 하는 호출은 auto_workers=False로 설정과 무관하게 끈다.
+  chunksize 자동 결정은 settings.MP_CHUNKSIZE 또는 chunksize 인자로 끌 수 있다.
+
+워커 시작 방식 (settings.MP_START_METHOD 또는 start_method 인자):
+  - fork:       부모 힙을 통째로 복사한다. 가장 빠르지만 스레드가 도는 프로세스에서 fork하면
+                다른 스레드가 잡고 있던 lock이 자식에서 영원히 잠길 수 있다 (3.14부터 경고).
+  - forkserver: 스레드가 없는 서버 프로세스가 settings.MP_PRELOAD 모듈을 한 번 import한 뒤
+                워커를 fork한다. 앱 힙은 복사하지 않고 워커는 Pillow/operation/폰트가 준비된
+                상태로 시작한다.
+  - spawn:      새 인터프리터를 띄워 매번 import부터 다시 한다 (가장 느림).
+  - auto:       GIL=1이면 fork, GIL=0(free-threaded)이면 forkserver.
 """
 
+import json
+import math
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple
 
 from PIL import Image
 
-from processor import operations
+from core.config import settings
+from processor import cost_model, memory, resources
+from processor.image_io import megapixels, process_file
+from processor.pipeline import compile_transform, size_hint
+from processor.stages import Snapshot, StageTimes
+from processor.streaming import bounded_completion, default_inflight
+
+# 청크 하나의 목표 처리 시간 (초). IPC 왕복(수백 µs~수 ms)이 이 값에 비해 작아지도록 한다.
+TARGET_CHUNK_SECONDS = 0.02
+# 마지막 청크 하나에 워커 하나만 남는 꼬리를 줄이기 위한 워커당 최소 청크 수
+CHUNKS_PER_WORKER = 4
+# 이미지당 처리 시간 이동 평균의 가중치 (새 실측 비율)
+COST_SMOOTHING = 0.3
+# 사전값 추정에 헤더를 읽을 이미지 수
+_SAMPLE_IMAGES = 8
+
+_task_costs: dict[str, float] = {}
+_task_costs_lock = threading.Lock()
+
+
+class Plan(NamedTuple):
+    workers: int
+    chunksize: int
+    task_seconds: float  # 예상 이미지당 처리 시간 (초)
+    source: str  # "measured" / "prior" / "override"
+
+    def round_trips(self, task_count: int) -> int:
+        return math.ceil(task_count / self.chunksize) if task_count else 0
+
+
+class SharedImage(NamedTuple):
+    """shared_memory에 놓인 결과 이미지 디스크립터 (IPC로는 이것만 전송)."""
+
+    name: str
+    mode: str
+    size: tuple[int, int]
+    nbytes: int
+
+
+def _to_shared(image: Image.Image) -> SharedImage:
+    """워커 측: 픽셀을 공유 메모리 블록에 쓰고 디스크립터를 반환한다."""
+    data = image.tobytes()
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[: len(data)] = data
+    shm.close()
+    return SharedImage(shm.name, image.mode, image.size, len(data))
+
+
+def _from_shared(desc: SharedImage) -> Image.Image:
+    """부모 측: 공유 메모리 블록에서 Image를 만들고 블록을 해제한다."""
+    shm = shared_memory.SharedMemory(name=desc.name)
+    try:
+        return Image.frombytes(desc.mode, desc.size, shm.buf[: desc.nbytes])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _discard(result) -> None:
+    """소비하지 않을 결과의 공유 메모리 블록을 해제한다 (SharedImage가 아니면 무시)."""
+    if not isinstance(result, SharedImage):
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=result.name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _materialize(result):
+    return _from_shared(result) if isinstance(result, SharedImage) else result
+
+
+def _materialize_chunk(results: list) -> list:
+    """청크 결과를 모두 복원한다. 중간에 실패하면 남은 블록을 해제하고 예외를 전달한다."""
+    materialized = []
+    for i, result in enumerate(results):
+        try:
+            materialized.append(_materialize(result))
+        except BaseException:
+            for rest in results[i + 1 :]:
+                _discard(rest)
+            raise
+    return materialized
+
+
+def _discard_chunk(chunk_result: tuple) -> None:
+    for result in chunk_result[0]:
+        _discard(result)
+
+
+def _process_one(
+    operation: str,
+    params: dict,
+    transport: str,
+    task: tuple[str, str | None],
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Image.Image | SharedImage | str:
+    """단일 이미지 처리 — 모듈 최상위 함수 (pickle 호환).
+
+    task = (입력 경로, 출력 경로 또는 None). 출력 경로가 있으면
+    워커 프로세스에서 저장까지 끝내고 경로만 돌려보내므로 IPC로 이미지를 보내지 않는다.
+    """
+    path, output_path = task
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    result = process_file(path, transform, output_path, hint, use_cache, timings)
+    if transport == "shm" and isinstance(result, Image.Image):
+        return _to_shared(result)
+    return result
+
+
+def _process_chunk(
+    operation: str,
+    params: dict,
+    transport: str,
+    use_cache: bool,
+    profile: bool,
+    chunk: list[tuple[str, str | None]],
+) -> tuple[list, float, Snapshot | None, float]:
+    """청크 단위 처리 — 모듈 최상위 함수.
+
+    (결과 목록, 워커에서 잰 처리 시간, 단계 시간 snapshot 또는 None, 완료 시각)을 반환한다.
+    완료 시각은 프로세스 간 비교를 위해 time.time()이며 부모가 ipc 시간을 계산하는 데 쓴다.
+    use_cache=True면 워커 프로세스마다 따로 있는 decode_cache를 쓴다.
+    """
+    start = time.perf_counter()
+    timings = StageTimes() if profile else None
+    results = []
+    try:
+        for task in chunk:
+            results.append(_process_one(operation, params, transport, task, use_cache, timings))
+    except BaseException:
+        # 청크가 실패하면 부모가 결과를 받지 못하므로 앞서 만든 블록을 여기서 해제한다
+        for result in results:
+            _discard(result)
+        raise
+    seconds = time.perf_counter() - start
+    return results, seconds, timings.snapshot() if profile else None, time.time()
+
+
+def _cost_key(operation: str, params: dict | None) -> str:
+    return f"{operation}:{json.dumps(params or {}, sort_keys=True, default=str)}"
 
-# ProcessPoolExecutor가 pickle할 수 있도록 모듈 최상위에 정의
-_operation: str = ""
-_params: dict = {}
 
+def _record_cost(key: str, seconds: float, count: int) -> None:
+    if count <= 0:
+        return
+    per_task = seconds / count
+    with _task_costs_lock:
+        previous = _task_costs.get(key)
+        _task_costs[key] = (
+            per_task if previous is None
+            else previous + COST_SMOOTHING * (per_task - previous)
+        )
 
-def _process_one(path: str) -> Image.Image:
-    """단일 이미지 처리 — 모듈 최상위 함수 (pickle 호환)."""
-    op_func = operations.get_operation(_operation)
-    img = Image.open(path).convert("RGB")
-    return op_func(img, **_params)
 
+def estimate_task_seconds(
+    image_paths: list[str], operation: str, params: dict | None
+) -> tuple[float, str]:
+    """이미지당 처리 시간 (초, "measured"/"prior"). 실측 이동 평균이 없으면 비용 모델 사전값."""
+    with _task_costs_lock:
+        measured = _task_costs.get(_cost_key(operation, params))
+    if measured is not None:
+        return measured, "measured"
 
-def _init_worker(operation: str, params: dict) -> None:
-    """워커 프로세스 초기화 — 전역 변수로 설정을 전달한다."""
-    global _operation, _params
-    _operation = operation
-    _params = params
+    sizes = []
+    for path in image_paths[:_SAMPLE_IMAGES]:
+        try:
+            sizes.append(megapixels(path))
+        except OSError:
+            continue
+    mp = sum(sizes) / len(sizes) if sizes else 1.0
+    total, _ = cost_model.work(operation, params, mp)
+    return cost_model.SECONDS_PER_UNIT * total, "prior"
+
+
+def plan(
+    task_count: int,
+    task_seconds: float,
+    workers: int,
+    chunksize: int | None = None,
+    fixed_workers: bool = False,
+    source: str = "prior",
+) -> Plan:
+    """(workers, chunksize)를 정한다.
+
+    workers는 상한이다. fixed_workers=True(이미 떠 있는 풀 사용)면 워커 수는 바꾸지 않는다.
+    chunksize(또는 settings.MP_CHUNKSIZE)가 1 이상이면 자동 계산 대신 그 값을 쓴다.
+    """
+    workers = max(1, workers)
+    if not fixed_workers and settings.MP_AUTO_WORKERS:
+        cap = max(1, min(workers, os.cpu_count() or 1, task_count))
+        # 전체 작업량 W를 w개로 나누는 이득(W/w)과 워커당 fork 비용(c·w)의 합이 최소인 w ≈ √(W/c)
+        spawn = cost_model.PRIOR_COLD["multiprocessing"][1]
+        best = round(math.sqrt(task_seconds * task_count / spawn)) if spawn > 0 else cap
+        workers = max(1, min(cap, best))
+
+    override = chunksize or settings.MP_CHUNKSIZE
+    if override > 0:
+        return Plan(workers, override, task_seconds, "override")
+
+    parallel = max(1, min(workers, os.cpu_count() or 1))
+    by_cost = math.ceil(TARGET_CHUNK_SECONDS / task_seconds) if task_seconds > 0 else task_count
+    by_balance = math.ceil(task_count / (parallel * CHUNKS_PER_WORKER)) if task_count else 1
+    return Plan(workers, max(1, min(by_cost, by_balance)), task_seconds, source)
+
+
+def _prepare(
+    operation: str, params: dict | None, transport: str | None, use_cache: bool, profile: bool
+):
+    transport = transport or settings.MP_TRANSPORT
+    if transport not in ("pickle", "shm"):
+        raise ValueError(f"Unknown transport: {transport}. 가능한 값: pickle, shm")
+    if transport == "shm":
+        # 워커 생성 전에 부모가 resource tracker를 띄워야 워커가 만든 블록을 같은 tracker가 관리한다
+        resource_tracker.ensure_running()
+    return partial(_process_chunk, operation, params or {}, transport, use_cache, profile)
+
+
+def _schedule(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None,
+    workers: int,
+    output_paths: list[str] | None,
+    fixed_workers: bool,
+    chunksize: int | None,
+) -> tuple[Plan, list[list[tuple[str, str | None]]]]:
+    task_seconds, source = estimate_task_seconds(image_paths, operation, params)
+    schedule = plan(len(image_paths), task_seconds, workers, chunksize, fixed_workers, source)
+    outputs = output_paths or [None] * len(image_paths)
+    tasks = list(zip(image_paths, outputs))
+    size = schedule.chunksize
+    return schedule, [tasks[i : i + size] for i in range(0, len(tasks), size)]
+
+
+def _iter_chunks(
+    pool: Executor,
+    fn,
+    chunks: list,
+    chunksize: int,
+    max_chunks: int,
+    cost_key: str,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    weights = memory.task_weights([path for chunk in chunks for path, _ in chunk])
+    if weights is not None:
+        # 청크 하나를 제출할 때 청크 안 이미지 메가픽셀 합만큼 예산을 얻는다
+        weights = [sum(weights[i : i + chunksize]) for i in range(0, len(weights), chunksize)]
+    # ipc = 워커 완료 → 부모 도착(done callback 시각) + 복원 시간.
+    # 꺼낸 시각을 쓰면 소비자가 앞선 결과를 처리하며 기다린 시간까지 들어간다
+    arrivals: dict[int, float] = {}
+    # 소비자가 중간에 멈추면 실행 중인 청크를 기다려 그 결과의 shm 블록도 해제한다
+    for chunk_idx, (results, seconds, snapshot, finished_at) in bounded_completion(
+        pool, fn, chunks, max_chunks, weights, discard=_discard_chunk, arrivals=arrivals
+    ):
+        _record_cost(cost_key, seconds, len(results))
+        # 청크 결과를 먼저 모두 복원해 소비자가 중간에 멈춰도 shm 블록이 남지 않게 한다
+        start = time.perf_counter()
+        materialized = _materialize_chunk(results)
+        restore = time.perf_counter() - start
+        arrived = arrivals.pop(chunk_idx, finished_at)
+        if timings is not None:
+            timings.merge(snapshot)
+            timings.add(count=len(results), ipc=max(0.0, arrived - finished_at) + restore)
+        base = chunk_idx * chunksize
+        for offset, result in enumerate(materialized):
+            yield base + offset, result
+
+
+def resolve_start_method(start_method: str | None = None) -> str:
+    """auto/None을 실제 시작 방식 이름으로 바꾼다. 지원하지 않는 값이면 ValueError."""
+    method = start_method or settings.MP_START_METHOD
+    if method == "auto":
+        method = "fork" if settings.gil_enabled else "forkserver"
+    available = multiprocessing.get_all_start_methods()
+    if method not in available:
+        raise ValueError(f"Unknown start method: {method}. 가능한 값: auto, {', '.join(available)}")
+    return method
+
+
+def get_context(start_method: str | None = None) -> multiprocessing.context.BaseContext:
+    """시작 방식에 맞는 multiprocessing context. forkserver면 preload 모듈을 등록한다.
+
+    preload는 forkserver 프로세스가 처음 뜰 때만 적용되므로 첫 풀 생성 전에 정해져 있어야 한다.
+    """
+    context = multiprocessing.get_context(resolve_start_method(start_method))
+    if context.get_start_method() == "forkserver":
+        context.set_forkserver_preload(list(settings.MP_PRELOAD))
+    return context
+
+
+def create_executor(workers: int, start_method: str | None = None) -> ProcessPoolExecutor:
+    """워커 프로세스 풀을 만든다. initializer로 폰트 캐시를 채운다 (preload됐으면 캐시 hit)."""
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context(start_method), initializer=resources.warm
+    )
 
 
 def run(
@@ -38,17 +359,84 @@ def run(
     operation: str,
     params: dict | None = None,
     workers: int = 4,
-) -> list[Image.Image]:
-    """ProcessPoolExecutor로 이미지를 병렬 처리한다."""
-    params = params or {}
-
-    mp_context = multiprocessing.get_context("fork")
-    with ProcessPoolExecutor(
-        max_workers=workers,
-        mp_context=mp_context,
-        initializer=_init_worker,
-        initargs=(operation, params),
-    ) as pool:
-        results = list(pool.map(_process_one, image_paths))
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    transport: str | None = None,
+    chunksize: int | None = None,
+    start_method: str | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+    auto_workers: bool | None = None,
+) -> list[Image.Image] | list[str]:
+    """ProcessPoolExecutor로 이미지를 병렬 처리한다.
+
+    executor를 주면 매 호출 fork 없이 해당 풀(PoolManager의 영구 풀)을 사용한다.
+    transport가 None이면 settings.MP_TRANSPORT를 따른다.
+    workers는 상한이고 실제 워커 수와 chunksize는 plan()이 정한다 (chunksize 인자로 고정 가능).
+    start_method는 자체 풀을 만들 때의 시작 방식 (None이면 settings.MP_START_METHOD).
+    auto_workers=False면 settings.MP_AUTO_WORKERS와 무관하게 workers개 그대로 띄운다.
+    """
+    fn = _prepare(operation, params, transport, use_cache, timings is not None)
+    if executor is None:
+        resolve_start_method(start_method)  # 잘못된 시작 방식은 작업 준비 전에 ValueError
+    fixed = executor is not None or auto_workers is False
+    schedule, chunks = _schedule(
+        image_paths, operation, params, workers, output_paths, fixed, chunksize
+    )
+    results: list = [None] * len(image_paths)
+    key = _cost_key(operation, params)
+
+    def _collect(pool: Executor) -> None:
+        for idx, result in _iter_chunks(
+            pool, fn, chunks, schedule.chunksize, len(chunks), key, timings
+        ):
+            results[idx] = result
+
+    if executor is not None:
+        _collect(executor)
+        return results
+
+    with create_executor(schedule.workers, start_method) as pool:
+        _collect(pool)
 
     return results
+
+
+def iter_run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    transport: str | None = None,
+    chunksize: int | None = None,
+    start_method: str | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+    auto_workers: bool | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """완료된 순서대로 (index, result)를 yield한다. (동시 제출 수 max_inflight로 제한)
+
+    max_inflight는 이미지 수 기준이며 청크 수로 환산해 제한한다.
+    """
+    fn = _prepare(operation, params, transport, use_cache, timings is not None)
+    if executor is None:
+        resolve_start_method(start_method)  # 잘못된 시작 방식은 작업 준비 전에 ValueError
+    fixed = executor is not None or auto_workers is False
+    schedule, chunks = _schedule(
+        image_paths, operation, params, workers, output_paths, fixed, chunksize
+    )
+    limit = max_inflight or default_inflight(schedule.workers)
+    max_chunks = max(1, limit // schedule.chunksize)
+    key = _cost_key(operation, params)
+
+    if executor is not None:
+        yield from _iter_chunks(
+            executor, fn, chunks, schedule.chunksize, max_chunks, key, timings
+        )
+        return
+
+    with create_executor(schedule.workers, start_method) as pool:
+        yield from _iter_chunks(pool, fn, chunks, schedule.chunksize, max_chunks, key, timings)
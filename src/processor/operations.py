@@ -1,55 +1,100 @@
 """
 순수 CPU-bound 이미지 처리 함수.
 모든 함수는 PIL.Image를 받아서 PIL.Image를 반환한다.
+
+각 함수는 @register로 파라미터 스키마와 메타데이터를 함께 등록한다 (processor/registry.py).
+라우터/서비스가 쓰는 OperationType(Literal)과 OPERATION_NAMES는 등록 결과에서 만든다.
+cost_per_mp는 2000×1500 노이즈 이미지에서 blur(radius=10)를 1.0으로 잰 상대값이다.
 """
 
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+import math
+from typing import Literal
+
+from PIL import Image, ImageFilter
+from pydantic import BaseModel, ConfigDict, Field
+
+from processor import registry, resources
+from processor.registry import register
+
+# --- 파라미터 스키마 ---
+
+
+class _Params(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+
+class ResizeParams(_Params):
+    width: int = Field(200, gt=0, le=20000)
+    height: int = Field(200, gt=0, le=20000)
+
+
+class BlurParams(_Params):
+    radius: int | float = Field(10, ge=0, le=100)
+
+
+class RotateParams(_Params):
+    degrees: int | float = 90
+
 
+class WatermarkParams(_Params):
+    text: str = Field(resources.DEFAULT_WATERMARK_TEXT, min_length=1, max_length=100)
 
+
+def _blur_halo(params: dict) -> int:
+    # Pillow GaussianBlur는 box blur 3회 → 반경 ≈ 3×radius
+    return math.ceil(params.get("radius", 5) * 3) + 1
+
+
+# --- operation ---
+
+
+@register(ResizeParams, cost_per_mp=0.3, mode_agnostic=True)
 def resize(image: Image.Image, width: int, height: int) -> Image.Image:
     return image.resize((width, height), Image.LANCZOS)
 
 
+@register(BlurParams, cost_per_mp=1.0, tile_halo=_blur_halo, mode_agnostic=True)
 def blur(image: Image.Image, radius: int = 5) -> Image.Image:
     return image.filter(ImageFilter.GaussianBlur(radius=radius))
 
 
+@register(cost_per_mp=0.5, tile_halo=lambda params: 1, mode_agnostic=True)
 def sharpen(image: Image.Image) -> Image.Image:
     return image.filter(ImageFilter.SHARPEN)
 
 
+@register(cost_per_mp=0.05, tile_halo=lambda params: 0, scale_invariant=True)
 def grayscale(image: Image.Image) -> Image.Image:
     return image.convert("L").convert("RGB")
 
 
+@register(RotateParams, cost_per_mp=0.1, mode_agnostic=True)
 def rotate(image: Image.Image, degrees: int = 90) -> Image.Image:
     return image.rotate(degrees, expand=True)
 
 
-def watermark(image: Image.Image, text: str = "nogil-bench") -> Image.Image:
-    overlay = image.copy()
-    draw = ImageDraw.Draw(overlay)
-
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 36)
-    except OSError:
-        font = ImageFont.load_default(size=36)
-
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_w = bbox[2] - bbox[0]
-    text_h = bbox[3] - bbox[1]
+# 텍스트 합성은 이미지 크기와 거의 무관하고 copy/paste 외에는 Python 쪽 작업이라 GIL을 잡고 있다
+@register(WatermarkParams, releases_gil=False, cost_per_mp=0.01)
+def watermark(image: Image.Image, text: str = resources.DEFAULT_WATERMARK_TEXT) -> Image.Image:
+    # 폰트 파싱과 텍스트 렌더링은 프로세스 전역 캐시에서 한 번만 한다
+    mask, (left, top) = resources.get_text_mask(text)
 
-    x = image.width - text_w - 20
-    y = image.height - text_h - 20
+    x = image.width - mask.width - 20
+    y = image.height - mask.height - 20
 
-    draw.text((x, y), text, fill=(255, 255, 255, 128), font=font)
+    overlay = image.copy()
+    # draw.text((x, y))와 같은 위치: 글리프는 원점에서 bbox 좌상단만큼 떨어져 그려진다
+    overlay.paste((255, 255, 255), (x + left, y + top), mask)
     return overlay
 
 
 def get_operation(name: str):
     """operation 이름으로 함수를 반환한다. 잘못된 이름이면 ValueError."""
-    from core.constants import OPERATION_NAMES
+    return registry.get(name).func
+
+
+# --- 등록된 operation 이름 (API 검증용) ---
+
+OperationType = Literal[tuple(registry.names())]
 
-    if name not in OPERATION_NAMES:
-        raise ValueError(f"Unknown operation: {name}. 가능한 값: {OPERATION_NAMES}")
-    return globals()[name]
+OPERATION_NAMES: set[str] = set(registry.names())
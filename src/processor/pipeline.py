@@ -0,0 +1,126 @@
+"""다단계 operation 파이프라인.
+
+resize → sharpen → watermark처럼 여러 작업을 한 번의 디코드/인코드 사이에서
+메모리 안에서 연속 적용한다. 러너와 서비스는 operation 이름 대신
+compile_transform()이 돌려주는 "Image → Image" 함수를 사용한다.
+
+파이프라인은 operation="pipeline", params={"steps": [{"operation": ..., "params": {...}}, ...]}
+형태로 전달되므로 러너 시그니처와 Job 저장 형식을 그대로 쓸 수 있다.
+
+fusion(인접 단계 합치기):
+  - grayscale 이후 단계는 "L"(1채널) 이미지로 계속 처리하고, RGB 변환은
+    RGB가 필요한 단계(watermark) 직전이나 마지막에 한 번만 한다.
+    blur/sharpen/resize/rotate는 채널별 독립 연산이라 결과가 같고 연산량은 1/3이다.
+  - 연속된 grayscale은 하나로 합친다.
+  - 연속된 90° 배수 rotate는 각도를 더해 한 번만 회전한다 (0°면 생략).
+"""
+
+from collections.abc import Callable
+
+from PIL import Image
+
+from core.config import settings
+from processor import registry
+
+PIPELINE = "pipeline"
+
+Step = tuple[str, dict]
+Transform = Callable[[Image.Image], Image.Image]
+
+
+def normalize_steps(steps: list[dict]) -> list[Step]:
+    """API/Job에서 받은 단계 목록을 (operation, params)로 정규화한다.
+
+    잘못된 operation/파라미터면 registry와 같은 ValueError.
+    """
+    if not steps:
+        raise ValueError("파이프라인 단계가 비어 있습니다")
+    normalized = []
+    for step in steps:
+        name = step["operation"]
+        spec = registry.get(name)
+        normalized.append((name, spec.bind(registry.get_default_params(name, step.get("params")))))
+    return normalized
+
+
+def fuse(steps: list[Step]) -> list[Step]:
+    """결과가 같은 범위에서 인접 단계를 합친다."""
+    fused: list[Step] = []
+    for name, params in steps:
+        prev = fused[-1] if fused else None
+        if prev and name == "grayscale" and prev[0] == "grayscale":
+            continue
+        if prev and name == "rotate" and prev[0] == "rotate":
+            a, b = prev[1].get("degrees", 90), params.get("degrees", 90)
+            if a % 90 == 0 and b % 90 == 0:
+                fused[-1] = ("rotate", {"degrees": (a + b) % 360})
+                continue
+        fused.append((name, params))
+    return [(n, p) for n, p in fused if not (n == "rotate" and p.get("degrees") == 0)]
+
+
+def build(steps: list[Step]) -> Transform:
+    """fuse된 단계 목록을 하나의 Image → Image 함수로 만든다."""
+    plan = [(registry.get(name), params) for name, params in fuse(steps)]
+
+    def transform(image: Image.Image) -> Image.Image:
+        for spec, params in plan:
+            if spec.name == "grayscale":
+                # RGB 복원은 미룬다 (fusion)
+                image = image.convert("L")
+                continue
+            # "L" 모드를 그대로 받을 수 없는 작업 직전에만 RGB로 되돌린다
+            if image.mode != "RGB" and not spec.mode_agnostic:
+                image = image.convert("RGB")
+            image = spec.func(image, **params)
+        return image if image.mode == "RGB" else image.convert("RGB")
+
+    return transform
+
+
+def compile_transform(operation: str, params: dict | None = None) -> Transform:
+    """operation(+params) 또는 파이프라인을 Image → Image 함수로 변환한다.
+
+    params는 레지스트리 스키마로 검증하고 빠진 값은 기본값으로 채운다.
+    """
+    params = params or {}
+    if operation == PIPELINE:
+        return build(normalize_steps(params.get("steps", [])))
+
+    spec = registry.get(operation)
+    op_func, bound = spec.func, spec.bind(params)
+    return lambda image: op_func(image, **bound)
+
+
+def size_hint(operation: str, params: dict | None = None) -> tuple[int, int] | None:
+    """디코드 단계에서 줄여도 되는 목표 크기를 반환한다 (없으면 None).
+
+    결과가 크기에 의존하지 않는 단계(scale_invariant, 예: grayscale)만 앞에 있고
+    그 다음이 resize일 때만 resize 목표 크기를 힌트로 준다. blur처럼 픽셀 단위 파라미터가
+    있는 단계가 먼저 오면 해상도를 줄였을 때 결과가 달라지므로 힌트를 주지 않는다.
+    settings.DECODE_DRAFT=False면 항상 None (디코드 비용 측정용).
+    """
+    if not settings.DECODE_DRAFT:
+        return None
+
+    params = params or {}
+    if operation == PIPELINE:
+        steps = normalize_steps(params.get("steps", []))
+    else:
+        steps = [(operation, registry.get_default_params(operation, params))]
+
+    for name, step_params in steps:
+        if registry.get(name).scale_invariant:
+            continue
+        if name == "resize":
+            width, height = step_params.get("width"), step_params.get("height")
+            return (width, height) if width and height else None
+        return None
+    return None
+
+
+def label(operation: str, params: dict | None = None) -> str:
+    """출력 파일명/기록용 이름. 파이프라인은 "resize+sharpen+watermark" 형태."""
+    if operation == PIPELINE:
+        return "+".join(step["operation"] for step in (params or {}).get("steps", []))
+    return operation
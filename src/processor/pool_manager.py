@@ -0,0 +1,188 @@
+"""앱 수명 동안 유지되는 워커 풀 관리자.
+
+러너가 호출마다 ThreadPoolExecutor/ProcessPoolExecutor를 만들고 닫으면
+multiprocessing은 요청마다 워커 프로세스를 fork하게 된다.
+PoolManager는 start() 때 method마다 settings 크기(pool_prewarm)의 풀을 하나씩 만들고,
+lifespan 종료 시 한꺼번에 정리한다. 요청이 보낸 workers로 풀을 새로 만들지 않는다.
+  - 요청의 workers는 공유 풀에 동시에 넣는 작업 수로 지킨다 (_Slots).
+    풀 크기보다 큰 workers는 풀 크기로 줄어든다.
+  - 풀은 모두 start()에서 만든다. 서버가 스레드를 띄운 뒤에 fork 기반 풀이 생기지 않는다.
+
+start()가 호출되지 않은 상태(스크립트, 단위 테스트)에서는 get()이 None을 반환하므로
+러너는 기존처럼 호출마다 자체 풀을 만든다.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Executor, Future, ThreadPoolExecutor, wait
+from functools import partial
+from multiprocessing import resource_tracker
+
+from processor import interpreter_runner, mp_runner
+
+# 풀을 만드는 방식. sync는 풀을 쓰지 않는다.
+_POOL_KINDS = {
+    "threading": "thread",
+    "frethread": "thread",
+    "async": "thread",
+    "multiprocessing": "process",
+    "interpreter": "interpreter",
+}
+
+
+def _noop() -> None:
+    """워커를 미리 띄우기 위한 빈 작업 — 모듈 최상위 함수 (pickle 호환)."""
+
+
+class _Slots(Executor):
+    """공유 풀에 동시에 넣는 작업을 limit개로 제한하는 뷰.
+
+    limit개가 풀에서 돌고 있으면 나머지는 여기 대기열에 두었다가 하나가 끝날 때 넣는다.
+    submit()은 막히지 않으므로 이벤트 루프(run_in_executor)에서 불러도 된다.
+    대기열의 작업은 cancel()로 취소된다. 풀은 PoolManager가 정리하므로
+    shutdown()은 대기열만 비운다 (cancel_futures=True일 때).
+    """
+
+    def __init__(self, pool: Executor, limit: int) -> None:
+        self._pool = pool
+        self.limit = max(limit, 1)
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queue: deque[tuple[Future, object, tuple, dict]] = deque()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        outer: Future = Future()
+        with self._lock:
+            if self._running >= self.limit:
+                self._queue.append((outer, fn, args, kwargs))
+                return outer
+            self._running += 1
+        self._start(outer, fn, args, kwargs)
+        return outer
+
+    def _start(self, outer: Future, fn, args: tuple, kwargs: dict) -> None:
+        """슬롯 하나를 가진 상태에서 호출. 취소된 작업은 건너뛰고 다음 작업을 풀에 넣는다."""
+        while True:
+            if outer.set_running_or_notify_cancel():
+                try:
+                    inner = self._pool.submit(fn, *args, **kwargs)
+                except BaseException as e:  # 풀이 종료됨 등
+                    outer.set_exception(e)
+                else:
+                    inner.add_done_callback(partial(self._done, outer))
+                    return
+            item = self._next()
+            if item is None:
+                return
+            outer, fn, args, kwargs = item
+
+    def _next(self) -> tuple[Future, object, tuple, dict] | None:
+        """대기 중인 다음 작업. 없으면 슬롯을 반납하고 None."""
+        with self._lock:
+            if self._queue:
+                return self._queue.popleft()
+            self._running -= 1
+            return None
+
+    def _done(self, outer: Future, inner: Future) -> None:
+        if inner.cancelled():
+            outer.set_exception(CancelledError())
+        elif inner.exception() is not None:
+            outer.set_exception(inner.exception())
+        else:
+            outer.set_result(inner.result())
+        item = self._next()
+        if item is not None:
+            self._start(*item)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if cancel_futures:
+            with self._lock:
+                queued = list(self._queue)
+                self._queue.clear()
+            for outer, *_ in queued:
+                outer.cancel()
+
+
+class PoolManager:
+    def __init__(self) -> None:
+        self._pools: dict[str, Executor] = {}
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    def start(self, sizes: dict[str, int] | None = None) -> None:
+        """풀 관리를 시작하고, sizes에 지정한 method마다 그 크기의 풀을 하나씩 띄운다.
+
+        process 풀을 먼저 만들어 스레드가 없는 상태에서 fork되도록 한다.
+        여기서 만들지 않은 method는 get()이 None을 반환한다 (러너가 자체 풀 사용).
+        """
+        items = sorted((sizes or {}).items(), key=lambda kv: _POOL_KINDS.get(kv[0]) != "process")
+        pools = {}
+        for method, workers in items:
+            kind = _POOL_KINDS.get(method)
+            if kind is not None and workers >= 1:
+                pools[method] = (self._create(kind, workers), workers)
+        with self._lock:
+            for method, (pool, workers) in pools.items():
+                self._pools[method] = pool
+                self._sizes[method] = workers
+            self._started = True
+
+    def get(self, method: str, workers: int) -> Executor | None:
+        """method의 공유 풀을 동시 실행 workers개(풀 크기까지)로 제한해 반환한다."""
+        with self._lock:
+            pool = self._pools.get(method) if self._started else None
+            size = self._sizes.get(method, 0)
+        if pool is None:
+            return None
+        if workers >= size:
+            return pool
+        return _Slots(pool, workers)
+
+    def size(self, method: str) -> int:
+        """method 풀의 워커 수 (풀이 없으면 0)."""
+        with self._lock:
+            return self._sizes.get(method, 0) if self._started else 0
+
+    def is_warm(self, method: str, workers: int) -> bool:
+        """workers개를 띄워 둔 풀에서 그대로 실행할 수 있는지."""
+        return 1 <= workers <= self.size(method)
+
+    def warm_keys(self) -> list[tuple[str, int]]:
+        """풀 생성 없이 실행할 수 있는 (method, workers) 목록."""
+        with self._lock:
+            sizes = dict(self._sizes) if self._started else {}
+        return [(method, w) for method, size in sizes.items() for w in range(1, size + 1)]
+
+    def shutdown(self) -> None:
+        """모든 풀을 종료한다. 대기 중인 작업은 취소하고 실행 중인 작업은 기다린다."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._sizes.clear()
+            self._started = False
+        for pool in pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _create(kind: str, workers: int) -> Executor:
+        if kind == "process":
+            # 워커가 만든 shared_memory 블록을 부모와 같은 resource tracker가 관리하도록
+            # 워커 생성 전에 tracker를 띄운다 (시작 방식은 settings.MP_START_METHOD)
+            resource_tracker.ensure_running()
+            pool = mp_runner.create_executor(workers)
+        elif kind == "interpreter":
+            pool = interpreter_runner.create_executor(workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        # 빈 작업을 workers개 제출해 스레드/프로세스를 미리 생성한다
+        wait([pool.submit(_noop) for _ in range(workers)])
+        return pool
+
+
+pool_manager = PoolManager()
@@ -0,0 +1,13 @@
+"""multiprocessing 워커 preload 모듈.
+
+forkserver 시작 방식에서 서버 프로세스가 이 모듈을 한 번 import하면(settings.MP_PRELOAD),
+이후 fork되는 워커는 Pillow, 등록된 operation, 폰트/텍스트 마스크 캐시가 준비된 상태로 시작한다.
+fork/spawn에서는 쓰이지 않는다 (fork는 부모 상태를 그대로 복사하고, spawn은 preload가 없다).
+"""
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont  # noqa: F401
+
+from processor import mp_runner, operations, resources  # noqa: F401
+
+Image.init()  # 이미지 포맷 플러그인 등록 (첫 open 때 하는 작업을 미리)
+resources.warm()
@@ -0,0 +1,124 @@
+"""이미지 처리 작업(operation) 레지스트리.
+
+operation마다 함수, 파라미터 스키마(pydantic), 기본 파라미터와
+스케줄링에 쓰는 메타데이터를 한곳에 등록한다.
+
+  - releases_gil: Pillow C 코드가 대부분의 시간 동안 GIL을 놓는지.
+                  False면 GIL=1 환경에서 threading으로 병렬화되지 않는다.
+  - cost_per_mp:  메가픽셀당 상대 비용 (blur=1.0 기준, 워커 수/분할 판단용)
+  - tile_halo:    strip 분할 시 위아래로 더 읽어야 하는 행 수 계산 함수.
+                  None이면 타일 처리 불가.
+  - mode_agnostic: "L"(1채널) 이미지를 그대로 처리해도 결과가 같은지 (pipeline fusion)
+  - scale_invariant: 디코드 해상도를 줄여도 결과가 같은지 (size_hint)
+
+새 operation은 operations.py에서 @register(...)로 함수를 등록하기만 하면
+API Literal 타입, 이름 검증, 기본값, 타일/파이프라인 처리에 자동으로 반영된다.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+class NoParams(BaseModel):
+    """파라미터가 없는 operation용 스키마."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+@dataclass(frozen=True)
+class OperationSpec:
+    name: str
+    func: Callable
+    params_schema: type[BaseModel] = NoParams
+    releases_gil: bool = True
+    cost_per_mp: float = 1.0
+    tile_halo: Callable[[dict], int] | None = None
+    mode_agnostic: bool = False
+    scale_invariant: bool = False
+
+    @property
+    def tileable(self) -> bool:
+        return self.tile_halo is not None
+
+    def default_params(self) -> dict:
+        return self.params_schema().model_dump()
+
+    def bind(self, params: dict | None) -> dict:
+        """params를 스키마로 검증하고 기본값을 채운 dict를 반환한다. 잘못되면 ValueError."""
+        try:
+            return self.params_schema.model_validate(params or {}).model_dump()
+        except ValidationError as e:
+            errors = "; ".join(
+                f"{'.'.join(map(str, err['loc'])) or 'params'}: {err['msg']}" for err in e.errors()
+            )
+            raise ValueError(f"{self.name} 파라미터 오류: {errors}") from None
+
+
+_REGISTRY: dict[str, OperationSpec] = {}
+
+
+def register(
+    params_schema: type[BaseModel] = NoParams,
+    *,
+    name: str | None = None,
+    releases_gil: bool = True,
+    cost_per_mp: float = 1.0,
+    tile_halo: Callable[[dict], int] | None = None,
+    mode_agnostic: bool = False,
+    scale_invariant: bool = False,
+):
+    """operation 함수를 레지스트리에 등록하는 데코레이터. 함수는 그대로 반환한다."""
+
+    def decorator(func: Callable) -> Callable:
+        op_name = name or func.__name__
+        if op_name in _REGISTRY:
+            raise ValueError(f"이미 등록된 operation: {op_name}")
+        _REGISTRY[op_name] = OperationSpec(
+            name=op_name,
+            func=func,
+            params_schema=params_schema,
+            releases_gil=releases_gil,
+            cost_per_mp=cost_per_mp,
+            tile_halo=tile_halo,
+            mode_agnostic=mode_agnostic,
+            scale_invariant=scale_invariant,
+        )
+        return func
+
+    return decorator
+
+
+def _load_builtin() -> None:
+    # operations 모듈이 import되면서 내장 operation이 등록된다 (순환 import 방지용 지연 import)
+    from processor import operations  # noqa: F401
+
+
+def names() -> list[str]:
+    """등록된 operation 이름 (등록 순서)."""
+    _load_builtin()
+    return list(_REGISTRY)
+
+
+def get(name: str) -> OperationSpec:
+    """operation 이름으로 spec을 반환한다. 잘못된 이름이면 ValueError."""
+    _load_builtin()
+    if name not in _REGISTRY:
+        raise ValueError(f"Unknown operation: {name}. 가능한 값: {set(_REGISTRY)}")
+    return _REGISTRY[name]
+
+
+def specs() -> list[OperationSpec]:
+    _load_builtin()
+    return list(_REGISTRY.values())
+
+
+def get_default_params(operation: str, params: dict | None) -> dict:
+    """params가 비어있으면 operation에 맞는 기본값을 반환한다."""
+    if params:
+        return params
+    _load_builtin()
+    if operation not in _REGISTRY:
+        return {}
+    return _REGISTRY[operation].default_params()
@@ -0,0 +1,136 @@
+"""프로세스 전역 리소스 캐시 (폰트, 미리 렌더링한 텍스트 마스크).
+
+watermark가 이미지마다 ImageFont.truetype()으로 TTF를 다시 파싱하지 않도록
+(폰트 경로, 크기)별 폰트와 (텍스트, 폰트, 크기)별 텍스트 마스크를 한 번만 만든다.
+
+watermark 텍스트는 요청마다 다를 수 있으므로 두 캐시 모두 LRU로 개수를 제한한다
+(MAX_FONTS, MAX_TEXT_MASKS). 텍스트는 100자까지라 마스크 하나는 기본 폰트에서 100KB 안팎이다.
+
+GIL=0 안전성:
+  - 캐시 dict 조회/삽입은 Lock 안에서 한다 (check-then-act 경쟁 방지).
+  - FreeType face는 스레드 안전하지 않으므로 폰트를 사용하는 렌더링도 Lock 안에서 한다.
+    렌더링 결과인 "L" 마스크는 이후 읽기 전용으로만 쓰이므로 스레드 간 공유해도 안전하다.
+
+multiprocessing 워커는 프로세스마다 캐시가 따로 있으므로 풀 initializer에서 warm()을 호출해
+첫 작업 전에 미리 채운다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+DEFAULT_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+DEFAULT_FONT_SIZE = 36
+DEFAULT_WATERMARK_TEXT = "nogil-bench"
+MAX_FONTS = 16
+MAX_TEXT_MASKS = 256
+
+_lock = threading.Lock()
+_fonts: OrderedDict[tuple[str, int], ImageFont.FreeTypeFont | ImageFont.ImageFont] = OrderedDict()
+_masks: OrderedDict[tuple[str, str, int], tuple[Image.Image, tuple[int, int]]] = OrderedDict()
+_stats = {
+    "font_hits": 0,
+    "font_misses": 0,
+    "mask_hits": 0,
+    "mask_misses": 0,
+    "evictions": 0,
+}
+
+
+def _reset_lock_after_fork() -> None:
+    # 다른 스레드가 Lock을 잡은 순간 fork되면 자식에서 영원히 풀리지 않으므로 새로 만든다
+    global _lock
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_lock_after_fork)
+
+
+def _load_font(path: str, size: int):
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default(size=size)
+
+
+def _put_locked(cache: OrderedDict, key, value, limit: int) -> None:
+    """_lock을 잡은 상태에서 호출한다. limit개를 넘으면 가장 오래 쓰지 않은 항목부터 버린다."""
+    cache[key] = value
+    while len(cache) > limit:
+        cache.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+def _font_locked(path: str, size: int):
+    """_lock을 잡은 상태에서 호출한다."""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        _stats["font_misses"] += 1
+        font = _load_font(path, size)
+        _put_locked(_fonts, key, font, MAX_FONTS)
+    else:
+        _fonts.move_to_end(key)
+        _stats["font_hits"] += 1
+    return font
+
+
+def get_font(path: str = DEFAULT_FONT_PATH, size: int = DEFAULT_FONT_SIZE):
+    """캐시된 폰트를 반환한다. 렌더링에 직접 쓸 때는 스레드 간 동시 사용에 주의."""
+    with _lock:
+        return _font_locked(path, size)
+
+
+def get_text_mask(
+    text: str, path: str = DEFAULT_FONT_PATH, size: int = DEFAULT_FONT_SIZE
+) -> tuple[Image.Image, tuple[int, int]]:
+    """텍스트를 렌더링한 "L" 마스크와 그리기 원점 기준 오프셋 (bbox 좌상단)을 반환한다.
+
+    마스크 크기는 textbbox 크기와 같다. 반환된 이미지를 수정하면 안 된다.
+    """
+    key = (text, path, size)
+    with _lock:
+        cached = _masks.get(key)
+        if cached is not None:
+            _masks.move_to_end(key)
+            _stats["mask_hits"] += 1
+            return cached
+
+        _stats["mask_misses"] += 1
+        font = _font_locked(path, size)
+        left, top, right, bottom = ImageDraw.Draw(Image.new("L", (1, 1))).textbbox(
+            (0, 0), text, font=font
+        )
+        mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+        entry = (mask, (left, top))
+        _put_locked(_masks, key, entry, MAX_TEXT_MASKS)
+        return entry
+
+
+def warm(
+    fonts: list[tuple[str, int]] | None = None, texts: list[str] | None = None
+) -> None:
+    """폰트/마스크를 미리 로드한다. multiprocessing 풀 initializer로도 사용 (pickle 호환).
+
+    인자를 생략하면 기본 폰트와 기본 watermark 텍스트 마스크를 준비한다.
+    """
+    for path, size in fonts or [(DEFAULT_FONT_PATH, DEFAULT_FONT_SIZE)]:
+        get_font(path, size)
+        for text in texts if texts is not None else [DEFAULT_WATERMARK_TEXT]:
+            get_text_mask(text, path, size)
+
+
+def stats() -> dict[str, int]:
+    with _lock:
+        return dict(_stats, fonts=len(_fonts), masks=len(_masks))
+
+
+def clear() -> None:
+    with _lock:
+        _fonts.clear()
+        _masks.clear()
+        for key in _stats:
+            _stats[key] = 0
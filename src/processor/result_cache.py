@@ -0,0 +1,118 @@
+"""처리 결과 캐시 (content-addressed).
+
+같은 원본 바이트에 같은 operation/params를 적용한 결과는 항상 같으므로
+(원본 sha256, 정규화한 operation/params, 디코드 size_hint, JPEG 품질)을 해시한 키로
+출력 파일 경로를 정한다: OUTPUT_DIR/results/{key}.jpg
+
+  - 적중: 파일이 이미 있으면 디코드/처리/인코드 없이 그 경로를 그대로 쓴다.
+  - 미스: 호출한 쪽이 그 경로에 결과를 저장한다. save_jpeg는 임시 파일 → rename이라
+          같은 키를 동시에 만들어도 반쯤 쓴 파일을 적중으로 읽지 않는다.
+  - params는 스키마 기본값을 채우고 키를 정렬한 JSON으로 정규화하므로
+    {"radius": 2}와 {}(기본값 2)는 같은 결과, radius만 다른 결과는 다른 파일이 된다.
+
+색인은 파일 시스템 자체라 프로세스/multiprocessing 워커/서버 재시작과 관계없이 공유된다.
+한 출력 파일을 여러 ImageRecord가 가리킬 수 있으므로 레코드 삭제 시에는
+다른 레코드가 참조하지 않을 때만 파일을 지운다 (image_service.delete_image).
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from core.config import settings
+from processor import registry
+from processor.image_io import JPEG_QUALITY
+from processor.pipeline import PIPELINE, normalize_steps, size_hint
+
+_READ_CHUNK = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """파일 내용의 sha256 (hex). 업로드 시 계산하지 못한 레코드에 쓴다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def canonical(operation: str, params: dict | None = None) -> str:
+    """operation/params를 결과가 같으면 같은 문자열이 되도록 정규화한다.
+
+    잘못된 operation/파라미터면 compile_transform과 같은 ValueError/KeyError.
+    """
+    params = params or {}
+    if operation == PIPELINE:
+        steps = normalize_steps(params.get("steps", []))
+    else:
+        steps = [(operation, registry.get(operation).bind(params))]
+    return json.dumps(
+        {"operation": operation, "steps": steps},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def result_key(content_hash: str, operation: str, params: dict | None = None) -> str:
+    """원본 해시 + 정규화된 작업으로 만든 결과 키 (sha256 hex)."""
+    payload = json.dumps(
+        {
+            "source": content_hash,
+            "transform": canonical(operation, params),
+            "size_hint": size_hint(operation, params),
+            "quality": JPEG_QUALITY,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, root: str | None = None) -> None:
+        """root가 None이면 settings.OUTPUT_DIR/results를 쓴다."""
+        self._root = root
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    @property
+    def root(self) -> str:
+        return self._root or os.path.join(settings.OUTPUT_DIR, "results")
+
+    @property
+    def enabled(self) -> bool:
+        return settings.RESULT_CACHE_ENABLED
+
+    def path(self, key: str) -> str:
+        """키에 해당하는 출력 경로. 디렉터리가 없으면 만든다."""
+        os.makedirs(self.root, exist_ok=True)
+        return os.path.join(self.root, f"{key}.jpg")
+
+    def lookup(self, key: str) -> str | None:
+        """결과 파일이 이미 있으면 그 경로를, 없거나 캐시가 꺼져 있으면 None을 반환한다."""
+        if not self.enabled:
+            return None
+        path = self.path(key)
+        hit = os.path.exists(path)
+        with self._lock:
+            self._stats["hits" if hit else "misses"] += 1
+        return path if hit else None
+
+    def stats(self) -> dict[str, int | float | bool]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return dict(
+                self._stats,
+                enabled=self.enabled,
+                hit_rate=round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+cache = ResultCache()
@@ -0,0 +1,107 @@
+"""동시성 방식(method) → 러너 모듈 매핑.
+
+benchmark_service와 job_service가 같은 러너 집합을 사용하도록 한곳에서 정의한다.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import Executor
+
+from PIL import Image
+
+from processor import (
+    frethread_runner,
+    interpreter_runner,
+    loop_runner,
+    mp_runner,
+    sync_runner,
+    thread_runner,
+)
+from processor.stages import StageTimes
+
+METHODS = {
+    "sync": sync_runner,
+    "threading": thread_runner,
+    "multiprocessing": mp_runner,
+    "frethread": frethread_runner,
+    "interpreter": interpreter_runner,
+    "async": loop_runner,
+}
+
+
+def run(
+    method: str,
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+    auto_workers: bool | None = None,
+) -> list[Image.Image] | list[str]:
+    """method에 해당하는 러너로 이미지를 처리한다.
+
+    sync는 workers/executor를 받지 않으므로 여기서 시그니처 차이를 흡수한다.
+    use_cache=True면 디코드 결과를 decode_cache에서 재사용한다.
+    timings(StageTimes)를 주면 이미지별 단계 시간(decode/convert/op/encode, mp는 ipc)을 더한다.
+    auto_workers는 multiprocessing에만 전달한다 (False면 워커 수 자동 결정을 끔, mp_runner 참고).
+    """
+    runner = METHODS[method]
+    if method == "sync":
+        return runner.run(
+            image_paths,
+            operation,
+            params,
+            output_paths=output_paths,
+            use_cache=use_cache,
+            timings=timings,
+        )
+    extra = {"auto_workers": auto_workers} if method == "multiprocessing" else {}
+    return runner.run(
+        image_paths,
+        operation,
+        params,
+        workers=workers,
+        output_paths=output_paths,
+        executor=executor,
+        use_cache=use_cache,
+        timings=timings,
+        **extra,
+    )
+
+
+def iter_run(
+    method: str,
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """run()의 스트리밍 버전. 완료된 순서대로 (index, result)를 yield한다."""
+    runner = METHODS[method]
+    if method == "sync":
+        return runner.iter_run(
+            image_paths,
+            operation,
+            params,
+            output_paths=output_paths,
+            use_cache=use_cache,
+            timings=timings,
+        )
+    return runner.iter_run(
+        image_paths,
+        operation,
+        params,
+        workers=workers,
+        output_paths=output_paths,
+        executor=executor,
+        max_inflight=max_inflight,
+        use_cache=use_cache,
+        timings=timings,
+    )
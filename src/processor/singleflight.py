@@ -0,0 +1,77 @@
+"""동일한 진행 중 작업 합치기 (single-flight).
+
+같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 기다려 함께 쓴다.
+image_service.process_image가 결과 캐시 키로 사용해, 같은 원본 + 같은 operation/params
+요청이 동시에 여러 개 들어와도 디코드/처리/인코드는 한 번만 한다.
+
+  - 먼저 온 요청(leader)이 fn()을 실행하고, 나머지(follower)는 Event로 기다린다.
+  - fn()이 예외를 던지면 기다리던 요청도 같은 예외를 받는다.
+  - 완료되면 키를 지우므로 결과를 보관하지 않는다 (보관은 result_cache 담당).
+    그래서 완료 직후 도착한 요청은 새 leader가 되며, 호출한 쪽이 fn() 안에서
+    캐시를 한 번 더 확인해야 한다.
+
+키 조회/등록은 Lock 안에서 하므로 GIL=0 스레드에서도 한 키에 leader는 하나다.
+프로세스 단위라 여러 uvicorn 워커 사이에서는 합쳐지지 않는다.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> tuple[T, bool]:
+        """fn()의 결과와, 다른 요청의 실행 결과를 공유받았는지 여부를 반환한다."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["leaders"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+inflight = SingleFlight()
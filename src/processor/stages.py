@@ -0,0 +1,56 @@
+"""이미지별 처리 단계 시간 측정.
+
+러너에 timings=StageTimes()를 넘기면 process_file이 이미지마다 단계별 시간을 재서 더한다.
+None(기본)이면 측정 코드를 전혀 거치지 않는다. 측정 비용은 이미지당 perf_counter 5회 +
+Lock 1회라 이미지 처리 시간(수 ms 이상)에 비해 무시할 수준이다.
+
+  - decode:  파일 열기 + 픽셀 디코드 (draft 포함). 디코드 캐시를 쓰면 캐시 조회 + RGB 변환까지
+  - convert: RGB 변환 (디코드 캐시를 쓰면 decode에 포함되어 기록하지 않음)
+  - op:      operation/파이프라인 적용 (타일 처리 포함)
+  - encode:  JPEG 인코딩 + 저장 (output_path가 있을 때만)
+  - ipc:     multiprocessing 워커가 청크를 끝낸 뒤 부모에 결과가 도착할 때까지 + 복원 시간
+             (결과 pickle/파이프 전송/unpickle 또는 shm 복사). 청크 시간을 이미지 수로 나눠 기록.
+             소비자가 앞선 결과를 처리하느라 늦게 꺼낸 시간은 들어가지 않는다
+
+단계 시간은 워커 안에서 잰 값이라 병렬 실행이면 합이 wall time보다 클 수 있다.
+multiprocessing/interpreter 워커는 snapshot()을 결과와 함께 돌려보내고 부모가 merge()한다.
+"""
+
+import threading
+
+STAGES = ("decode", "convert", "op", "encode", "ipc")
+
+Snapshot = dict[str, tuple[float, int]]
+
+
+class StageTimes:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals = dict.fromkeys(STAGES, 0.0)
+        self._counts = dict.fromkeys(STAGES, 0)
+
+    def add(self, count: int = 1, **seconds: float) -> None:
+        """단계별 시간(초)을 더한다. count는 이 시간에 해당하는 이미지 수."""
+        with self._lock:
+            for stage, value in seconds.items():
+                self._totals[stage] += value
+                self._counts[stage] += count
+
+    def merge(self, snapshot: Snapshot) -> None:
+        with self._lock:
+            for stage, (total, count) in snapshot.items():
+                self._totals[stage] += total
+                self._counts[stage] += count
+
+    def snapshot(self) -> Snapshot:
+        """pickle 가능한 {stage: (합계 초, 이미지 수)}. 워커 → 부모 전달용."""
+        with self._lock:
+            return {s: (self._totals[s], self._counts[s]) for s in STAGES if self._counts[s]}
+
+    def mean_ms(self) -> dict[str, float | None]:
+        """단계별 이미지당 평균 시간 (ms). 기록이 없는 단계는 None."""
+        with self._lock:
+            return {
+                s: round(self._totals[s] / self._counts[s] * 1000, 3) if self._counts[s] else None
+                for s in STAGES
+            }
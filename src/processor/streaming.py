@@ -0,0 +1,83 @@
+"""완료 순서 스트리밍 공통 로직.
+
+러너의 iter_run()이 사용한다. 작업을 한꺼번에 제출하지 않고
+max_inflight개까지만 실행 중으로 유지하면서, 끝난 순서대로 (index, result)를 내보낸다.
+결과를 하나 소비할 때마다 다음 작업을 하나 제출하므로
+메모리에 동시에 존재하는 디코드 이미지 수가 max_inflight로 제한된다.
+weights를 주면 작업마다 memory.budget(메가픽셀 예산)도 얻고 제출하므로
+여러 요청을 합친 메모리 사용량도 제한된다 (예산이 모자라면 제출이 막힌다).
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from itertools import islice
+from typing import Any
+
+from processor import memory
+
+
+def default_inflight(workers: int) -> int:
+    """기본 동시 실행 상한: 워커가 놀지 않도록 워커 수의 2배."""
+    return max(workers, 1) * 2
+
+
+def bounded_completion(
+    executor: Executor,
+    fn: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    max_inflight: int,
+    weights: Sequence[float] | None = None,
+    discard: Callable[[Any], None] | None = None,
+    arrivals: dict[int, float] | None = None,
+) -> Iterator[tuple[int, Any]]:
+    """tasks를 max_inflight개씩 제출하고 완료 순서대로 (index, result)를 yield한다.
+
+    weights[i]는 i번째 작업의 메가픽셀. 제출 전에 예산을 얻고 작업이 끝나면(취소 포함) 반납한다.
+    소비자가 중간에 멈추면(generator close/예외) 아직 시작하지 않은 작업은 취소한다.
+    discard를 주면 이미 실행 중인 작업이 끝날 때까지 기다려, 내보내지 못한 결과를
+    discard(result)로 정리한다 (shared_memory 블록처럼 소비자가 해제해야 하는 결과).
+    arrivals를 주면 작업이 끝난 시각(time.time())을 arrivals[index]에 기록한다.
+    소비자가 앞선 결과를 처리하느라 늦게 꺼내도 결과가 도착한 시각을 알 수 있다.
+    """
+    indexed = enumerate(tasks)
+    pending: dict[Future, int] = {}
+
+    def _submit(items) -> None:
+        for idx, task in items:
+            granted = memory.budget.acquire(weights[idx]) if weights is not None else 0.0
+            try:
+                future = executor.submit(fn, task)
+            except BaseException:
+                memory.budget.release(granted)
+                raise
+            if granted:
+                future.add_done_callback(lambda _, granted=granted: memory.budget.release(granted))
+            if arrivals is not None:
+                future.add_done_callback(lambda _, idx=idx: arrivals.__setitem__(idx, time.time()))
+            pending[future] = idx
+
+    try:
+        _submit(islice(indexed, max(max_inflight, 1)))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = pending.pop(future)
+                _submit(islice(indexed, 1))
+                yield idx, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if discard is not None and pending:
+            wait(pending)
+            for future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    discard(future.result())
+
+
+def collect(items: Iterable[tuple[int, Any]], count: int) -> list:
+    """(index, result) 스트림을 입력 순서 목록으로 모은다."""
+    results: list = [None] * count
+    for idx, result in items:
+        results[idx] = result
+    return results
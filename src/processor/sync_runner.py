@@ -1,19 +1,61 @@
-"""동기 순차 처리 러너 (기준선)."""
+"""동기 순차 처리 러너 (기준선).
+
+순차 처리라 자체 메모리 사용은 이미지 1장분이지만, 다른 요청과 같은 메모리 예산을 공유하도록
+이미지마다 memory.budget을 얻고 처리한다.
+"""
+
+from collections.abc import Iterator
 
 from PIL import Image
 
-from processor import operations
+from processor import memory
+from processor.image_io import process_file
+from processor.pipeline import compile_transform, size_hint
+from processor.stages import StageTimes
+
 
+def run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    output_paths: list[str] | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> list[Image.Image] | list[str]:
+    """이미지를 순차적으로 처리한다.
 
-def run(image_paths: list[str], operation: str, params: dict | None = None) -> list[Image.Image]:
-    """이미지를 순차적으로 처리한다."""
-    op_func = operations.get_operation(operation)
-    params = params or {}
+    output_paths를 주면 결과를 해당 경로에 JPEG로 저장하고 경로 목록을 반환한다.
+    use_cache=True면 디코드 결과를 decode_cache에서 재사용한다 (다른 러너도 같음).
+    timings를 주면 이미지별 단계 시간을 더한다 (processor.stages, 다른 러너도 같음).
+    """
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    outputs = output_paths or [None] * len(image_paths)
+    weights = memory.task_weights(image_paths) or [0.0] * len(image_paths)
     results = []
 
-    for path in image_paths:
-        img = Image.open(path).convert("RGB")
-        result = op_func(img, **params)
-        results.append(result)
+    for path, out, weight in zip(image_paths, outputs, weights):
+        with memory.budget.reserve(weight):
+            results.append(process_file(path, transform, out, hint, use_cache, timings))
 
     return results
+
+
+def iter_run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    output_paths: list[str] | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """이미지를 하나씩 처리하며 (index, result)를 바로 yield한다."""
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    outputs = output_paths or [None] * len(image_paths)
+    weights = memory.task_weights(image_paths) or [0.0] * len(image_paths)
+
+    for i, (path, out, weight) in enumerate(zip(image_paths, outputs, weights)):
+        with memory.budget.reserve(weight):
+            result = process_file(path, transform, out, hint, use_cache, timings)
+        yield i, result
@@ -5,11 +5,16 @@ GIL=1 환경에서의 threading 한계를 보여주기 위한 러너.
 C 확장(Pillow 등)은 내부에서 GIL을 릴리즈하므로 병렬 효과가 있다.
 """
 
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 from PIL import Image
 
-from processor import operations
+from processor import memory
+from processor.image_io import process_file
+from processor.pipeline import compile_transform, size_hint
+from processor.stages import StageTimes
+from processor.streaming import bounded_completion, collect, default_inflight
 
 
 def run(
@@ -17,16 +22,67 @@ def run(
     operation: str,
     params: dict | None = None,
     workers: int = 4,
-) -> list[Image.Image]:
-    """ThreadPoolExecutor로 이미지를 병렬 처리한다."""
-    op_func = operations.get_operation(operation)
-    params = params or {}
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> list[Image.Image] | list[str]:
+    """ThreadPoolExecutor로 이미지를 병렬 처리한다.
 
-    def process_one(path: str) -> Image.Image:
-        img = Image.open(path).convert("RGB")
-        return op_func(img, **params)
+    output_paths를 주면 인코딩/저장까지 워커 스레드에서 처리하고 경로 목록을 반환한다.
+    executor를 주면 호출마다 풀을 만들지 않고 해당 풀(PoolManager의 영구 풀)을 사용한다.
+    executor.map처럼 전부 제출하되, 메모리 예산(memory.budget)이 모자라면 제출이 기다린다.
+    """
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    outputs = output_paths or [None] * len(image_paths)
+    weights = memory.task_weights(image_paths)
+    count = len(image_paths)
+
+    def process_one(task: tuple[str, str | None]) -> Image.Image | str:
+        path, out = task
+        return process_file(path, transform, out, hint, use_cache, timings)
+
+    tasks = zip(image_paths, outputs)
+    if executor is not None:
+        return collect(bounded_completion(executor, process_one, tasks, count, weights), count)
 
     with ThreadPoolExecutor(max_workers=workers) as pool:
-        results = list(pool.map(process_one, image_paths))
+        results = collect(bounded_completion(pool, process_one, tasks, count, weights), count)
 
     return results
+
+
+def iter_run(
+    image_paths: list[str],
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    output_paths: list[str] | None = None,
+    executor: Executor | None = None,
+    max_inflight: int | None = None,
+    use_cache: bool = False,
+    timings: StageTimes | None = None,
+) -> Iterator[tuple[int, Image.Image | str]]:
+    """완료된 순서대로 (index, result)를 yield한다.
+
+    max_inflight(기본: workers×2)개까지만 동시에 제출하므로
+    전체 결과를 메모리에 모으지 않고 첫 결과를 바로 받을 수 있다.
+    """
+    transform = compile_transform(operation, params)
+    hint = size_hint(operation, params)
+    outputs = output_paths or [None] * len(image_paths)
+    limit = max_inflight or default_inflight(workers)
+    weights = memory.task_weights(image_paths)
+
+    def process_one(task: tuple[str, str | None]) -> Image.Image | str:
+        path, out = task
+        return process_file(path, transform, out, hint, use_cache, timings)
+
+    tasks = zip(image_paths, outputs)
+    if executor is not None:
+        yield from bounded_completion(executor, process_one, tasks, limit, weights)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from bounded_completion(pool, process_one, tasks, limit, weights)
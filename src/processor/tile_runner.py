@@ -0,0 +1,81 @@
+"""단일 이미지 타일(strip) 병렬 처리 러너.
+
+다른 러너는 이미지 단위로만 병렬화하므로 큰 이미지 한 장은 코어 하나에서 처리된다.
+이 러너는 이미지를 가로 strip으로 나눠 스레드에서 동시에 처리하고 다시 이어 붙인다.
+
+경계(seam) 처리:
+  blur/sharpen은 주변 픽셀을 참조하므로 strip마다 위아래로 halo 행을 더 잘라 처리한 뒤
+  halo 부분을 버린다. halo가 커널 반경 이상이면 결과가 전체 이미지 처리와 픽셀 단위로 같다.
+  operation별 halo는 레지스트리의 tile_halo에 등록되어 있다 (없으면 타일 처리 불가).
+  - blur: Pillow GaussianBlur는 box blur 3회 → 반경 ≈ 3×radius
+  - sharpen: 3×3 커널 → 1
+  - grayscale: 픽셀 독립 → 0
+
+Pillow 필터는 C 내부에서 GIL을 릴리즈하므로 GIL=1에서도 어느 정도 병렬화되지만,
+strip 분할/붙이기까지 포함해 온전히 병렬로 도는 것은 GIL=0 빌드다.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from PIL import Image
+
+from processor import registry
+
+
+def is_tileable(operation: str) -> bool:
+    return operation in registry.names() and registry.get(operation).tileable
+
+
+def split_strips(height: int, count: int, halo: int) -> list[tuple[int, int, int, int]]:
+    """이미지 높이를 count개 strip으로 나눈다.
+
+    반환: (출력 top, 출력 bottom, halo 포함 top, halo 포함 bottom) 목록
+    """
+    count = max(1, min(count, height))
+    bounds = [height * i // count for i in range(count + 1)]
+    return [
+        (top, bottom, max(0, top - halo), min(height, bottom + halo))
+        for top, bottom in zip(bounds, bounds[1:])
+    ]
+
+
+def run_tiled(
+    image: Image.Image,
+    operation: str,
+    params: dict | None = None,
+    workers: int = 4,
+    strips: int | None = None,
+    executor: Executor | None = None,
+) -> Image.Image:
+    """이미지 한 장을 strip으로 나눠 병렬 처리하고 이어 붙인다.
+
+    strips를 생략하면 workers개로 나눈다.
+    executor를 주면 해당 스레드풀(PoolManager의 frethread 풀 등)을 사용한다.
+    """
+    if not is_tileable(operation):
+        tileable = [spec.name for spec in registry.specs() if spec.tileable]
+        raise ValueError(f"타일 처리를 지원하지 않는 작업: {operation}. 가능한 값: {tileable}")
+
+    spec = registry.get(operation)
+    op_func = spec.func
+    params = params or {}
+    halo = spec.tile_halo(params)
+    layout = split_strips(image.height, strips or workers, halo)
+
+    def process_strip(bounds: tuple[int, int, int, int]) -> Image.Image:
+        top, bottom, src_top, src_bottom = bounds
+        strip = image.crop((0, src_top, image.width, src_bottom))
+        result = op_func(strip, **params)
+        # halo 행을 잘라내고 이 strip이 담당하는 영역만 남긴다
+        return result.crop((0, top - src_top, image.width, bottom - src_top))
+
+    if executor is not None:
+        pieces = list(executor.map(process_strip, layout))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pieces = list(pool.map(process_strip, layout))
+
+    output = Image.new(pieces[0].mode, image.size)
+    for (top, _, _, _), piece in zip(layout, pieces):
+        output.paste(piece, (0, top))
+    return output
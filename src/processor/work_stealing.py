@@ -0,0 +1,153 @@
+"""작업 훔치기(work stealing) 스케줄러.
+
+ThreadPoolExecutor.map은 공유 큐 하나에 입력 순서대로 작업을 넣으므로, 크기가 섞인
+배치에서는 큰 이미지가 마지막에 꺼내지면 다른 워커가 모두 놀고 있는 동안 혼자 처리하게 된다
+(tail latency = 가장 늦게 시작한 큰 작업).
+
+이 스케줄러는
+  1. 작업을 무게(이미지 메가픽셀, 헤더만 읽음) 내림차순으로 정렬하고 (largest-first)
+  2. 워커별 deque에 돌아가며 나눠 준 뒤
+  3. 각 워커는 자기 deque 앞쪽(큰 작업)부터 꺼내고, 비면 남은 무게가 가장 큰
+     다른 워커의 deque 뒤쪽(작은 작업)을 훔친다.
+큰 작업이 먼저 시작되므로 배치 끝에는 작은 작업만 남아 워커 간 종료 시각 차이가 줄어든다.
+
+워커 루프 workers개를 executor에 제출하는 방식이라 PoolManager의 영구 스레드풀을 그대로 쓸 수 있다.
+deque마다 Lock을 두므로 GIL=0에서도 안전하다.
+결과 queue 크기를 max_inflight로 제한해 소비자가 느리면 워커가 기다린다 (메모리 상한).
+budget(memory.MemoryBudget)을 주면 워커가 작업을 꺼낸 뒤 무게만큼 예산을 얻고 처리한다.
+"""
+
+import os
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any
+
+from processor.image_io import megapixels
+
+_DONE = object()
+
+
+def image_weight(path: str) -> float:
+    """정렬용 작업 무게: 헤더의 메가픽셀, 헤더를 못 읽으면 파일 크기(MB)."""
+    try:
+        return megapixels(path)
+    except OSError:
+        try:
+            return os.path.getsize(path) / 1_000_000
+        except OSError:
+            return 0.0
+
+
+class _Failed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class WorkStealingScheduler:
+    """한 배치를 실행하는 스케줄러. stats로 훔친 횟수/워커별 처리 수를 확인할 수 있다."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = max(1, workers)
+        self._deques: list[deque] = [deque() for _ in range(self.workers)]
+        self._locks = [threading.Lock() for _ in range(self.workers)]
+        self._remaining = [0.0] * self.workers
+        self._stop = threading.Event()
+        self.stats = {"steals": 0, "per_worker": [0] * self.workers}
+
+    def _distribute(self, weights: Sequence[float]) -> None:
+        order = sorted(range(len(weights)), key=lambda i: weights[i], reverse=True)
+        for rank, idx in enumerate(order):
+            w = rank % self.workers
+            self._deques[w].append((idx, weights[idx]))
+            self._remaining[w] += weights[idx]
+
+    def _take(self, me: int) -> tuple[int, float] | None:
+        with self._locks[me]:
+            if self._deques[me]:
+                idx, weight = self._deques[me].popleft()
+                self._remaining[me] -= weight
+                return idx, weight
+
+        # 남은 무게가 큰 워커부터 훔치기 시도
+        victims = sorted(
+            (v for v in range(self.workers) if v != me),
+            key=lambda v: self._remaining[v],
+            reverse=True,
+        )
+        for victim in victims:
+            with self._locks[victim]:
+                if self._deques[victim]:
+                    idx, weight = self._deques[victim].pop()
+                    self._remaining[victim] -= weight
+                    with self._locks[me]:
+                        self.stats["steals"] += 1
+                    return idx, weight
+        return None
+
+    def _worker(
+        self, me: int, fn: Callable, tasks: Sequence, results: queue.Queue, budget
+    ) -> None:
+        try:
+            while not self._stop.is_set():
+                item = self._take(me)
+                if item is None:
+                    return
+                idx, weight = item
+                try:
+                    with budget.reserve(weight) if budget is not None else nullcontext():
+                        result = fn(tasks[idx])
+                except Exception as e:
+                    self._stop.set()
+                    results.put(_Failed(e))
+                    return
+                self.stats["per_worker"][me] += 1
+                results.put((idx, result))
+        finally:
+            results.put(_DONE)
+
+    def run(
+        self,
+        fn: Callable[[Any], Any],
+        tasks: Sequence[Any],
+        weights: Sequence[float],
+        executor: Executor | None = None,
+        max_inflight: int | None = None,
+        budget=None,
+    ) -> Iterator[tuple[int, Any]]:
+        """무게 내림차순 + work stealing으로 처리하고 완료 순서대로 (index, result)를 yield한다."""
+        self._distribute(weights)
+        active = min(self.workers, len(tasks))
+        if active == 0:
+            return
+
+        results: queue.Queue = queue.Queue(maxsize=max_inflight or 0)
+        own_pool = executor is None
+        pool = ThreadPoolExecutor(max_workers=active) if own_pool else executor
+        futures = [
+            pool.submit(self._worker, w, fn, tasks, results, budget) for w in range(active)
+        ]
+
+        finished = 0
+        try:
+            while finished < active:
+                item = results.get()
+                if item is _DONE:
+                    finished += 1
+                elif isinstance(item, _Failed):
+                    raise item.error
+                else:
+                    yield item
+        finally:
+            self._stop.set()
+            # 결과 queue가 가득 차 put에서 기다리는 워커를 풀어 주고 모두 끝날 때까지 비운다
+            while finished < active:
+                if results.get() is _DONE:
+                    finished += 1
+            for future in futures:
+                future.result()
+            if own_pool:
+                pool.shutdown(wait=True)
@@ -1,29 +1,42 @@
 """벤치마크 API 라우터.
 
-4가지 동시성 방식(sync, threading, multiprocessing, frethread)의
-성능을 측정하고 결과를 저장/비교한다.
+동시성 방식(sync, threading, multiprocessing, frethread, interpreter, async)의
+성능을 측정하고 결과를 저장/비교한다. auto는 비용 모델이 이 중 하나를 고른다.
 """
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 from sqlmodel import Session
 
-from core.constants import MethodType, OperationType
+from core.constants import MethodType
 from core.dependencies import get_current_user
 from core.exceptions import AUTH_401, ErrorResponse
 from model.database import get_session
 from model.user import User
+from processor.operations import OperationType
 from service import benchmark_service
 
 router = APIRouter(prefix="/api/benchmarks", tags=["benchmarks"])
 
 
 class BenchmarkRunRequest(BaseModel):
-    method: MethodType
+    method: MethodType = Field(
+        description="auto면 비용 모델이 고른 method로 실행하고 예측 시간을 함께 저장한다.",
+    )
     operation: OperationType = "blur"
-    workers: int = Field(default=4, ge=1, le=16)
+    workers: int = Field(default=4, ge=1, le=16, description="auto일 때는 워커 수 상한")
     image_count: int = Field(default=10, ge=1, le=100)
     params: dict | None = None
+    decode_cache: bool = Field(
+        default=False,
+        description="true면 디코드 캐시를 사용해 디코드 비용을 뺀 처리 시간을 잰다 "
+        "(기본은 매번 디코드).",
+    )
+    stage_timings: bool = Field(
+        default=True,
+        description="true면 이미지당 단계별 평균 시간(decode/convert/op/encode/ipc, ms)을 "
+        "함께 기록한다.",
+    )
 
 
 _NOT_FOUND_404 = {"model": ErrorResponse, "description": "벤치마크 결과를 찾을 수 없음"}
@@ -33,8 +46,8 @@ _NOT_FOUND_404 = {"model": ErrorResponse, "description": "벤치마크 결과를
     "/run",
     status_code=201,
     summary="벤치마크 실행",
-    description="지정한 동시성 방식(sync/threading/multiprocessing/frethread)으로 "
-    "이미지 처리 벤치마크를 실행하고 결과를 DB에 저장한다.",
+    description="지정한 동시성 방식(sync/threading/multiprocessing/frethread/interpreter/async, "
+    "auto면 비용 모델이 고른 방식)으로 이미지 처리 벤치마크를 실행하고 결과를 DB에 저장한다.",
     responses={
         400: {"model": ErrorResponse, "description": "지원하지 않는 method 또는 operation"},
         401: AUTH_401,
@@ -51,6 +64,8 @@ def run_benchmark(
         workers=req.workers,
         image_count=req.image_count,
         params=req.params,
+        decode_cache=req.decode_cache,
+        stage_timings=req.stage_timings,
         user_id=current_user.id,
         session=session,
     )
@@ -72,7 +87,9 @@ def list_benchmarks(
 @router.get(
     "/compare",
     summary="벤치마크 결과 비교",
-    description="여러 벤치마크 결과를 ID로 지정하여 나란히 비교한다.",
+    description="여러 벤치마크 결과를 ID로 지정하여 나란히 비교한다. "
+    "단계별 시간(decode_ms, convert_ms, op_ms, encode_ms, ipc_ms)과 "
+    "cold_duration - duration(풀 생성 비용)으로 어느 단계에서 차이가 나는지 볼 수 있다.",
     responses={401: AUTH_401, 404: _NOT_FOUND_404},
 )
 def compare_benchmarks(
@@ -1,23 +1,52 @@
 from fastapi import APIRouter, Depends, UploadFile
 from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from sqlmodel import Session
 
-from core.constants import OperationType
 from core.dependencies import get_current_user
 from core.exceptions import AUTH_401, ErrorResponse, ImageNotProcessed
 from model.database import get_session
 from model.user import User
+from processor.operations import OperationType
+from processor.pipeline import PIPELINE
 from service import image_service
 
 router = APIRouter(prefix="/api/images", tags=["images"])
 
 
-class ProcessRequest(BaseModel):
+MAX_PIPELINE_STEPS = 10
+
+
+class PipelineStep(BaseModel):
     operation: OperationType
     params: dict | None = None
 
 
+class ProcessRequest(BaseModel):
+    """단일 작업(operation + params) 또는 파이프라인(steps) 중 하나를 지정한다."""
+
+    operation: OperationType | None = None
+    params: dict | None = None
+    steps: list[PipelineStep] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_PIPELINE_STEPS,
+        description="순서대로 적용할 작업 목록. 디코드/인코드는 한 번만 한다.",
+    )
+
+    @model_validator(mode="after")
+    def _operation_or_steps(self):
+        if (self.operation is None) == (self.steps is None):
+            raise ValueError("operation 또는 steps 중 하나만 지정해야 합니다")
+        return self
+
+    def to_operation(self) -> tuple[str, dict]:
+        """서비스/러너에 넘길 (operation, params). 파이프라인은 operation="pipeline"."""
+        if self.steps:
+            return PIPELINE, {"steps": [step.model_dump() for step in self.steps]}
+        return self.operation, self.params or {}
+
+
 _NOT_FOUND_404 = {"model": ErrorResponse, "description": "이미지를 찾을 수 없음"}
 _FORBIDDEN_403 = {"model": ErrorResponse, "description": "다른 사용자의 이미지에 접근"}
 
@@ -66,7 +95,8 @@ def get_image(
 @router.post(
     "/{image_id}/process",
     summary="이미지 처리",
-    description="지정한 이미지에 처리 작업(blur, resize, grayscale 등)을 적용한다.",
+    description="지정한 이미지에 처리 작업(blur, resize, grayscale 등)을 적용한다. "
+    "steps로 여러 작업을 지정하면 한 번의 디코드/인코드 안에서 순서대로 적용한다.",
     responses={
         400: {"model": ErrorResponse, "description": "지원하지 않는 작업(operation)"},
         401: AUTH_401,
@@ -80,9 +110,8 @@ def process_image(
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
 ):
-    return image_service.process_image(
-        image_id, req.operation, req.params or {}, current_user.id, session
-    )
+    operation, params = req.to_operation()
+    return image_service.process_image(image_id, operation, params, current_user.id, session)
 
 
 @router.get(
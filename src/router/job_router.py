@@ -1,31 +1,78 @@
 """배치 처리 작업 API 라우터.
 
 여러 이미지를 한 번에 처리하는 배치 작업을 생성하고,
-작업 상태를 조회하고, 완료된 결과를 확인한다.
+작업 상태를 조회하고(폴링 또는 SSE 스트림), 완료된 결과를 확인하고,
+실패한 이미지만 다시 처리한다.
 """
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import ExitStack
+
 from fastapi import APIRouter, BackgroundTasks, Depends
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
 
-from core.constants import MethodType, OperationType
-from core.dependencies import get_current_user
+from core.config import settings
+from core.constants import MethodType
+from core.dependencies import authenticate, get_current_user, oauth2_scheme
 from core.exceptions import AUTH_401, ErrorResponse
 from model.database import get_session
 from model.user import User
+from processor.operations import OperationType
+from processor.pipeline import PIPELINE
+from router.image_router import MAX_PIPELINE_STEPS, PipelineStep
 from service import job_service
+from service.job_events import TERMINAL_STATUSES, events, pollers
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
 
 class BatchRequest(BaseModel):
+    """단일 작업(operation + params) 또는 파이프라인(steps) 중 하나를 지정한다.
+
+    둘 다 생략하면 기존 동작대로 operation="blur".
+    """
+
     image_ids: list[int] = Field(min_length=1)
-    operation: OperationType = "blur"
+    operation: OperationType | None = Field(default=None, description="steps가 없으면 blur")
     params: dict | None = None
-    method: MethodType = "sync"
-    workers: int = Field(default=4, ge=1, le=16)
+    method: MethodType = Field(
+        default="sync",
+        description="auto면 이미지 수/크기, operation, GIL 상태, 벤치마크 기록으로 고른다.",
+    )
+    workers: int = Field(default=4, ge=1, le=16, description="auto일 때는 워커 수 상한")
+    priority: int = Field(
+        default=0,
+        ge=0,
+        le=9,
+        description="높을수록 먼저. 같은 사용자의 작업 사이에서는 먼저 차례를 받고, "
+        "사용자 사이에서는 한 라운드에 받는 몫이 (1 + priority)배가 된다.",
+    )
+    steps: list[PipelineStep] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=MAX_PIPELINE_STEPS,
+        description="operation/params 대신 이 작업들을 순서대로 적용한다.",
+    )
+
+    @model_validator(mode="after")
+    def _operation_or_steps(self):
+        if self.operation is not None and self.steps is not None:
+            raise ValueError("operation 또는 steps 중 하나만 지정해야 합니다")
+        return self
+
+    def to_operation(self) -> tuple[str, dict | None]:
+        if self.steps:
+            return PIPELINE, {"steps": [step.model_dump() for step in self.steps]}
+        return self.operation or "blur", self.params
 
 
+# 이벤트가 없을 때 연결 유지용 주석 줄을 보내는 간격 (프록시 idle timeout 방지)
+SSE_KEEPALIVE_SECONDS = 15.0
+
 _NOT_FOUND_404 = {"model": ErrorResponse, "description": "작업을 찾을 수 없음"}
 _FORBIDDEN_403 = {"model": ErrorResponse, "description": "다른 사용자의 작업에 접근"}
 
@@ -35,7 +82,8 @@ _FORBIDDEN_403 = {"model": ErrorResponse, "description": "다른 사용자의 
     status_code=202,
     summary="배치 작업 생성",
     description="여러 이미지를 지정한 동시성 방식으로 일괄 처리하는 작업을 생성한다. "
-    "202 Accepted와 함께 job_id를 즉시 반환하고, 처리는 백그라운드에서 진행된다.",
+    "202 Accepted와 함께 job_id를 즉시 반환하고, 처리는 백그라운드에서 진행된다. "
+    "JOB_QUEUE=db면 작업은 queued로 저장되고 별도 워커 프로세스가 가져가 처리한다.",
     responses={401: AUTH_401},
 )
 def create_batch_job(
@@ -44,16 +92,19 @@ def create_batch_job(
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
 ):
+    operation, params = req.to_operation()
     job = job_service.create_job(
         image_ids=req.image_ids,
-        operation=req.operation,
-        params=req.params,
+        operation=operation,
+        params=params,
         method=req.method,
         workers=req.workers,
         user_id=current_user.id,
         session=session,
+        priority=req.priority,
     )
-    background_tasks.add_task(job_service.process_job, job.id)
+    if settings.JOB_QUEUE == "background":
+        background_tasks.add_task(job_service.process_job, job.id)
     return job
 
 
@@ -73,7 +124,9 @@ def list_jobs(
 @router.get(
     "/{job_id}",
     summary="작업 상태 조회",
-    description="작업 ID로 상태(queued/processing/completed/failed), 진행률, 소요 시간을 조회한다.",
+    description="작업 ID로 상태(queued/processing/completed/failed/cancelled), 진행률"
+    "(processed_count/failed_count), 소요 시간을 조회한다. completed여도 failed_count > 0이면 "
+    "일부 이미지가 실패한 것이다.",
     responses={401: AUTH_401, 403: _FORBIDDEN_403, 404: _NOT_FOUND_404},
 )
 def get_job(
@@ -84,11 +137,137 @@ def get_job(
     return job_service.get_job(job_id, current_user.id, session)
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _event_stream(job_id: int) -> AsyncIterator[str]:
+    """작업 이벤트를 SSE로 내보낸다. 최종 status(completed/failed)를 보내면 끝난다.
+
+    구독을 먼저 시작한 뒤 현재 상태를 읽어 보내므로 그 사이의 이벤트를 놓치지 않는다.
+    JOB_QUEUE=db면 이벤트가 워커 프로세스에서 나므로 작업마다 공유하는 poller가 작업 행을
+    JOB_POLL_SECONDS마다 읽어 status 이벤트를 보낸다 (image 이벤트 없음, job_events 참고).
+    """
+    with ExitStack() as stack:
+        sub = stack.enter_context(events.subscribe(job_id))
+        if settings.JOB_QUEUE == "db":
+            stack.enter_context(
+                pollers.watch(job_id, job_service.load_snapshot, settings.JOB_POLL_SECONDS)
+            )
+        last = await run_in_threadpool(job_service.load_snapshot, job_id)
+        yield _sse("status", last)
+        if last["status"] in TERMINAL_STATUSES:
+            return
+        while True:
+            item = await sub.get(SSE_KEEPALIVE_SECONDS)
+            if item is None:
+                yield ": keepalive\n\n"
+                continue
+            event, data = item
+            if event == "status":
+                if data == last:  # poller가 이미 보낸 상태를 다시 읽은 경우
+                    continue
+                last = data
+            yield _sse(event, data)
+            if event == "status" and data["status"] in TERMINAL_STATUSES:
+                return
+
+
+@router.get(
+    "/{job_id}/events",
+    summary="작업 진행 스트림 (SSE)",
+    description="작업 진행을 Server-Sent Events로 보낸다. 연결 직후 현재 상태(event: status)를 "
+    "보내고, 이후 이미지가 끝날 때마다 event: image(image_id, status, output_path, error, "
+    "processed_count, failed_count), "
+    "상태가 바뀌면 event: status를 보낸다. completed/failed status를 보낸 뒤 스트림을 닫는다. "
+    "인증과 소유권 확인은 연결할 때 한 번만 한다. JOB_QUEUE=db면 작업을 워커 프로세스가 "
+    "실행하므로 image 이벤트 없이 JOB_POLL_SECONDS 간격의 status 이벤트만 보낸다.",
+    response_class=StreamingResponse,
+    responses={401: AUTH_401, 403: _FORBIDDEN_403, 404: _NOT_FOUND_404},
+)
+def stream_job_events(
+    job_id: int,
+    token: str = Depends(oauth2_scheme),
+    # 스트림이 열려 있는 동안 커넥션을 잡고 있지 않도록 응답 전에 세션을 닫는다
+    session: Session = Depends(get_session, scope="function"),
+):
+    current_user = authenticate(token, session)
+    job_service.get_job(job_id, current_user.id, session)
+    return StreamingResponse(
+        _event_stream(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/{job_id}/cancel",
+    summary="작업 취소",
+    description="queued 작업은 바로 cancelled가 된다. processing 작업은 cancel_requested가 "
+    "기록되고, 실행 중인 이미지까지만 처리한 뒤 cancelled로 끝난다 (처리된 이미지는 유지). "
+    "이미 끝난 작업이면 409 에러.",
+    responses={
+        401: AUTH_401,
+        403: _FORBIDDEN_403,
+        404: _NOT_FOUND_404,
+        409: {"model": ErrorResponse, "description": "이미 끝난 작업"},
+    },
+)
+def cancel_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    return job_service.cancel_job(job_id, current_user.id, session)
+
+
+@router.post(
+    "/{job_id}/retry",
+    status_code=202,
+    summary="실패한 이미지 재시도",
+    description="끝난 작업에서 실패한 이미지(취소된 작업이면 처리하지 못한 이미지 포함)만 다시 "
+    "처리한다. 이미 완료된 이미지는 다시 계산하지 않는다. 작업은 queued로 돌아가 배치 작업 "
+    "생성과 같은 방식(BackgroundTasks 또는 워커)으로 처리된다. 처리 중인 작업이거나 다시 처리할 "
+    "이미지가 없으면 409 에러.",
+    responses={
+        401: AUTH_401,
+        403: _FORBIDDEN_403,
+        404: _NOT_FOUND_404,
+        409: {"model": ErrorResponse, "description": "처리 중이거나 다시 처리할 이미지 없음"},
+    },
+)
+def retry_job(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    job = job_service.retry_job(job_id, current_user.id, session)
+    if settings.JOB_QUEUE == "background":
+        background_tasks.add_task(job_service.process_job, job.id)
+    return job
+
+
+@router.get(
+    "/{job_id}/images",
+    summary="이미지별 처리 결과",
+    description="작업의 이미지마다 상태(pending/completed/failed), 결과 경로, 에러 메시지, "
+    "재시도 횟수를 반환한다.",
+    responses={401: AUTH_401, 403: _FORBIDDEN_403, 404: _NOT_FOUND_404},
+)
+def list_job_images(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+):
+    return job_service.list_job_images(job_id, current_user.id, session)
+
+
 @router.get(
     "/{job_id}/result",
     summary="작업 결과 조회",
-    description="완료된 배치 작업의 처리 결과(소요 시간, 처리된 이미지 수 등)를 반환한다. "
-    "작업이 아직 완료되지 않았으면 400 에러.",
+    description="완료된 배치 작업에서 처리에 성공한 이미지 목록을 반환한다 "
+    "(실패한 이미지는 GET /{job_id}/images). 작업이 아직 완료되지 않았으면 400 에러.",
     responses={
         400: {"model": ErrorResponse, "description": "작업이 아직 완료되지 않음"},
         401: AUTH_401,
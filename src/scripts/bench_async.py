@@ -2,6 +2,8 @@
 asyncio vs sync 벤치마크.
 
 CPU-bound 작업에서 asyncio의 한계를 숫자로 확인한다.
+각 방식이 도는 동안 이벤트 루프 지연(LoopLagProbe)도 함께 잰다:
+루프가 예정보다 늦게 깨어날수록 같은 서버의 다른 요청 응답이 늦어진다.
 
 사용법 (컨테이너 내부):
     cd /app/src && uv run python -m scripts.bench_async
@@ -11,8 +13,8 @@ import asyncio
 import os
 import sys
 
+from processor.async_runner import LoopLagProbe, iter_with_executor, run_with_executor
 from processor.async_runner import run as async_run
-from processor.async_runner import run_with_executor
 from processor.sync_runner import run as sync_run
 from utility.timer import timer
 
@@ -37,34 +39,61 @@ async def main():
 
     print(f"Images: {count}장 | Operation: {operation}")
     print(f"GIL enabled: {sys._is_gil_enabled()}")
-    print("=" * 55)
+    print("=" * 75)
+    print(f"  {'방식':<34s}  {'시간':>7s}  {'배율':>7s}  {'lag max':>9s}  {'lag mean':>9s}")
 
-    # 1. sync (기준선)
-    with timer("sync") as t:
+    async def measured(label: str, coro_fn, sync_time: float | None = None) -> float:
+        probe = LoopLagProbe()
+        await probe.start()
+        with timer(label) as t:
+            await coro_fn()
+        await asyncio.sleep(probe.interval * 2)  # 마지막 지연까지 기록되도록 한 번 더 깨운다
+        await probe.stop()
+        ratio = f"{t.elapsed / sync_time:.2f}x" if sync_time else "기준선"
+        print(
+            f"  {label:<34s}  {t.elapsed:>6.3f}s  {ratio:>7s}"
+            f"  {probe.max_ms or 0:>7.1f}ms  {probe.mean_ms or 0:>7.2f}ms"
+        )
+        return t.elapsed
+
+    # 1. sync (기준선) — 루프 위에서 직접 실행하므로 루프가 통째로 막힌다
+    async def _sync():
         sync_run(images, operation, params)
-    sync_time = t.elapsed
-    print(f"  {'sync':<30s}  {t.elapsed:.3f}s  (기준선)")
+
+    sync_time = await measured("sync (루프에서 직접)", _sync)
 
     # 2. asyncio (순수 async — CPU-bound에선 순차와 동일)
-    with timer("async (pure)") as t:
-        await async_run(images, operation, params)
-    print(f"  {'async (pure)':<30s}  {t.elapsed:.3f}s  ({t.elapsed / sync_time:.2f}x)")
+    await measured("async (pure)", lambda: async_run(images, operation, params), sync_time)
 
     # 3. asyncio + run_in_executor (스레드풀 위임)
     for workers in [1, 2, 4]:
-        label = f"async + executor ({workers} workers)"
-        with timer(label) as t:
-            await run_with_executor(images, operation, params, workers=workers)
-        print(f"  {label:<30s}  {t.elapsed:.3f}s  ({t.elapsed / sync_time:.2f}x)")
-
-    print("=" * 55)
+        await measured(
+            f"async + executor ({workers} workers)",
+            lambda w=workers: run_with_executor(images, operation, params, workers=w),
+            sync_time,
+        )
+
+    # 4. semaphore로 동시 위임 수를 제한한 스트리밍 (API의 async method와 같은 경로)
+    for workers in [2, 4]:
+        async def _streamed(w=workers):
+            semaphore = asyncio.Semaphore(w)
+            async for _ in iter_with_executor(
+                images, operation, params, workers=w, semaphore=semaphore
+            ):
+                pass
+
+        await measured(f"async stream (semaphore={workers})", _streamed, sync_time)
+
+    print("=" * 75)
     print()
     print("분석:")
     print("  - async (pure): sync와 거의 동일 → CPU-bound에선 asyncio가 무의미")
+    print("  - lag: 루프가 예정보다 늦게 깨어난 시간. sync/pure는 실행 내내 루프를 막는다")
     if sys._is_gil_enabled():
         print("  - executor: GIL=1이라 스레드를 늘려도 개선 없음")
+        print("    (Python 구간에서 루프 스레드가 GIL을 기다리므로 lag도 남는다)")
     else:
-        print("  - executor: GIL=0이라 worker 수에 비례해서 빨라짐")
+        print("  - executor: GIL=0이라 worker 수에 비례해서 빨라짐, 루프 lag도 수 ms 이내")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+"""
+동일 요청 합치기(single-flight) 부하 테스트.
+
+같은 이미지 + 같은 operation 처리 요청 N개가 동시에 들어오는 상황을 흉내 낸다
+(인기 이미지 썸네일 생성, 새로고침 폭주 등). 각 클라이언트는 자기 DB 세션으로
+image_service.process_image를 호출하고, Barrier로 동시에 출발시킨다.
+
+COALESCE_REQUESTS를 끄고/켜서 다음을 비교한다.
+  - wall: 모든 요청이 끝날 때까지 걸린 시간
+  - CPU: 프로세스 CPU 시간 (모든 스레드 합) — 합치기로 절약한 계산량
+  - computed: 실제로 디코드/처리/인코드한 횟수
+
+라운드마다 빈 OUTPUT_DIR과 빈 디코드 캐시로 시작해 첫 요청은 항상 디코드부터 한다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_coalesce
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlmodel import Session, SQLModel, create_engine
+
+import model.image  # noqa: F401 — 테이블 등록
+import model.user  # noqa: F401 — 테이블 등록
+from core.config import settings
+from model.image import ImageRecord
+from model.user import User
+from processor.decode_cache import cache as decode_cache
+from processor.singleflight import inflight
+from service import image_service
+
+FIXTURES_DIR = "/app/tests/fixtures"
+CLIENTS = [1, 4, 8, 16]
+OPERATION = "blur"
+PARAMS = {"radius": 10}
+REPEAT = 3
+
+
+def _first_image() -> str:
+    names = sorted(f for f in os.listdir(FIXTURES_DIR) if f.endswith((".jpg", ".jpeg", ".png")))
+    return os.path.join(FIXTURES_DIR, names[0])
+
+
+def _setup(workdir: str, image: str) -> tuple[object, int, int]:
+    engine = create_engine(
+        f"sqlite:///{workdir}/bench.db", connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = User(email="bench@example.com", hashed_password="-")
+        session.add(user)
+        session.commit()
+        record = ImageRecord(filename="bench", original_path=image, user_id=user.id)
+        session.add(record)
+        session.commit()
+        return engine, record.id, user.id
+
+
+def _round(clients: int, coalesce: bool, image: str) -> dict:
+    settings.COALESCE_REQUESTS = coalesce
+    decode_cache.clear()
+    with tempfile.TemporaryDirectory() as workdir:
+        settings.OUTPUT_DIR = os.path.join(workdir, "outputs")
+        engine, image_id, user_id = _setup(workdir, image)
+        barrier = threading.Barrier(clients)
+        computed = 0
+        lock = threading.Lock()
+        original_apply = image_service._apply
+
+        def _counting_apply(*args, **kwargs):
+            nonlocal computed
+            with lock:
+                computed += 1
+            return original_apply(*args, **kwargs)
+
+        def _client(_: int) -> str:
+            with Session(engine) as session:
+                barrier.wait()
+                record = image_service.process_image(
+                    image_id, OPERATION, PARAMS, user_id, session
+                )
+                return record.output_path
+
+        image_service._apply = _counting_apply
+        try:
+            cpu_start, wall_start = time.process_time(), time.perf_counter()
+            with ThreadPoolExecutor(max_workers=clients) as pool:
+                outputs = set(pool.map(_client, range(clients)))
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+        finally:
+            image_service._apply = original_apply
+            engine.dispose()
+
+    assert len(outputs) == 1, "모든 요청이 같은 결과 파일을 받아야 한다"
+    return {"wall": wall, "cpu": cpu, "computed": computed}
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    image = _first_image()
+    original = (settings.COALESCE_REQUESTS, settings.OUTPUT_DIR)
+
+    print(
+        f"동일 요청 합치기 부하 테스트: {OPERATION} {PARAMS} | {os.path.basename(image)} "
+        f"| GIL: {gil_status} | best of {REPEAT}"
+    )
+    print("=" * 72)
+    print(
+        f"{'clients':>7s}  {'coalesce':>8s}  {'wall':>8s}  {'CPU':>8s}  "
+        f"{'computed':>8s}  {'CPU saved':>9s}"
+    )
+    print("-" * 72)
+
+    try:
+        for clients in CLIENTS:
+            baseline = None
+            for coalesce in (False, True):
+                runs = [_round(clients, coalesce, image) for _ in range(REPEAT)]
+                best = min(runs, key=lambda r: r["wall"])
+                cpu = min(r["cpu"] for r in runs)
+                if baseline is None:
+                    baseline = cpu
+                saved = f"{(1 - cpu / baseline) * 100:>8.1f}%" if baseline else f"{'-':>9s}"
+                print(
+                    f"{clients:>7d}  {'on' if coalesce else 'off':>8s}  {best['wall']:>7.3f}s  "
+                    f"{cpu:>7.3f}s  {best['computed']:>8d}  {saved}"
+                )
+    finally:
+        settings.COALESCE_REQUESTS, settings.OUTPUT_DIR = original
+
+    print()
+    print(f"single-flight 통계: {inflight.stats()}")
+    print("참고:")
+    print("  - off에서도 결과 캐시가 켜져 있어 늦게 도착한 요청은 적중할 수 있다 (computed < clients)")
+    print("  - 합치기는 프로세스 단위라 uvicorn 워커가 여러 개면 워커마다 한 번씩 계산한다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+decode-time 축소(JPEG draft) 벤치마크.
+
+resize 작업에서 전체 해상도 디코드 후 LANCZOS 축소하는 경우와,
+JPEG draft로 목표 크기에 가까운 해상도만 디코드하는 경우를 방식별로 비교한다.
+
+픽스처는 PNG라 draft가 적용되지 않으므로, 큰 JPEG(24MP)를 임시로 생성해 사용한다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_decode_draft
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from core.config import settings
+from processor import frethread_runner, mp_runner, sync_runner, thread_runner
+
+IMAGE_COUNT = 10
+IMAGE_SIZE = (6000, 4000)  # 24MP
+WORKERS = 4
+OPERATION = "resize"
+PARAMS = {"width": 320, "height": 240}
+
+
+def _make_jpegs(directory: str, count: int) -> list[str]:
+    base = Image.effect_noise(IMAGE_SIZE, 48).convert("RGB")
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"large_{i}.jpg")
+        base.save(path, "JPEG", quality=90)
+        paths.append(path)
+    return paths
+
+
+def _bench(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    print(f"decode draft 벤치마크: {IMAGE_COUNT}장 {IMAGE_SIZE[0]}x{IMAGE_SIZE[1]} JPEG → {OPERATION} {PARAMS}")
+    print(f"workers={WORKERS} | GIL: {gil_status}")
+    print("=" * 70)
+
+    runners = [
+        ("sync", lambda paths: sync_runner.run(paths, OPERATION, PARAMS)),
+        ("threading", lambda paths: thread_runner.run(paths, OPERATION, PARAMS, workers=WORKERS)),
+        ("multiprocessing", lambda paths: mp_runner.run(paths, OPERATION, PARAMS, workers=WORKERS)),
+    ]
+    if not sys._is_gil_enabled():
+        runners.append(
+            ("frethread", lambda paths: frethread_runner.run(paths, OPERATION, PARAMS, workers=WORKERS))
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_jpegs(tmp, IMAGE_COUNT)
+
+        print(f"\n{'방식':<18s}  {'전체 디코드':>10s}  {'draft':>8s}  {'절감':>8s}")
+        print("-" * 52)
+        for label, fn in runners:
+            settings.DECODE_DRAFT = False
+            full = _bench(lambda: fn(paths))
+            settings.DECODE_DRAFT = True
+            draft = _bench(lambda: fn(paths))
+            saved = (1 - draft / full) * 100 if full > 0 else 0
+            print(f"{label:<18s}  {full:>9.3f}s  {draft:>7.3f}s  {saved:>7.1f}%")
+
+    print()
+    print("분석:")
+    print("  - draft는 JPEG를 1/2, 1/4, 1/8 스케일로 디코드해 IDCT와 LANCZOS 입력 크기를 함께 줄인다")
+    print("  - multiprocessing은 워커가 fork 시점의 settings를 복사하므로 값 변경 후 새 풀에서 측정된다")
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.set_start_method("fork", force=True)
+    main()
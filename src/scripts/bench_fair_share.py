@@ -0,0 +1,179 @@
+"""
+배치 작업 공정 스케줄링 벤치마크: 큰 작업이 도는 동안 작은 작업의 지연 시간.
+
+사용자 1이 큰 작업(LARGE_IMAGES장)을 먼저 넣고, 잠시 뒤부터 다른 사용자들이 작은 작업
+(SMALL_IMAGES장, 사용자마다 하나)을 SMALL_INTERVAL초 간격으로 넣는다.
+작업마다 스레드에서 process_job을 실행한다 (BackgroundTasks와 같은 방식).
+모든 작업은 같은 스레드 풀(pool_manager)을 쓴다.
+
+JOB_FAIR_SCHEDULING을 끄고/켜서 비교한다.
+  - off: 작업마다 남은 이미지를 한 번에 제출 → 작은 작업이 큰 작업의 대기열 뒤에 선다
+  - on:  JOB_SLICE_IMAGES장 조각마다 사용자별 round-robin으로 차례를 받는다
+측정: 작은 작업 지연(제출 → 완료)의 p50/p95/max, 큰 작업 wall time.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_fair_share
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from sqlmodel import Session, SQLModel, create_engine
+
+import model.image  # noqa: F401 — 테이블 등록
+import model.job  # noqa: F401 — 테이블 등록
+import model.user  # noqa: F401 — 테이블 등록
+from core.config import settings
+from model.image import ImageRecord
+from model.job import Job
+from model.user import User
+from processor.pool_manager import pool_manager
+from service import job_service
+
+FIXTURES_DIR = "/app/tests/fixtures"
+LARGE_IMAGES = 160
+SMALL_IMAGES = 4
+SMALL_JOBS = 10
+SMALL_START = 0.5      # 큰 작업 제출 후 첫 작은 작업까지 (초)
+SMALL_INTERVAL = 0.25  # 작은 작업 제출 간격 (초)
+OPERATION = "blur"
+METHOD = "threading"
+WORKERS = 4
+
+
+def _images() -> list[str]:
+    names = sorted(f for f in os.listdir(FIXTURES_DIR) if f.endswith((".jpg", ".jpeg", ".png")))
+    return [os.path.join(FIXTURES_DIR, n) for n in names]
+
+
+def _create(session: Session, user_id: int, images: list[str], count: int) -> int:
+    records = [
+        ImageRecord(filename=f"fair-{i}", original_path=images[i % len(images)], user_id=user_id)
+        for i in range(count)
+    ]
+    session.add_all(records)
+    session.commit()
+    job = Job(
+        user_id=user_id,
+        operation=OPERATION,
+        method=METHOD,
+        workers=WORKERS,
+        image_ids=json.dumps([r.id for r in records]),
+        image_count=count,
+    )
+    session.add(job)
+    session.commit()
+    return job.id
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+def _round(fair: bool, images: list[str]) -> dict:
+    settings.JOB_FAIR_SCHEDULING = fair
+    with tempfile.TemporaryDirectory() as workdir:
+        settings.OUTPUT_DIR = os.path.join(workdir, "outputs")
+        engine = create_engine(
+            f"sqlite:///{workdir}/bench.db",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        SQLModel.metadata.create_all(engine)
+        job_service._engine = engine
+
+        with Session(engine) as session:
+            users = [
+                User(email=f"user{n}@example.com", hashed_password="-")
+                for n in range(SMALL_JOBS + 1)
+            ]
+            session.add_all(users)
+            session.commit()
+            large = _create(session, users[0].id, images, LARGE_IMAGES)
+            smalls = [_create(session, u.id, images, SMALL_IMAGES) for u in users[1:]]
+
+        submitted: dict[int, float] = {}
+        finished: dict[int, float] = {}
+        lock = threading.Lock()
+
+        def _run(job_id: int) -> None:
+            job_service.process_job(job_id)
+            with lock:
+                finished[job_id] = time.perf_counter()
+
+        threads = []
+
+        def _submit(job_id: int) -> None:
+            submitted[job_id] = time.perf_counter()
+            t = threading.Thread(target=_run, args=(job_id,))
+            t.start()
+            threads.append(t)
+
+        start = time.perf_counter()
+        _submit(large)
+        time.sleep(SMALL_START)
+        for job_id in smalls:
+            _submit(job_id)
+            time.sleep(SMALL_INTERVAL)
+        for t in threads:
+            t.join()
+
+        with Session(engine) as session:
+            statuses = {session.get(Job, j).status for j in [large, *smalls]}
+        assert statuses == {"completed"}, statuses
+        job_service._engine = None
+        engine.dispose()
+
+    latencies = [finished[j] - submitted[j] for j in smalls]
+    return {
+        "p50": statistics.median(latencies),
+        "p95": _percentile(latencies, 0.95),
+        "max": max(latencies),
+        "large": finished[large] - start,
+    }
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    images = _images()
+    original = (
+        settings.JOB_FAIR_SCHEDULING,
+        settings.OUTPUT_DIR,
+        settings.RESULT_CACHE_ENABLED,
+    )
+    settings.RESULT_CACHE_ENABLED = False  # 같은 원본을 반복해 쓰므로 캐시 적중을 막는다
+    pool_manager.start({METHOD: WORKERS})
+
+    print(
+        f"공정 스케줄링 벤치마크: {OPERATION} | {METHOD} x{WORKERS} | "
+        f"큰 작업 {LARGE_IMAGES}장 + 작은 작업 {SMALL_JOBS}개 x {SMALL_IMAGES}장 | GIL: {gil_status}"
+    )
+    print(f"slice {settings.JOB_SLICE_IMAGES}장, slots {settings.JOB_SCHEDULER_SLOTS}")
+    print("=" * 64)
+    print(f"{'fair':>5s}  {'small p50':>10s}  {'small p95':>10s}  {'small max':>10s}  {'large':>8s}")
+    print("-" * 64)
+
+    try:
+        for fair in (False, True):
+            r = _round(fair, images)
+            print(
+                f"{'on' if fair else 'off':>5s}  {r['p50']:>9.2f}s  {r['p95']:>9.2f}s  "
+                f"{r['max']:>9.2f}s  {r['large']:>7.2f}s"
+            )
+    finally:
+        settings.JOB_FAIR_SCHEDULING, settings.OUTPUT_DIR, settings.RESULT_CACHE_ENABLED = original
+        pool_manager.shutdown()
+
+    print()
+    print("참고:")
+    print("  - 작은 작업 지연 = 제출부터 완료까지. off면 큰 작업이 풀 대기열을 먼저 채운다")
+    print("  - on이면 큰 작업 wall time이 조금 늘 수 있다 (조각 경계에서 풀이 잠깐 빈다)")
+
+
+if __name__ == "__main__":
+    main()
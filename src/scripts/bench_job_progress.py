@@ -0,0 +1,166 @@
+"""
+배치 작업 진행률 묶어 쓰기 벤치마크.
+
+process_job의 진행률/이미지 완료 기록을 JOB_PROGRESS_FLUSH_COUNT장마다 한 트랜잭션으로 쓸 때
+commit 수와 작업 wall time을 비교한다. FLUSH_COUNT=1이 예전 동작(이미지마다 commit)이다.
+
+작업 여러 개를 동시에 돌리면(jobs 열) SQLite 쓰기 잠금을 서로 기다리므로 commit 수의 차이가
+wall time 차이로 드러난다. 같은 원본을 반복해 쓰므로 결과 캐시는 끄고, 라운드마다 빈 OUTPUT_DIR을 쓴다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_job_progress
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+import model.image  # noqa: F401 — 테이블 등록
+import model.job  # noqa: F401 — 테이블 등록
+import model.user  # noqa: F401 — 테이블 등록
+from core.config import settings
+from model.image import ImageRecord
+from model.job import Job
+from model.user import User
+from service import job_service
+
+FIXTURES_DIR = "/app/tests/fixtures"
+IMAGES_PER_JOB = 64
+FLUSH_COUNTS = [1, 8, 32, 128]
+PARALLEL_JOBS = [1, 4]
+OPERATION = "grayscale"
+METHOD = "threading"
+WORKERS = 4
+
+
+def _images() -> list[str]:
+    names = sorted(f for f in os.listdir(FIXTURES_DIR) if f.endswith((".jpg", ".jpeg", ".png")))
+    return [os.path.join(FIXTURES_DIR, n) for n in names]
+
+
+def _setup(workdir: str, images: list[str], jobs: int) -> tuple[object, list[int]]:
+    engine = create_engine(
+        f"sqlite:///{workdir}/bench.db", connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = User(email="bench@example.com", hashed_password="-")
+        session.add(user)
+        session.commit()
+        job_ids = []
+        for _ in range(jobs):
+            records = [
+                ImageRecord(
+                    filename=f"bench-{i}",
+                    original_path=images[i % len(images)],
+                    user_id=user.id,
+                )
+                for i in range(IMAGES_PER_JOB)
+            ]
+            session.add_all(records)
+            session.commit()
+            job = Job(
+                user_id=user.id,
+                operation=OPERATION,
+                method=METHOD,
+                workers=WORKERS,
+                image_ids=json.dumps([r.id for r in records]),
+                image_count=len(records),
+            )
+            session.add(job)
+            session.commit()
+            job_ids.append(job.id)
+    return engine, job_ids
+
+
+def _round(flush_count: int, jobs: int, images: list[str]) -> dict:
+    settings.JOB_PROGRESS_FLUSH_COUNT = flush_count
+    with tempfile.TemporaryDirectory() as workdir:
+        settings.OUTPUT_DIR = os.path.join(workdir, "outputs")
+        engine, job_ids = _setup(workdir, images, jobs)
+        job_service._engine = engine
+        commits = 0
+        lock = threading.Lock()
+
+        def _count(_conn):
+            nonlocal commits
+            with lock:
+                commits += 1
+
+        event.listen(engine, "commit", _count)
+        try:
+            start = time.perf_counter()
+            threads = [
+                threading.Thread(target=job_service.process_job, args=(job_id,))
+                for job_id in job_ids
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            wall = time.perf_counter() - start
+        finally:
+            event.remove(engine, "commit", _count)
+            job_service._engine = None
+
+        with Session(engine) as session:
+            done = [session.get(Job, job_id) for job_id in job_ids]
+            assert all(j.status == "completed" for j in done), [j.error_message for j in done]
+            durations = [j.duration for j in done]
+        engine.dispose()
+
+    return {
+        "wall": wall,
+        "job_wall": sum(durations) / len(durations),
+        "commits_per_job": commits / jobs,
+    }
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    images = _images()
+    original = (
+        settings.JOB_PROGRESS_FLUSH_COUNT,
+        settings.OUTPUT_DIR,
+        settings.RESULT_CACHE_ENABLED,
+    )
+    settings.RESULT_CACHE_ENABLED = False
+
+    print(
+        f"진행률 묶어 쓰기 벤치마크: {OPERATION} | {METHOD} x{WORKERS} | "
+        f"작업당 {IMAGES_PER_JOB}장 | GIL: {gil_status}"
+    )
+    print("=" * 64)
+    print(f"{'jobs':>4s}  {'flush':>5s}  {'commits/job':>11s}  {'job wall':>9s}  {'total':>8s}")
+    print("-" * 64)
+
+    try:
+        for jobs in PARALLEL_JOBS:
+            for flush_count in FLUSH_COUNTS:
+                r = _round(flush_count, jobs, images)
+                print(
+                    f"{jobs:>4d}  {flush_count:>5d}  {r['commits_per_job']:>11.1f}  "
+                    f"{r['job_wall']:>8.3f}s  {r['wall']:>7.3f}s"
+                )
+            print("-" * 64)
+    finally:
+        (
+            settings.JOB_PROGRESS_FLUSH_COUNT,
+            settings.OUTPUT_DIR,
+            settings.RESULT_CACHE_ENABLED,
+        ) = original
+
+    print("참고:")
+    print("  - commits/job = 시작 1 + flush 횟수 (마지막 flush가 최종 상태도 함께 기록)")
+    print(f"  - JOB_PROGRESS_FLUSH_SECONDS={settings.JOB_PROGRESS_FLUSH_SECONDS}s가 먼저 지나면")
+    print("    FLUSH_COUNT에 못 미쳐도 기록하므로 느린 작업은 commit이 더 많을 수 있다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+작업 진행 확인 부하 테스트: 폴링 vs SSE push.
+
+배치 작업 하나가 도는 동안 N명의 클라이언트가 진행률을 지켜보는 상황을 흉내 낸다.
+  - poll: 클라이언트마다 POLL_INTERVAL초마다 GET /api/jobs/{id}
+          (요청마다 JWT 검증 + 사용자 조회 + 작업 조회)
+  - push: 클라이언트마다 GET /api/jobs/{id}/events 연결 하나
+          (연결할 때 한 번 조회하고 이후는 프로세스 내부 이벤트만 받는다)
+
+앱을 uvicorn으로 띄우고(스레드) 임시 SQLite DB를 쓰게 한 뒤, 엔진의 SQL 실행 횟수를 센다.
+클라이언트 0명 라운드의 쿼리 수(작업 자체가 쓰는 쿼리)를 빼서 "진행 확인에 든 쿼리"만 비교한다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_job_watch
+"""
+
+import os
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import closing
+
+import httpx
+import uvicorn
+from loguru import logger
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+from core.config import settings
+from main import app
+from model.database import get_session
+from model.image import ImageRecord
+from service import job_service
+
+FIXTURES_DIR = "/app/tests/fixtures"
+CLIENTS = [0, 10, 50, 100]
+IMAGES_PER_JOB = 48
+OPERATION = "blur"
+METHOD = "threading"
+WORKERS = 2
+POLL_INTERVAL = 0.5
+
+
+def _images() -> list[str]:
+    names = sorted(f for f in os.listdir(FIXTURES_DIR) if f.endswith((".jpg", ".jpeg", ".png")))
+    return [os.path.join(FIXTURES_DIR, n) for n in names]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class _Server:
+    """uvicorn을 백그라운드 스레드에서 실행한다 (lifespan 없이: 풀/테이블 준비는 여기서 함)."""
+
+    def __init__(self) -> None:
+        self.port = _free_port()
+        config = uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, lifespan="off", log_level="warning"
+        )
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "_Server":
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def _poll(base: str, headers: dict, job_id: int) -> int:
+    requests = 0
+    with httpx.Client(base_url=base, headers=headers, timeout=60) as client:
+        while True:
+            status = client.get(f"/api/jobs/{job_id}").json()["status"]
+            requests += 1
+            if status in ("completed", "failed"):
+                return requests
+            time.sleep(POLL_INTERVAL)
+
+
+def _push(base: str, headers: dict, job_id: int) -> int:
+    received = 0
+    with httpx.Client(base_url=base, headers=headers, timeout=60) as client:
+        with client.stream("GET", f"/api/jobs/{job_id}/events") as resp:
+            for line in resp.iter_lines():
+                if line.startswith("data: "):
+                    received += 1
+    return received
+
+
+def _wait_done(db_path: str, job_id: int) -> None:
+    """작업이 끝날 때까지 기다린다. 엔진을 거치지 않는 sqlite3 연결이라 쿼리 수에 들어가지 않는다."""
+    with closing(sqlite3.connect(db_path, timeout=30)) as conn:
+        while conn.execute("SELECT status FROM job WHERE id = ?", (job_id,)).fetchone()[0] not in (
+            "completed",
+            "failed",
+        ):
+            time.sleep(0.05)
+
+
+def _round(mode: str, clients: int, images: list[str], workdir: str) -> dict:
+    db_path = f"{workdir}/{mode}-{clients}.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    SQLModel.metadata.create_all(engine)
+
+    def _session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _session
+    job_service._engine = engine
+    settings.OUTPUT_DIR = os.path.join(workdir, f"outputs-{mode}-{clients}")
+
+    queries = 0
+    lock = threading.Lock()
+
+    def _count(*_args):
+        nonlocal queries
+        with lock:
+            queries += 1
+
+    try:
+        with _Server() as server, httpx.Client(base_url=server.url, timeout=60) as http:
+            account = {"email": "watch@example.com", "password": "watch-bench-1"}
+            http.post("/auth/register", json=account)
+            token = http.post(
+                "/auth/login", data={"username": account["email"], "password": account["password"]}
+            ).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+
+            with Session(engine) as session:
+                records = [
+                    ImageRecord(
+                        filename=f"watch-{i}", original_path=images[i % len(images)], user_id=1
+                    )
+                    for i in range(IMAGES_PER_JOB)
+                ]
+                session.add_all(records)
+                session.commit()
+                image_ids = [r.id for r in records]
+
+            event.listen(engine, "before_cursor_execute", _count)
+            start = time.perf_counter()
+            # BackgroundTasks로 응답 직후 처리가 시작되고, 그동안 클라이언트가 진행을 확인한다
+            job_id = http.post(
+                "/api/jobs/batch",
+                json={
+                    "image_ids": image_ids,
+                    "operation": OPERATION,
+                    "method": METHOD,
+                    "workers": WORKERS,
+                },
+                headers=headers,
+            ).json()["id"]
+
+            target = _poll if mode == "poll" else _push
+            results: list[int] = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(target(server.url, headers, job_id))
+                )
+                for _ in range(clients)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            _wait_done(db_path, job_id)
+            wall = time.perf_counter() - start
+            event.remove(engine, "before_cursor_execute", _count)
+    finally:
+        app.dependency_overrides.clear()
+        job_service._engine = None
+        engine.dispose()
+
+    return {"queries": queries, "wall": wall, "messages": sum(results)}
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    images = _images()
+    original = (settings.OUTPUT_DIR, settings.RESULT_CACHE_ENABLED, settings.JOB_QUEUE)
+    settings.RESULT_CACHE_ENABLED = False
+    settings.JOB_QUEUE = "background"
+    logger.disable("core.middleware")  # 스트림 요청마다 찍히는 slow 경고가 표를 가리지 않게
+
+    print(
+        f"진행 확인 부하 테스트: {OPERATION} x{IMAGES_PER_JOB}장 | {METHOD} x{WORKERS} | "
+        f"poll {POLL_INTERVAL}s | GIL: {gil_status}"
+    )
+    print("=" * 76)
+    print(
+        f"{'mode':>5s}  {'clients':>7s}  {'job wall':>9s}  {'queries':>8s}  "
+        f"{'watch q':>8s}  {'watch q/s':>9s}  {'msgs':>6s}"
+    )
+    print("-" * 76)
+
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            baseline = _round("poll", 0, images, workdir)["queries"]
+            for mode in ("poll", "push"):
+                for clients in CLIENTS[1:]:
+                    r = _round(mode, clients, images, workdir)
+                    watch = max(r["queries"] - baseline, 0)
+                    print(
+                        f"{mode:>5s}  {clients:>7d}  {r['wall']:>8.2f}s  {r['queries']:>8d}  "
+                        f"{watch:>8d}  {watch / r['wall']:>9.1f}  {r['messages']:>6d}"
+                    )
+                print("-" * 76)
+    finally:
+        settings.OUTPUT_DIR, settings.RESULT_CACHE_ENABLED, settings.JOB_QUEUE = original
+
+    print(f"작업 자체의 쿼리 (클라이언트 0명): {baseline}")
+    print("참고:")
+    print("  - watch q = 전체 쿼리 - 작업 자체의 쿼리 = 진행 확인 때문에 생긴 DB 조회")
+    print("  - push는 연결당 인증(사용자 조회) + 소유권 확인 + 현재 상태 조회 3회로 고정")
+    print("  - msgs: poll은 응답 수, push는 받은 이벤트 수 (이미지마다 1개 + status)")
+
+
+if __name__ == "__main__":
+    main()
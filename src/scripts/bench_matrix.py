@@ -1,7 +1,11 @@
 """
-4가지 동시성 방식 × 워커 수(1,2,4,8) 벤치마크 매트릭스.
+동시성 방식 × 워커 수(1,2,4,8) 벤치마크 매트릭스.
+
+sync/threading/multiprocessing에 더해 GIL=0이면 frethread,
+Python 3.14+면 interpreter(서브인터프리터)도 측정한다.
 
 Day 5 핵심 실험: free-threaded Python의 진짜 가치를 정량적으로 확인.
+blur 매트릭스 뒤에 watermark 행을 추가로 측정한다 (폰트/텍스트 마스크 캐시 효과 확인용).
 
 사용법 (컨테이너 내부):
     cd /app/src && uv run python -m scripts.bench_matrix
@@ -10,13 +14,21 @@ Day 5 핵심 실험: free-threaded Python의 진짜 가치를 정량적으로 
 import sys
 import time
 
-from processor import frethread_runner, mp_runner, sync_runner, thread_runner
+from core.config import settings
+from processor import (
+    frethread_runner,
+    interpreter_runner,
+    mp_runner,
+    sync_runner,
+    thread_runner,
+)
 
 FIXTURES_DIR = "/app/tests/fixtures"
 IMAGE_COUNT = 10
 WORKER_COUNTS = [1, 2, 4, 8]
 OPERATION = "blur"
 PARAMS = {"radius": 10}
+WATERMARK_WORKERS = 4
 
 
 def _get_image_paths(count: int) -> list[str]:
@@ -36,9 +48,27 @@ def _bench(label: str, fn) -> float:
     return elapsed
 
 
+def _watermark_rows(images: list[str], runners) -> None:
+    """watermark는 연산 자체가 가벼워 폰트 로딩/텍스트 렌더링 비용이 그대로 드러난다."""
+    from processor import resources
+
+    resources.clear()
+    w = WATERMARK_WORKERS
+    sync_time = _bench("watermark sync", lambda: sync_runner.run(images, "watermark"))
+    print(f"\n[watermark] {'방식':<25s}  {'workers':>7s}  {'시간':>8s}  {'배율':>8s}")
+    print("-" * 67)
+    print(f"{'':12s}{'sync':<25s}  {'1':>7s}  {sync_time:>7.3f}s  {'1.00x':>8s}")
+    for label, runner in runners:
+        t = _bench(f"watermark {label}", lambda r=runner: r.run(images, "watermark", workers=w))
+        print(f"{'':12s}{label:<25s}  {w:>7d}  {t:>7.3f}s  {t / sync_time:>7.2f}x")
+    stats = resources.stats()
+    print(f"{'':12s}(현재 프로세스 캐시: mask hit {stats['mask_hits']} / miss {stats['mask_misses']})")
+
+
 def main():
     images = _get_image_paths(IMAGE_COUNT)
     gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    settings.MP_AUTO_WORKERS = False  # 표의 워커 수 그대로 프로세스를 띄운다
 
     print(f"벤치마크 매트릭스: {IMAGE_COUNT}장 {OPERATION} | GIL: {gil_status}")
     print(f"Python {sys.version}")
@@ -62,6 +92,10 @@ def main():
         runners.append(("frethread (GIL=0)", frethread_runner))
     else:
         print("\n  (frethread 생략 — GIL=1 환경)")
+    if interpreter_runner.is_available():
+        runners.append(("interpreter", interpreter_runner))
+    else:
+        print("  (interpreter 생략 — Python 3.14+ 필요)")
 
     for label, runner in runners:
         for w in WORKER_COUNTS:
@@ -70,6 +104,9 @@ def main():
             print(f"{label:<25s}  {w:>7d}  {t:>7.3f}s  {ratio:>7.2f}x")
             results.append((label, w, t))
 
+    # watermark 행 (sync + 각 방식 w=4)
+    _watermark_rows(images, runners)
+
     # 분석 출력
     print()
     print("=" * 75)
@@ -90,6 +127,12 @@ def main():
             speedup = thread_4[2] / free_4[2]
             print(f"→ GIL=0이 GIL=1 대비 {speedup:.1f}배 빠름")
 
+    # threading vs interpreter 비교 (workers=4 기준): 인터프리터별 GIL의 효과
+    interp_4 = next((r for r in results if r[0] == "interpreter" and r[1] == 4), None)
+    if thread_4 and interp_4:
+        print(f"\nthreading(GIL) w=4:   {thread_4[2]:.3f}s ({thread_4[2]/sync_time:.2f}x)")
+        print(f"interpreter w=4:      {interp_4[2]:.3f}s ({interp_4[2]/sync_time:.2f}x)")
+
 
 if __name__ == "__main__":
     import multiprocessing
@@ -2,10 +2,10 @@
 
 Day 6 Stage 5: Day 5의 16조합(10장)을 확장하여 전체 데이터 확보.
 
-조합: 이미지 수(10,50,100) × 워커 수(1,2,4,8) × 방식(sync,threading,mp,frethread)
+조합: 이미지 수(10,50,100) × 워커 수(1,2,4,8) × 방식(sync,threading,mp,frethread,interpreter)
   - sync는 워커 수 무관 → 이미지 수 3개만
-  - 나머지 3방식 × 4워커 × 3이미지 = 36
-  - 합계: 3 + 36 = 39조합 (GIL=0), sync 제외 frethread 제외 시 더 적음
+  - 나머지 4방식 × 4워커 × 3이미지 = 48
+  - 합계: 3 + 48 = 51조합 (GIL=0, Python 3.14+), frethread/interpreter 생략 시 더 적음
 
 사용법 (컨테이너 내부):
     cd /app/src && uv run python -m scripts.bench_matrix_full
@@ -14,7 +14,14 @@ Day 6 Stage 5: Day 5의 16조합(10장)을 확장하여 전체 데이터 확보.
 import sys
 import time
 
-from processor import frethread_runner, mp_runner, sync_runner, thread_runner
+from core.config import settings
+from processor import (
+    frethread_runner,
+    interpreter_runner,
+    mp_runner,
+    sync_runner,
+    thread_runner,
+)
 
 FIXTURES_DIR = "/app/tests/fixtures"
 IMAGE_COUNTS = [10, 50, 100]
@@ -41,6 +48,7 @@ def _bench(fn) -> float:
 
 def main():
     gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    settings.MP_AUTO_WORKERS = False  # 표의 워커 수 그대로 프로세스를 띄운다
     print(f"48조합 벤치마크 매트릭스 | GIL: {gil_status}")
     print(f"Python {sys.version}")
     print(f"이미지 수: {IMAGE_COUNTS}, 워커: {WORKER_COUNTS}, 작업: {OPERATION}")
@@ -55,6 +63,10 @@ def main():
         runners.append(("frethread", frethread_runner))
     else:
         print("(frethread 생략 — GIL=1 환경)\n")
+    if interpreter_runner.is_available():
+        runners.append(("interpreter", interpreter_runner))
+    else:
+        print("(interpreter 생략 — Python 3.14+ 필요)\n")
 
     # 전체 결과 저장
     all_results = []
@@ -97,7 +109,7 @@ def main():
     print(f"{'방식':<20s}  {'w=1':>8s}  {'w=2':>8s}  {'w=4':>8s}  {'w=8':>8s}")
     print("-" * 55)
 
-    for method_name in ["threading", "multiprocessing", "frethread"]:
+    for method_name in ["threading", "multiprocessing", "frethread", "interpreter"]:
         times = []
         for w in WORKER_COUNTS:
             r = next((r for r in all_results if r[0] == method_name and r[1] == w and r[2] == 100), None)
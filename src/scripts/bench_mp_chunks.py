@@ -0,0 +1,101 @@
+"""
+multiprocessing 청크 크기 / 워커 수 자동 결정 벤치마크.
+
+mp_runner가 작업을 chunksize장씩 묶어 보낼 때 IPC 왕복 횟수와 wall time이 어떻게 바뀌는지 비교한다.
+  - chunksize: 1(기존 동작, 이미지당 왕복 1회), 2, 4, 8, 16, auto(plan이 결정)
+  - workers:   2, 4 (고정, MP_AUTO_WORKERS 끔), auto (min(요청 16, CPU 수, 작업량))
+
+이미지 세트 (임시 디렉토리에 PNG로 생성):
+  - cheap: 64×64 이미지 400장 grayscale (처리보다 IPC 왕복 비용이 큰 경우)
+  - heavy: 1MP 이미지 24장 blur (처리 비용이 큰 경우, 청크가 오히려 부하 분산을 해칠 수 있음)
+
+풀 생성(fork) 비용은 워커 수 효과의 일부이므로 wall time에 포함한다.
+auto는 첫 실행 전에 사전값으로, 이후에는 워커가 잰 실측 이동 평균으로 plan을 세운다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_mp_chunks
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from core.config import settings
+from processor import mp_runner
+
+CHUNK_SIZES = [1, 2, 4, 8, 16, None]  # None = auto
+WORKER_COUNTS = [2, 4, None]  # None = auto (요청 상한 16)
+AUTO_WORKER_LIMIT = 16
+REPEAT = 3
+
+SETS = {
+    "cheap": {"count": 400, "size": (64, 64), "operation": "grayscale", "params": {}},
+    "heavy": {"count": 24, "size": (1000, 1000), "operation": "blur", "params": {"radius": 6}},
+}
+
+
+def _make_images(directory: Path, name: str, count: int, size: tuple[int, int]) -> list[str]:
+    path = directory / f"{name}.png"
+    Image.effect_noise(size, 64).convert("RGB").save(path)
+    return [str(path)] * count
+
+
+def _measure(paths, operation, params, workers, chunksize) -> tuple[float, mp_runner.Plan]:
+    auto_workers = workers is None
+    settings.MP_AUTO_WORKERS = auto_workers
+    requested = AUTO_WORKER_LIMIT if auto_workers else workers
+
+    task_seconds, source = mp_runner.estimate_task_seconds(paths, operation, params)
+    plan = mp_runner.plan(len(paths), task_seconds, requested, chunksize, source=source)
+
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        mp_runner.run(paths, operation, params, workers=requested, chunksize=chunksize)
+        best = min(best, time.perf_counter() - start)
+    return best, plan
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    print(f"mp 청크 제출 벤치마크 | CPU {os.cpu_count()}개 | GIL: {gil_status} | best of {REPEAT}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for set_name, spec in SETS.items():
+            paths = _make_images(Path(tmp), set_name, spec["count"], spec["size"])
+            operation, params = spec["operation"], spec["params"]
+
+            print(f"\n[{set_name}] {len(paths)}장 {operation} {spec['size'][0]}x{spec['size'][1]}")
+            print("=" * 80)
+            print(
+                f"{'workers':>8s}  {'chunk':>6s}  {'실제 w':>6s}  {'실제 chunk':>10s}  "
+                f"{'왕복':>5s}  {'wall':>8s}  {'vs chunk=1':>10s}  {'추정 근거':>9s}"
+            )
+            print("-" * 80)
+
+            for workers in WORKER_COUNTS:
+                baseline = None
+                for chunksize in CHUNK_SIZES:
+                    wall, plan = _measure(paths, operation, params, workers, chunksize)
+                    baseline = baseline or wall
+                    print(
+                        f"{workers or 'auto':>8}  {chunksize or 'auto':>6}  {plan.workers:>6d}  "
+                        f"{plan.chunksize:>10d}  {plan.round_trips(len(paths)):>5d}  "
+                        f"{wall:>7.3f}s  {baseline / wall:>9.2f}x  {plan.source:>9s}"
+                    )
+                print()
+
+    print("참고:")
+    print("  - 왕복 = ceil(이미지 수 / chunksize): 부모↔워커 IPC 메시지 쌍 수")
+    print("  - auto chunk는 청크 하나가 mp_runner.TARGET_CHUNK_SECONDS 이상 걸리도록,")
+    print(f"    그리고 워커당 {mp_runner.CHUNKS_PER_WORKER}개 이상의 청크가 나오도록 정한다")
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.set_start_method("fork", force=True)
+    main()
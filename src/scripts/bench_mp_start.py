@@ -0,0 +1,125 @@
+"""
+multiprocessing 워커 시작 방식(fork / forkserver / spawn) 비교 벤치마크.
+
+시작 방식마다 새 풀을 만들어 다음을 잰다.
+  - startup: 풀 생성 ~ 모든 워커가 빈 작업을 끝낼 때까지 (프로세스 생성 + import + initializer)
+  - first task: 워커가 뜬 직후 첫 blur 작업 1장 왕복 시간 (지연 import/캐시 미스 확인)
+  - RSS / PSS: 워커 프로세스의 평균 메모리 (/proc/self/status, /proc/self/smaps_rollup)
+    fork 워커는 부모 페이지를 copy-on-write로 공유하므로 RSS는 크고 PSS는 작게 나온다.
+
+부모가 큰 힙을 가진 상황(앱 서버)을 흉내 내려고 측정 전에 BALLAST_MB만큼 메모리를 잡는다.
+fork만 이 힙을 물려받는다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_mp_start
+"""
+
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import wait
+
+from core.config import settings
+from processor import mp_runner
+from processor.image_io import process_file
+from processor.pipeline import compile_transform
+
+FIXTURES_DIR = "/app/tests/fixtures"
+WORKERS = 4
+REPEAT = 3
+BALLAST_MB = 200
+
+
+def _memory_kb(field: str, path: str) -> int:
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _worker_memory(_: int = 0) -> tuple[int, int, int]:
+    """워커 측: (pid, RSS KB, PSS KB). 워커가 모두 한 번씩 응답하도록 잠시 붙잡는다."""
+    time.sleep(0.05)
+    return (
+        os.getpid(),
+        _memory_kb("VmRSS", "/proc/self/status"),
+        _memory_kb("Pss", "/proc/self/smaps_rollup"),
+    )
+
+
+def _noop() -> None:
+    pass
+
+
+def _first_image() -> str:
+    names = sorted(f for f in os.listdir(FIXTURES_DIR) if f.endswith((".jpg", ".jpeg", ".png")))
+    return os.path.join(FIXTURES_DIR, names[0])
+
+
+def _blur_one(path: str) -> None:
+    process_file(path, compile_transform("blur", {"radius": 4}))
+
+
+def _measure(start_method: str, image: str) -> dict:
+    start = time.perf_counter()
+    pool = mp_runner.create_executor(WORKERS, start_method)
+    wait([pool.submit(_noop) for _ in range(WORKERS)])
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pool.submit(_blur_one, image).result()
+    first_task = time.perf_counter() - start
+
+    memory = {}
+    for pid, rss, pss in pool.map(_worker_memory, range(WORKERS * 2)):
+        memory[pid] = (rss, pss)
+    pool.shutdown(wait=True)
+
+    return {
+        "startup": startup,
+        "first_task": first_task,
+        "rss": statistics.mean(m[0] for m in memory.values()) / 1024,
+        "pss": statistics.mean(m[1] for m in memory.values()) / 1024,
+    }
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    available = multiprocessing.get_all_start_methods()
+    methods = [m for m in ("fork", "forkserver", "spawn") if m in available]
+    ballast = bytearray(BALLAST_MB * 1024 * 1024)  # noqa: F841 — 부모 힙 흉내
+    image = _first_image()
+
+    print(
+        f"mp 시작 방식 비교: workers={WORKERS} | 부모 힙 +{BALLAST_MB}MB | GIL: {gil_status} "
+        f"| preload={settings.MP_PRELOAD} | best of {REPEAT}"
+    )
+    print("=" * 72)
+    print(
+        f"{'start':<11s}  {'startup':>9s}  {'first task':>10s}  "
+        f"{'RSS/worker':>11s}  {'PSS/worker':>11s}"
+    )
+    print("-" * 72)
+
+    for method in methods:
+        runs = [_measure(method, image) for _ in range(REPEAT)]
+        best = min(runs, key=lambda r: r["startup"])
+        print(
+            f"{method:<11s}  {best['startup']:>8.3f}s  {min(r['first_task'] for r in runs):>9.4f}s  "
+            f"{best['rss']:>9.1f}MB  {best['pss']:>9.1f}MB"
+        )
+
+    print()
+    print("참고:")
+    print("  - forkserver 서버 기동 + preload import 비용은 첫 풀에만 든다 (best of N이라 표에서는 빠짐)")
+    print("  - PSS는 공유 페이지를 공유 프로세스 수로 나눈 값이라 fork의 실제 추가 메모리에 가깝다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+multiprocessing 결과 전송 방식(transport) 비교 벤치마크.
+
+mp_runner가 결과를 부모로 돌려보내는 3가지 방식을 비교한다.
+  - pickle: PIL.Image 전체를 pickle → 파이프 전송 (기본)
+  - shm:    워커가 shared_memory에 픽셀을 쓰고 작은 디스크립터만 전송
+  - file:   워커가 출력 경로에 JPEG로 바로 인코딩하고 경로만 전송
+
+IPC 바이트는 워커가 돌려보내는 객체의 pickle 크기로,
+IPC 시간은 그 객체의 pickle.dumps + loads (shm은 블록 → Image 복사 포함) 시간으로 분리한다.
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python -m scripts.bench_mp_transport
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from processor import mp_runner
+from processor.image_io import process_file
+from processor.pipeline import compile_transform
+
+FIXTURES_DIR = "/app/tests/fixtures"
+IMAGE_COUNT = 20
+WORKERS = 4
+OPERATION = "blur"
+PARAMS = {"radius": 10}
+
+
+def _get_image_paths(count: int) -> list[str]:
+    paths = sorted(
+        os.path.join(FIXTURES_DIR, f)
+        for f in os.listdir(FIXTURES_DIR)
+        if f.endswith((".jpg", ".jpeg", ".png"))
+    )
+    return (paths * ((count // len(paths)) + 1))[:count]
+
+
+def _ipc_cost(payloads: list) -> tuple[int, float]:
+    """워커가 보낼 객체들의 (pickle 바이트 합, 직렬화+역직렬화+복원 시간)."""
+    total_bytes = 0
+    start = time.perf_counter()
+    for obj in payloads:
+        data = pickle.dumps(obj)
+        total_bytes += len(data)
+        mp_runner._materialize(pickle.loads(data))
+    return total_bytes, time.perf_counter() - start
+
+
+def main():
+    images = _get_image_paths(IMAGE_COUNT)
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+
+    print(f"mp transport 비교: {IMAGE_COUNT}장 {OPERATION} | workers={WORKERS} | GIL: {gil_status}")
+    print("=" * 75)
+
+    # 1. 워커가 돌려보낼 payload를 부모에서 재현해 IPC 바이트/시간만 따로 측정
+    transform = compile_transform(OPERATION, PARAMS)
+    pickle_payloads = [process_file(p, transform) for p in images]
+    shm_payloads = [mp_runner._to_shared(img) for img in pickle_payloads]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outs = [os.path.join(tmp, f"{i}.jpg") for i in range(len(images))]
+        file_payloads = outs
+
+        ipc = {
+            "pickle": _ipc_cost(pickle_payloads),
+            "shm": _ipc_cost(shm_payloads),
+            "file": _ipc_cost(file_payloads),
+        }
+
+        # 2. 실제 러너 실행 시간 (풀 생성 포함)
+        walls = {}
+        for transport in ["pickle", "shm"]:
+            start = time.perf_counter()
+            mp_runner.run(images, OPERATION, PARAMS, workers=WORKERS, transport=transport)
+            walls[transport] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mp_runner.run(images, OPERATION, PARAMS, workers=WORKERS, output_paths=outs)
+        walls["file"] = time.perf_counter() - start
+
+    print(f"\n{'transport':<10s}  {'wall':>8s}  {'IPC bytes':>12s}  {'IPC time':>9s}  {'IPC 비중':>8s}")
+    print("-" * 58)
+    for transport in ["pickle", "shm", "file"]:
+        nbytes, ipc_time = ipc[transport]
+        wall = walls[transport]
+        share = ipc_time / wall * 100 if wall > 0 else 0
+        print(f"{transport:<10s}  {wall:>7.3f}s  {nbytes:>12,d}  {ipc_time:>8.4f}s  {share:>7.1f}%")
+
+    print()
+    print("참고:")
+    print("  - IPC 시간은 부모 프로세스에서 payload를 재현해 측정한 직렬화 비용 (파이프 전송 대기 제외)")
+    print("  - file은 인코딩 비용이 워커로 옮겨가므로 wall에 JPEG 인코딩 시간이 포함된다")
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.set_start_method("fork", force=True)
+    main()
@@ -0,0 +1,117 @@
+"""
+work stealing 스케줄러 vs 공유 큐(FIFO) 배치 makespan 벤치마크.
+
+크기가 섞인 이미지 세트에서 배치 전체가 끝나는 시간(makespan)을 비교한다.
+  - fifo:  thread_runner와 같은 ThreadPoolExecutor.map (입력 순서, 공유 큐)
+  - steal: 큰 이미지부터 워커별 deque + work stealing (frethread 기본 스케줄러)
+
+이미지 세트 (임시 디렉토리에 PNG로 생성):
+  - big-last: 작은 이미지 다수 뒤에 큰 이미지 2장 (FIFO 최악의 경우)
+  - shuffled: 같은 이미지를 섞은 순서
+  - uniform:  모두 같은 크기 (스케줄러 오버헤드 확인용)
+  - synthetic: 이미지 대신 time.sleep(무게) 작업 (코어 수와 무관한 스케줄링 효과만 확인)
+
+사용법 (컨테이너 내부):
+    cd /app/src && PYTHON_GIL=0 uv run python -m scripts.bench_work_stealing
+
+GIL=1에서도 실행할 수 있다 (Pillow 필터가 GIL을 놓는 구간만 병렬).
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from processor import thread_runner
+from processor.image_io import process_file
+from processor.pipeline import compile_transform
+from processor.work_stealing import WorkStealingScheduler, image_weight
+
+WORKER_COUNTS = [2, 4, 8]
+REPEAT = 3
+OPERATION = "blur"
+PARAMS = {"radius": 6}
+
+
+def _make_sets(root: Path) -> dict[str, list[str]]:
+    def _save(name: str, size: tuple[int, int]) -> str:
+        path = root / f"{name}.png"
+        Image.effect_noise(size, 64).convert("RGB").save(path)
+        return str(path)
+
+    small = [_save(f"small_{i}", (400, 300)) for i in range(24)]
+    big = [_save(f"big_{i}", (2400, 1800)) for i in range(2)]
+    uniform = [_save(f"uniform_{i}", (800, 600)) for i in range(16)]
+
+    shuffled = small + big
+    random.Random(7).shuffle(shuffled)
+    return {"big-last": small + big, "shuffled": shuffled, "uniform": uniform}
+
+
+def _fifo(paths: list[str], workers: int) -> None:
+    thread_runner.run(paths, OPERATION, PARAMS, workers=workers)
+
+
+def _steal(paths: list[str], workers: int) -> None:
+    transform = compile_transform(OPERATION, PARAMS)
+    weights = [image_weight(p) for p in paths]
+    list(WorkStealingScheduler(workers).run(lambda p: process_file(p, transform), paths, weights))
+
+
+def _synthetic_rows() -> None:
+    """big-last와 같은 구성을 sleep으로 재현: 작은 작업 24개(10ms) 뒤에 큰 작업 2개(120ms)."""
+    durations = [0.01] * 24 + [0.12] * 2
+    for w in WORKER_COUNTS:
+        def fifo(_, workers=w):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(time.sleep, durations))
+
+        def steal(_, workers=w):
+            list(WorkStealingScheduler(workers).run(time.sleep, durations, durations))
+
+        a, b = _makespan(fifo, [], w), _makespan(steal, [], w)
+        print(f"{'synthetic':<10s}  {w:>7d}  {a:>7.3f}s  {b:>7.3f}s  {(a - b) / a * 100:>6.1f}%")
+
+
+def _makespan(fn, paths: list[str], workers: int) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(paths, workers)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    gil_status = "disabled" if not sys._is_gil_enabled() else "enabled"
+    print(f"work stealing makespan: {OPERATION} {PARAMS} | GIL: {gil_status} | 중앙값 {REPEAT}회")
+    print(f"Python {sys.version}")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sets = _make_sets(Path(tmp))
+        print(f"\n{'세트':<10s}  {'workers':>7s}  {'fifo':>8s}  {'steal':>8s}  {'개선':>7s}")
+        print("-" * 50)
+        for name, paths in sets.items():
+            for w in WORKER_COUNTS:
+                fifo = _makespan(_fifo, paths, w)
+                steal = _makespan(_steal, paths, w)
+                gain = (fifo - steal) / fifo * 100
+                print(f"{name:<10s}  {w:>7d}  {fifo:>7.3f}s  {steal:>7.3f}s  {gain:>6.1f}%")
+        _synthetic_rows()
+
+    print()
+    print("분석:")
+    print("  - big-last: FIFO는 큰 이미지가 마지막에 시작돼 한 워커만 일하는 꼬리 구간이 생긴다")
+    print("  - steal은 큰 이미지를 먼저 시작하므로 꼬리에는 작은 이미지만 남는다")
+    print("  - uniform: 이득이 없어야 정상 (헤더 읽기/정렬 오버헤드만 보임)")
+    print("  - 이미지 세트의 이득은 코어 수와 GIL=0에 달려 있다 (코어 1개면 synthetic만 차이가 난다)")
+
+
+if __name__ == "__main__":
+    main()
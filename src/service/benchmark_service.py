@@ -1,25 +1,30 @@
 """벤치마크 실행 및 결과 관리 서비스."""
 
+import functools
 import os
+import statistics
 import sys
 import time
 
 from sqlmodel import Session, select
 
-from core.constants import OPERATION_NAMES, get_default_params
+from core.constants import AUTO_METHOD
 from core.exceptions import BenchmarkNotFound, InvalidMethod, InvalidOperation
 from model.benchmark import BenchmarkResult
-from processor import frethread_runner, mp_runner, sync_runner, thread_runner
-
-METHODS = {
-    "sync": sync_runner,
-    "threading": thread_runner,
-    "multiprocessing": mp_runner,
-    "frethread": frethread_runner,
-}
+from processor import image_io, registry, runners
+from processor.cost_model import CostModel, Decision, Sample
+from processor.loop_runner import measure_loop_lag
+from processor.memory import RssMonitor
+from processor.operations import OPERATION_NAMES
+from processor.pool_manager import pool_manager
+from processor.runners import METHODS
+from processor.stages import StageTimes
 
 FIXTURES_DIR = "/app/tests/fixtures"
 
+# 비용 모델에 반영할 최근 벤치마크 기록 수
+COST_MODEL_HISTORY = 500
+
 
 def _get_image_paths(count: int) -> list[str]:
     """테스트 이미지 경로를 count개만큼 반복하여 반환한다."""
@@ -31,6 +36,82 @@ def _get_image_paths(count: int) -> list[str]:
     return (paths * ((count // len(paths)) + 1))[:count]
 
 
+@functools.cache
+def _fixture_megapixels() -> float:
+    """벤치마크 이미지의 평균 메가픽셀 (기록의 이미지당 시간을 크기로 환산할 때 기준)."""
+    try:
+        sizes = [
+            image_io.megapixels(os.path.join(FIXTURES_DIR, f))
+            for f in os.listdir(FIXTURES_DIR)
+            if f.endswith((".jpg", ".jpeg", ".png"))
+        ]
+    except OSError:
+        return 1.0
+    return statistics.mean(sizes) if sizes else 1.0
+
+
+def load_cost_model(session: Session) -> CostModel:
+    """현재 GIL 상태와 같은 환경에서 측정한 최근 벤치마크 기록으로 비용 모델을 만든다.
+
+    디코드 캐시를 쓴 기록은 디코드 비용이 빠져 있으므로 제외한다.
+    """
+    gil_enabled = sys._is_gil_enabled()
+    rows = session.exec(
+        select(BenchmarkResult)
+        .where(
+            BenchmarkResult.gil_enabled == gil_enabled,
+            BenchmarkResult.decode_cache.is_(False),
+        )
+        .order_by(BenchmarkResult.created_at.desc())
+        .limit(COST_MODEL_HISTORY)
+    ).all()
+    samples = [
+        Sample(r.method, r.operation, r.workers, r.image_count, r.duration, r.cold_duration)
+        for r in rows
+        if r.method in METHODS and r.duration > 0
+    ]
+    return CostModel(
+        gil_enabled,
+        samples,
+        reference_megapixels=_fixture_megapixels(),
+        warm_pools=pool_manager.warm_keys(),
+    )
+
+
+def plan_auto(
+    operation: str,
+    params: dict | None,
+    image_paths: list[str],
+    max_workers: int,
+    session: Session,
+) -> Decision:
+    """method="auto"의 실제 (method, workers)를 고른다. 이미지 크기는 헤더만 읽어 평균낸다."""
+    try:
+        megapixels = statistics.mean(image_io.megapixels(p) for p in image_paths)
+    except (OSError, statistics.StatisticsError):
+        megapixels = _fixture_megapixels()
+    model = load_cost_model(session)
+    return model.choose(operation, params, len(image_paths), megapixels, max_workers=max_workers)
+
+
+def _timed_run(
+    method, image_paths, operation, params, workers, executor=None, use_cache=False, timings=None
+) -> float:
+    start = time.perf_counter()
+    runners.run(
+        method,
+        image_paths,
+        operation,
+        params,
+        workers,
+        executor=executor,
+        use_cache=use_cache,
+        timings=timings,
+        auto_workers=False,  # 기록하는 workers와 실제로 띄운 워커 수가 같아야 한다
+    )
+    return time.perf_counter() - start
+
+
 def run_benchmark(
     method: str,
     operation: str,
@@ -39,23 +120,62 @@ def run_benchmark(
     params: dict | None,
     user_id: int,
     session: Session,
+    decode_cache: bool = False,
+    stage_timings: bool = True,
 ) -> BenchmarkResult:
-    """벤치마크를 실행하고 결과를 DB에 저장한다."""
-    if method not in METHODS:
+    """벤치마크를 실행하고 결과를 DB에 저장한다.
+
+    sync가 아닌 방식은 두 번 측정한다.
+    - cold_duration: 호출마다 풀을 새로 만드는 경우 (프로세스 fork/스레드 생성 포함)
+    - duration: PoolManager의 영구 풀(warm)을 재사용하는 경우
+    풀 관리자가 시작되지 않았거나(스크립트 등) workers가 풀 크기보다 크면 duration = cold_duration.
+
+    실행 동안 서버 이벤트 루프 지연(loop_lag_*)도 함께 잰다. 서버 밖에서 호출하면 None.
+    peak_rss_mb는 두 측정 동안의 프로세스(+워커 프로세스) RSS 최대값이다.
+    decode_cache=False(기본)면 디코드 캐시를 거치지 않아 매 측정이 디코드 비용을 포함한다.
+    stage_timings=True(기본)면 duration 측정에서 이미지당 단계별 시간(*_ms)을 함께 기록한다.
+    풀 생성 비용은 cold_duration - duration으로 본다.
+
+    method="auto"면 비용 모델이 고른 method/workers(workers는 상한)로 실행하고
+    선택 근거와 예측 시간을 함께 저장해 모델 정확도를 비교할 수 있게 한다.
+    """
+    if method not in METHODS and method != AUTO_METHOD:
         raise InvalidMethod(f"지원하지 않는 방식: {method}. 가능한 값: {list(METHODS.keys())}")
     if operation not in OPERATION_NAMES:
         raise InvalidOperation(f"지원하지 않는 작업: {operation}. 가능한 값: {list(OPERATION_NAMES)}")
 
-    runner = METHODS[method]
+    params = registry.get_default_params(operation, params)
+    try:
+        registry.get(operation).bind(params)
+    except ValueError as e:
+        raise InvalidOperation(str(e)) from e
+
     image_paths = _get_image_paths(image_count)
-    params = get_default_params(operation, params)
 
-    start = time.perf_counter()
-    if method == "sync":
-        runner.run(image_paths, operation, params)
-    else:
-        runner.run(image_paths, operation, params, workers=workers)
-    duration = time.perf_counter() - start
+    decision = None
+    if method == AUTO_METHOD:
+        decision = plan_auto(operation, params, image_paths, workers, session)
+        method, workers = decision.method, decision.workers
+
+    cold_duration = None
+    timings = StageTimes() if stage_timings else None
+    with measure_loop_lag() as lag, RssMonitor() as rss:
+        run_args = (method, image_paths, operation, params, workers)
+        if method == "sync":
+            duration = _timed_run(*run_args, use_cache=decode_cache, timings=timings)
+        else:
+            # 풀 크기보다 많은 workers는 풀에서 그만큼 돌릴 수 없으므로 cold 측정만 한다
+            executor = None
+            if pool_manager.is_warm(method, workers):
+                executor = pool_manager.get(method, workers)
+            # 영구 풀이 없으면 cold 측정이 곧 duration이므로 그 측정에서 단계 시간을 잰다
+            cold_timings = timings if executor is None else None
+            cold_duration = _timed_run(*run_args, use_cache=decode_cache, timings=cold_timings)
+            if executor is None:
+                duration = cold_duration
+            else:
+                duration = _timed_run(*run_args, executor, use_cache=decode_cache, timings=timings)
+    stages = timings.mean_ms() if timings else {}
 
     result = BenchmarkResult(
         method=method,
@@ -63,6 +183,18 @@ def run_benchmark(
         workers=workers if method != "sync" else 1,
         image_count=image_count,
         duration=round(duration, 4),
+        cold_duration=round(cold_duration, 4) if cold_duration is not None else None,
+        decision=decision.reason if decision else None,
+        predicted_duration=decision.predicted if decision else None,
+        loop_lag_max_ms=lag.max_ms,
+        loop_lag_mean_ms=lag.mean_ms,
+        decode_cache=decode_cache,
+        peak_rss_mb=rss.peak_mb,
+        decode_ms=stages.get("decode"),
+        convert_ms=stages.get("convert"),
+        op_ms=stages.get("op"),
+        encode_ms=stages.get("encode"),
+        ipc_ms=stages.get("ipc"),
         gil_enabled=sys._is_gil_enabled(),
         user_id=user_id,
     )
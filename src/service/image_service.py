@@ -1,3 +1,4 @@
+import hashlib
 import os
 import uuid
 
@@ -8,16 +9,27 @@ from sqlmodel import Session, select
 from core.config import settings
 from core.exceptions import Forbidden, ImageNotFound, InvalidOperation
 from model.image import ImageRecord
-from processor.operations import blur, grayscale, resize, rotate, sharpen, watermark
-
-OPERATIONS = {
-    "resize": resize,
-    "blur": blur,
-    "sharpen": sharpen,
-    "grayscale": grayscale,
-    "rotate": rotate,
-    "watermark": watermark,
-}
+from processor import result_cache, tile_runner
+from processor.image_io import load_rgb, save_jpeg
+from processor.pipeline import compile_transform, label, size_hint
+from processor.pool_manager import pool_manager
+from processor.singleflight import inflight
+
+
+def _apply(img: Image.Image, operation: str, params: dict, transform) -> Image.Image:
+    """operation을 적용한다. 큰 이미지는 strip 단위로 나눠 스레드에서 병렬 처리한다."""
+    megapixels = img.width * img.height / 1_000_000
+    if (
+        settings.TILE_ENABLED
+        and tile_runner.is_tileable(operation)
+        and megapixels >= settings.TILE_MIN_MEGAPIXELS
+    ):
+        method = "threading" if settings.gil_enabled else "frethread"
+        executor = pool_manager.get(method, settings.TILE_WORKERS)
+        return tile_runner.run_tiled(
+            img, operation, params, workers=settings.TILE_WORKERS, executor=executor
+        )
+    return transform(img)
 
 
 def save_upload(file: UploadFile, user_id: int, session: Session) -> ImageRecord:
@@ -28,12 +40,14 @@ def save_upload(file: UploadFile, user_id: int, session: Session) -> ImageRecord
     saved_name = f"{uuid.uuid4().hex}{ext}"
     saved_path = os.path.join(settings.UPLOAD_DIR, saved_name)
 
+    data = file.file.read()
     with open(saved_path, "wb") as f:
-        f.write(file.file.read())
+        f.write(data)
 
     record = ImageRecord(
         filename=file.filename or "unknown",
         original_path=saved_path,
+        content_hash=hashlib.sha256(data).hexdigest(),
         user_id=user_id,
     )
     session.add(record)
@@ -42,6 +56,24 @@ def save_upload(file: UploadFile, user_id: int, session: Session) -> ImageRecord
     return record
 
 
+def ensure_content_hash(record: ImageRecord) -> str:
+    """원본 sha256을 반환한다. content_hash가 없는 기존 레코드는 여기서 계산해 채운다."""
+    if record.content_hash is None:
+        record.content_hash = result_cache.file_sha256(record.original_path)
+    return record.content_hash
+
+
+def output_path_for(
+    record: ImageRecord, operation: str, params: dict | None, key: str, suffix: str = ""
+) -> str:
+    """결과를 저장할 경로. 결과 캐시가 켜져 있으면 키 경로(공유), 꺼져 있으면 레코드별 경로."""
+    if result_cache.cache.enabled:
+        return result_cache.cache.path(key)
+    os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+    name = os.path.splitext(os.path.basename(record.original_path))[0]
+    return os.path.join(settings.OUTPUT_DIR, f"{name}_{label(operation, params)}{suffix}.jpg")
+
+
 def list_images(user_id: int, session: Session) -> list[ImageRecord]:
     """해당 사용자의 이미지 목록만 반환한다."""
     return list(
@@ -68,40 +100,72 @@ def get_image_or_raise(image_id: int, user_id: int, session: Session) -> ImageRe
 def process_image(
     image_id: int, operation: str, params: dict, user_id: int, session: Session
 ) -> ImageRecord:
-    """이미지에 처리를 적용하고 결과를 저장한다."""
-    record = get_image_or_raise(image_id, user_id, session)
+    """이미지에 처리를 적용하고 결과를 저장한다.
 
-    op_func = OPERATIONS.get(operation)
-    if not op_func:
-        raise InvalidOperation(f"지원하지 않는 작업: {operation}")
-
-    os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+    operation="pipeline"이면 params["steps"]의 작업들을 한 번의 디코드/인코드 안에서
+    연속 적용한다 (processor.pipeline 참고).
 
-    record.status = "processing"
-    session.commit()
-
-    img = Image.open(record.original_path).convert("RGB")
-    result = op_func(img, **params)
+    출력 경로는 결과 캐시 키(원본 해시 + 정규화한 operation/params)로 정해진다.
+    같은 결과가 이미 있으면 디코드/처리 없이 그 파일을 그대로 가리킨다.
+    RESULT_CACHE_ENABLED=False면 기존 파일을 재사용하지 않고 항상 다시 처리한다.
+    같은 키를 처리 중인 요청이 있으면 새로 처리하지 않고 그 결과를 기다린다 (single-flight).
+    """
+    record = get_image_or_raise(image_id, user_id, session)
 
-    name = os.path.splitext(os.path.basename(record.original_path))[0]
-    output_name = f"{name}_{operation}.jpg"
-    output_path = os.path.join(settings.OUTPUT_DIR, output_name)
-    result.save(output_path, "JPEG", quality=85)
+    try:
+        transform = compile_transform(operation, params)
+        key = result_cache.result_key(ensure_content_hash(record), operation, params)
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidOperation(f"지원하지 않는 작업: {operation} ({e})") from e
+
+    output_path = result_cache.cache.lookup(key)
+    if output_path is None:
+        record.status = "processing"
+        session.commit()
+
+        def _compute() -> str:
+            path = output_path_for(record, operation, params, key)
+            if result_cache.cache.enabled and os.path.exists(path):
+                return path  # lookup 이후 먼저 끝난 leader가 저장함
+            img = load_rgb(record.original_path, size_hint(operation, params), use_cache=True)
+            return save_jpeg(_apply(img, operation, params, transform), path)
+
+        if settings.COALESCE_REQUESTS:
+            # 캐시가 꺼져 있으면 출력이 레코드별 경로이므로 같은 레코드끼리만 결과를 공유한다
+            flight_key = key if result_cache.cache.enabled else (key, record.id)
+            output_path, _ = inflight.do(flight_key, _compute)
+        else:
+            output_path = _compute()
 
     record.output_path = output_path
-    record.operation = operation
+    record.operation = label(operation, params)
     record.status = "completed"
     session.commit()
     session.refresh(record)
     return record
 
 
+def _output_shared(record: ImageRecord, session: Session) -> bool:
+    other = session.exec(
+        select(ImageRecord.id).where(
+            ImageRecord.output_path == record.output_path, ImageRecord.id != record.id
+        )
+    ).first()
+    return other is not None
+
+
 def delete_image(image_id: int, user_id: int, session: Session) -> bool:
-    """이미지 레코드와 파일을 삭제한다."""
+    """이미지 레코드와 파일을 삭제한다.
+
+    출력 파일은 결과 캐시로 다른 레코드와 공유될 수 있어 다른 참조가 없을 때만 지운다.
+    """
     record = get_image_or_raise(image_id, user_id, session)
 
-    for path in [record.original_path, record.output_path]:
-        if path and os.path.exists(path):
+    paths = [record.original_path]
+    if record.output_path and not _output_shared(record, session):
+        paths.append(record.output_path)
+    for path in paths:
+        if os.path.exists(path):
             os.remove(path)
 
     session.delete(record)
@@ -0,0 +1,150 @@
+"""배치 작업 진행 이벤트 pub/sub (프로세스 내부).
+
+process_job이 상태 변화와 이미지 완료를 publish()하면, GET /api/jobs/{id}/events 스트림이
+subscribe()로 받아 Server-Sent Events로 내보낸다. 클라이언트가 GET /api/jobs/{id}를 반복
+호출할 때마다 드는 JWT 검증 + 사용자 조회 + 작업 조회가 연결당 한 번으로 줄어든다.
+
+  - publish(): 아무 스레드에서나 호출 (BackgroundTasks 스레드풀, GIL=0 포함).
+    구독자 목록만 Lock 안에서 복사하고, 전달은 구독자 이벤트 루프의 call_soon_threadsafe로 한다.
+  - subscribe(): 이벤트 루프 안에서 호출. with 블록 동안 asyncio.Queue로 이벤트를 받는다.
+
+이벤트는 이 프로세스 안에서만 전달된다. JOB_QUEUE=db처럼 다른 프로세스(worker.py)가
+작업을 실행하면 API 프로세스에는 이벤트가 오지 않으므로, JobPoller가 작업마다 태스크 하나로
+JOB_POLL_SECONDS마다 작업 행을 읽어 바뀐 상태를 status 이벤트로 publish한다.
+같은 작업을 보는 연결이 몇 개든 DB 조회는 주기당 한 번이다. 이 모드에서는
+  - 이미지별 image 이벤트가 오지 않는다 (status의 processed_count/failed_count로만 보인다).
+  - 상태 변화가 최대 JOB_POLL_SECONDS 늦게 전달되고, 그 사이의 중간 상태는 건너뛸 수 있다.
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
+
+from loguru import logger
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class Subscription:
+    def __init__(self, job_id: int, loop: asyncio.AbstractEventLoop) -> None:
+        self.job_id = job_id
+        self.loop = loop
+        self.queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+
+    def _deliver(self, event: tuple[str, dict]) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+        except RuntimeError:  # 구독자 루프가 이미 닫힘
+            pass
+
+    async def get(self, timeout: float | None = None) -> tuple[str, dict] | None:
+        """다음 이벤트. timeout 안에 없으면 None."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class JobEvents:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subs: dict[int, set[Subscription]] = {}
+        self._stats = {"published": 0, "delivered": 0}
+
+    def publish(self, job_id: int, event: str, data: dict) -> None:
+        with self._lock:
+            subs = list(self._subs.get(job_id, ()))
+            self._stats["published"] += 1
+            self._stats["delivered"] += len(subs)
+        for sub in subs:
+            sub._deliver((event, data))
+
+    @contextmanager
+    def subscribe(self, job_id: int):
+        sub = Subscription(job_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subs.setdefault(job_id, set()).add(sub)
+        try:
+            yield sub
+        finally:
+            with self._lock:
+                subs = self._subs.get(job_id)
+                if subs is not None:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._subs[job_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._stats,
+                "subscribers": sum(len(s) for s in self._subs.values()),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+class JobPoller:
+    """다른 프로세스가 실행하는 작업의 상태를 주기적으로 읽어 JobEvents로 publish한다.
+
+    watch()로 작업을 보는 구독자가 있는 동안 (이벤트 루프, job_id)마다 폴링 태스크를 하나만 두고,
+    마지막 구독자가 나가면 취소한다. 작업이 끝나거나(TERMINAL_STATUSES) 사라지면 스스로 멈춘다.
+    """
+
+    def __init__(self, bus: JobEvents) -> None:
+        self._bus = bus
+        self._lock = threading.Lock()
+        self._watchers: dict[tuple[asyncio.AbstractEventLoop, int], list] = {}
+        self._polls = 0
+
+    @contextmanager
+    def watch(self, job_id: int, load: Callable[[int], dict | None], interval: float):
+        """with 블록 동안 interval초마다 load(job_id)로 작업을 확인한다 (이벤트 루프에서 호출)."""
+        loop = asyncio.get_running_loop()
+        key = (loop, job_id)
+        with self._lock:
+            entry = self._watchers.get(key)
+            if entry is None or entry[0].done():
+                entry = [loop.create_task(self._run(job_id, load, interval)), 0]
+                self._watchers[key] = entry
+            entry[1] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    entry[0].cancel()
+                    if self._watchers.get(key) is entry:
+                        del self._watchers[key]
+
+    async def _run(self, job_id: int, load: Callable[[int], dict | None], interval: float):
+        last = None
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                snapshot = await asyncio.to_thread(load, job_id)
+            except Exception as e:  # DB 일시 오류: 다음 주기에 다시 읽는다
+                logger.warning(f"job #{job_id}: 상태 조회 실패 ({e})")
+                continue
+            with self._lock:
+                self._polls += 1
+            if snapshot is None:
+                return
+            if snapshot != last:
+                last = snapshot
+                self._bus.publish(job_id, "status", snapshot)
+                if snapshot["status"] in TERMINAL_STATUSES:
+                    return
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"polls": self._polls, "pollers": len(self._watchers)}
+
+
+# 프로세스 전역 인스턴스
+events = JobEvents()
+pollers = JobPoller(events)
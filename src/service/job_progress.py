@@ -0,0 +1,172 @@
+"""배치 작업 진행률 묶어 쓰기.
+
+process_job이 이미지 하나마다 processed_count를 올리고 commit하면 이미지 수만큼
+쓰기 트랜잭션이 생긴다. SQLite는 쓰기가 DB 전체에서 직렬화되므로 병렬 러너가 빨라질수록
+이 commit이 병목이 된다.
+
+ProgressBuffer는 끝난 이미지(완료/실패)를 메모리에 모아 두고, flush()가 FLUSH_COUNT장마다
+또는 FLUSH_SECONDS마다 한 트랜잭션으로 기록한다.
+  - ImageRecord: 완료된 이미지의 주키 기준 bulk UPDATE 한 번 (executemany)
+  - JobImage: 이미지별 상태/결과 경로/에러의 bulk UPDATE 한 번
+  - Job.processed_count / failed_count: 모은 개수만큼 한 번에 증가
+이미지별 행과 진행률이 같은 트랜잭션에 들어가므로 중간에 프로세스가 죽어도 둘이 어긋나지 않는다.
+
+JOB_QUEUE=db에서 워커가 처리할 때는 owner(워커 ID)를 넘긴다. flush는 트랜잭션 처음에
+lease_owner가 아직 이 워커인지 조건부 UPDATE로 확인하고(fence), 다른 워커가 lease를
+가져갔으면 아무것도 쓰지 않고 LeaseLost를 올린다. 그 UPDATE가 행을 잠그므로 commit까지
+다른 워커가 끼어들지 못한다.
+
+add()는 여러 스레드에서 불러도 안전하다 (GIL=0 포함). 스레드마다 자기 shard에 쌓고
+shard Lock은 drain할 때만 다른 스레드와 겹치므로 add끼리는 경합하지 않는다.
+"""
+
+import threading
+import time
+
+from sqlalchemy import update
+from sqlmodel import Session
+
+from core.config import settings
+from model.image import ImageRecord
+from model.job import Job, JobImage
+
+
+class LeaseLost(Exception):
+    """처리 중인 작업의 lease를 다른 워커가 가져감 (lease 만료 후 재claim)."""
+
+
+def fence(session: Session, job_id: int, owner: str | None) -> None:
+    """현재 트랜잭션에서 lease_owner가 owner인지 확인하고 행을 잠근다 (owner가 None이면 생략)."""
+    if owner is None:
+        return
+    held = session.exec(
+        update(Job)
+        .where(Job.id == job_id, Job.lease_owner == owner)
+        .values(lease_owner=owner)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not held:
+        session.rollback()
+        raise LeaseLost(f"job #{job_id}: lease를 잃었습니다 ({owner})")
+
+
+class _Shard:
+    __slots__ = ("lock", "items")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.items: list[tuple[int, str | None, str | None]] = []
+
+
+class ProgressBuffer:
+    def __init__(self, flush_count: int | None = None, flush_seconds: float | None = None) -> None:
+        self.flush_count = flush_count or settings.JOB_PROGRESS_FLUSH_COUNT
+        self.flush_seconds = (
+            settings.JOB_PROGRESS_FLUSH_SECONDS if flush_seconds is None else flush_seconds
+        )
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.flushes = 0
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def add(self, record_id: int, output_path: str) -> None:
+        """완료된 이미지를 기록 대기열에 넣는다."""
+        self._append((record_id, output_path, None))
+
+    def fail(self, record_id: int, error: str) -> None:
+        """처리에 실패한 이미지를 기록 대기열에 넣는다."""
+        self._append((record_id, None, error))
+
+    def _append(self, item: tuple[int, str | None, str | None]) -> None:
+        shard = self._shard()
+        with shard.lock:
+            shard.items.append(item)
+
+    def pending(self) -> int:
+        with self._shards_lock:
+            shards = list(self._shards)
+        return sum(len(shard.items) for shard in shards)
+
+    def due(self) -> bool:
+        """flush할 때가 됐는지: 쌓인 개수가 flush_count 이상이거나 flush_seconds가 지났을 때."""
+        pending = self.pending()
+        if not pending:
+            return False
+        return (
+            pending >= self.flush_count
+            or time.monotonic() - self._last_flush >= self.flush_seconds
+        )
+
+    def drain(self) -> list[tuple[int, str | None, str | None]]:
+        """쌓인 (record_id, output_path, error)를 모두 꺼낸다. 완료면 error가 None."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        drained: list[tuple[int, str | None, str | None]] = []
+        for shard in shards:
+            with shard.lock:
+                drained.extend(shard.items)
+                shard.items = []
+        self._last_flush = time.monotonic()
+        return drained
+
+    def flush(
+        self,
+        session: Session,
+        job: Job,
+        operation_label: str,
+        owner: str | None = None,
+        final: bool = False,
+    ) -> int:
+        """쌓인 기록을 한 트랜잭션으로 쓴다. 기록한 이미지 수.
+
+        쌓인 기록이 없으면 commit하지 않는다. final=True면 그래도 commit해 job에 바꿔 둔
+        최종 상태를 같은 방식(fence 포함)으로 기록한다.
+        """
+        done = self.drain()
+        if not done and not final:
+            return 0
+        fence(session, job.id, owner)
+        if not done:
+            session.commit()
+            return 0
+        completed = [(record_id, path) for record_id, path, error in done if error is None]
+        if completed:
+            session.exec(
+                update(ImageRecord),
+                params=[
+                    {
+                        "id": record_id,
+                        "output_path": output_path,
+                        "operation": operation_label,
+                        "status": "completed",
+                    }
+                    for record_id, output_path in completed
+                ],
+            )
+        job.processed_count += len(completed)
+        job.failed_count += len(done) - len(completed)
+        session.exec(
+            update(JobImage),
+            params=[
+                {
+                    "job_id": job.id,
+                    "image_id": record_id,
+                    "status": "completed" if error is None else "failed",
+                    "output_path": output_path,
+                    "error_message": error,
+                }
+                for record_id, output_path, error in done
+            ],
+        )
+        session.commit()
+        self.flushes += 1
+        return len(done)
@@ -0,0 +1,202 @@
+"""Job 테이블 기반 작업 큐 (lease).
+
+settings.JOB_QUEUE="db"면 API는 Job을 queued로 저장만 하고, 별도 워커 프로세스(worker.py)가
+claim()으로 작업을 하나씩 가져가 job_service.process_job으로 실행한다.
+큐 상태는 Job 테이블에만 있으므로 API/워커가 재시작해도 작업이 사라지지 않는다.
+
+lease:
+  - claim()은 작업을 processing으로 바꾸며 lease_owner(워커 ID)와 lease_expires_at을 기록한다.
+  - 워커는 처리하는 동안 LeaseKeeper가 JOB_HEARTBEAT_SECONDS마다 lease를 연장한다.
+  - 워커가 죽어 lease가 만료된 processing 작업은 다른 워커가 다시 claim한다.
+  - 연장에 실패하면(다른 워커가 가져감) 처리 중인 process_job에 알려 이미지 사이에서 멈추게 한다.
+    process_job이 작업 행에 쓰는 트랜잭션은 lease_owner가 자기일 때만 commit되므로
+    (job_progress.fence) 두 워커가 같은 작업의 진행률/상태를 함께 쓰지 않는다.
+  - claim 횟수(attempts)가 JOB_MAX_ATTEMPTS에 이른 작업은 더 시도하지 않고 failed로 둔다
+    (워커를 계속 죽이는 작업이 큐를 막지 않도록).
+
+동시 claim:
+  - PostgreSQL: 후보 행을 SELECT ... FOR UPDATE SKIP LOCKED로 잠가 워커끼리 같은 행을 기다리지 않고
+    서로 다른 작업을 가져간다.
+  - SQLite: FOR UPDATE가 없으므로(SQLAlchemy가 생략) 후보를 읽은 뒤 "아직 claim 가능한 경우에만"
+    조건부 UPDATE를 한다. 쓰기는 DB 파일 잠금으로 직렬화되므로 rowcount=1인 워커 하나만 가져간다.
+  두 경우 모두 같은 조건부 UPDATE를 쓰므로 코드는 하나다.
+"""
+
+import os
+import socket
+import threading
+from datetime import UTC, datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import and_, or_, update
+from sqlmodel import Session, select
+
+from core.config import settings
+from model.job import Job
+from service import job_service
+
+
+def worker_id() -> str:
+    """이 프로세스의 워커 ID (호스트명:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _claimable(now: datetime):
+    return or_(
+        Job.status == "queued",
+        and_(
+            Job.status == "processing",
+            Job.lease_expires_at.is_not(None),
+            Job.lease_expires_at < now,
+        ),
+    )
+
+
+def claim(session: Session, owner: str, lease_seconds: float | None = None) -> Job | None:
+    """claim 가능한 작업 중 priority가 가장 높고 오래된 것을 가져온다. 없으면 None."""
+    lease = lease_seconds or settings.JOB_LEASE_SECONDS
+    while True:
+        now = datetime.now(UTC)
+        candidate = session.exec(
+            select(Job.id, Job.attempts)
+            .where(_claimable(now))
+            .order_by(Job.priority.desc(), Job.created_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).first()
+        if candidate is None:
+            session.rollback()  # PostgreSQL: 트랜잭션 종료
+            return None
+
+        job_id, attempts = candidate
+        if attempts >= settings.JOB_MAX_ATTEMPTS:
+            values = {
+                "status": "failed",
+                "error_message": f"lease가 {attempts}번 만료되어 중단했습니다 (워커 비정상 종료)",
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "completed_at": now,
+            }
+        else:
+            values = {
+                "status": "processing",
+                "lease_owner": owner,
+                "lease_expires_at": now + timedelta(seconds=lease),
+                "attempts": Job.attempts + 1,
+            }
+        claimed = session.exec(
+            update(Job)
+            .where(Job.id == job_id, _claimable(now))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+
+        if claimed and values["status"] == "processing":
+            return session.get(Job, job_id, populate_existing=True)
+        if claimed:
+            logger.warning(f"job #{job_id}: {values['error_message']}")
+        # 다른 워커가 먼저 가져갔거나 포기 처리한 작업 → 다음 후보
+
+
+def heartbeat(
+    session: Session, job_id: int, owner: str, lease_seconds: float | None = None
+) -> bool:
+    """lease를 연장한다. 이미 다른 워커가 가져갔으면 False."""
+    lease = lease_seconds or settings.JOB_LEASE_SECONDS
+    extended = session.exec(
+        update(Job)
+        .where(Job.id == job_id, Job.lease_owner == owner, Job.status == "processing")
+        .values(lease_expires_at=datetime.now(UTC) + timedelta(seconds=lease))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    session.commit()
+    return extended == 1
+
+
+def release(session: Session, job_id: int, owner: str) -> None:
+    """처리가 끝난 작업의 lease 정보를 지운다 (상태는 process_job이 기록)."""
+    session.exec(
+        update(Job)
+        .where(Job.id == job_id, Job.lease_owner == owner)
+        .values(lease_owner=None, lease_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+
+
+class LeaseKeeper:
+    """with 블록 동안 별도 스레드/세션에서 주기적으로 lease를 연장하고, 끝나면 해제한다.
+
+    연장할 때 취소 요청(cancel_requested)도 확인해 처리 중인 작업에 알린다.
+    연장에 실패하면 lost를 세우고 job_service.signal_lease_lost로 처리를 멈춘다.
+    """
+
+    def __init__(self, engine, job_id: int, owner: str, interval: float | None = None) -> None:
+        self.engine = engine
+        self.job_id = job_id
+        self.owner = owner
+        self.interval = interval or settings.JOB_HEARTBEAT_SECONDS
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                with Session(self.engine) as session:
+                    if not heartbeat(session, self.job_id, self.owner):
+                        self.lost = True
+                        logger.warning(f"job #{self.job_id}: lease를 잃었습니다 ({self.owner})")
+                        job_service.signal_lease_lost(self.job_id)
+                        return
+                    # API 프로세스에서 들어온 취소 요청 (대기 중인 조각도 깨운다)
+                    cancel = session.exec(
+                        select(Job.cancel_requested).where(Job.id == self.job_id)
+                    ).one()
+                    if cancel:
+                        job_service.signal_cancel(self.job_id)
+            except Exception as e:  # DB 일시 장애: 다음 주기에 다시 시도
+                logger.warning(f"job #{self.job_id}: lease 연장 실패 ({e})")
+
+    def __enter__(self) -> "LeaseKeeper":
+        self._thread = threading.Thread(target=self._loop, name="lease-keeper", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with Session(self.engine) as session:
+            release(session, self.job_id, self.owner)
+
+
+def run_next(engine, owner: str) -> int | None:
+    """작업 하나를 claim해 처리하고 job ID를 반환한다. 대기 중 작업이 없으면 None.
+
+    engine은 process_job이 쓰는 것과 같아야 한다 (job_service.get_engine()).
+    """
+    with Session(engine) as session:
+        job = claim(session, owner)
+        if job is None:
+            return None
+        job_id = job.id
+        logger.info(f"job #{job_id} 시작 ({owner}, {job.method}, {job.image_count}장)")
+
+    with LeaseKeeper(engine, job_id, owner):
+        job_service.process_job(job_id, owner)
+    return job_id
+
+
+def serve(engine, owner: str, stop: threading.Event, once: bool = False) -> int:
+    """stop이 설정될 때까지 작업을 처리한다. once=True면 큐가 비는 즉시 반환. 처리한 작업 수."""
+    processed = 0
+    while not stop.is_set():
+        if run_next(engine, owner) is None:
+            if once:
+                break
+            stop.wait(settings.JOB_POLL_SECONDS)
+            continue
+        processed += 1
+    return processed
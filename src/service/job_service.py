@@ -5,31 +5,49 @@ Job 레코드에 진행률과 상태를 업데이트한다.
 """
 
 import json
-import os
+import threading
 import time
+from contextlib import nullcontext
 from datetime import UTC, datetime
 
-from PIL import Image
+from loguru import logger
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from core.config import settings
-from core.constants import METHOD_NAMES, OPERATION_NAMES, get_default_params
+from core.constants import AUTO_METHOD, METHOD_NAMES
 from core.exceptions import (
     Forbidden,
     ImageNotFound,
     InvalidMethod,
     InvalidOperation,
+    JobNotCancellable,
     JobNotCompleted,
     JobNotFound,
+    JobNotRetryable,
 )
 from model.database import engine as default_engine
 from model.image import ImageRecord
-from model.job import Job
-from processor import operations
+from model.job import Job, JobImage
+from processor import registry, result_cache, runners
+from processor.fair_scheduler import scheduler
+from processor.memory import RssMonitor
+from processor.operations import OPERATION_NAMES
+from processor.pipeline import PIPELINE, compile_transform, label
+from processor.pool_manager import pool_manager
+from service import benchmark_service
+from service.image_service import ensure_content_hash, output_path_for
+from service.job_events import TERMINAL_STATUSES, events
+from service.job_progress import LeaseLost, ProgressBuffer, fence
 
 # BackgroundTasks에서 사용할 엔진. 테스트 시 오버라이드 가능.
 _engine = None
 
+# 이 프로세스에서 처리 중인 작업의 취소 신호 (job_id → Event)와 lease를 잃은 작업
+_cancel_lock = threading.Lock()
+_cancel_flags: dict[int, threading.Event] = {}
+_lease_lost: set[int] = set()
+
 
 def get_engine():
     return _engine or default_engine
@@ -43,20 +61,45 @@ def create_job(
     workers: int,
     user_id: int,
     session: Session,
+    priority: int = 0,
 ) -> Job:
-    """배치 작업을 생성한다. 이미지 소유권을 검증하고 Job 레코드를 DB에 저장."""
+    """배치 작업을 생성한다. 이미지 소유권을 검증하고 Job 레코드와 이미지별 JobImage 행을 DB에 저장.
+
+    같은 이미지 ID가 여러 번 오면 한 번만 처리한다 (결과가 같은 파일이므로).
+
+    method="auto"면 비용 모델이 고른 method/workers(workers는 상한)를 Job에 기록하고
+    선택 근거(decision)와 예측 시간(predicted_duration)을 함께 저장한다.
+    """
     if method not in METHOD_NAMES:
         raise InvalidMethod(f"지원하지 않는 방식: {method}")
-    if operation not in OPERATION_NAMES:
+    if operation not in OPERATION_NAMES and operation != PIPELINE:
         raise InvalidOperation(f"지원하지 않는 작업: {operation}")
+    try:
+        compile_transform(operation, params)
+    except (ValueError, KeyError) as e:
+        raise InvalidOperation(f"잘못된 작업 파라미터: {e}") from e
 
+    image_ids = list(dict.fromkeys(image_ids))
     # 이미지 소유권 검증
+    records = []
     for iid in image_ids:
         record = session.get(ImageRecord, iid)
         if not record:
             raise ImageNotFound(f"이미지 #{iid}을(를) 찾을 수 없습니다")
         if record.user_id != user_id:
             raise Forbidden(f"이미지 #{iid}에 대한 접근 권한이 없습니다")
+        records.append(record)
+
+    decision = None
+    if method == AUTO_METHOD:
+        decision = benchmark_service.plan_auto(
+            operation,
+            registry.get_default_params(operation, params),
+            [r.original_path for r in records],
+            workers,
+            session,
+        )
+        method, workers = decision.method, decision.workers
 
     job = Job(
         user_id=user_id,
@@ -66,71 +109,430 @@ def create_job(
         workers=workers,
         image_ids=json.dumps(image_ids),
         image_count=len(image_ids),
+        priority=priority,
+        decision=decision.reason if decision else None,
+        predicted_duration=decision.predicted if decision else None,
     )
     session.add(job)
+    session.flush()
+    session.add_all(JobImage(job_id=job.id, image_id=iid) for iid in image_ids)
     session.commit()
     session.refresh(job)
     return job
 
 
-def process_job(job_id: int) -> None:
+def process_job(job_id: int, owner: str | None = None) -> None:
     """백그라운드에서 배치 작업을 실행한다.
 
     별도 세션을 열어 작업 상태를 업데이트한다.
     BackgroundTasks에서 호출되므로 요청 세션과 분리되어야 한다.
+
+    이미지 디코드/처리/인코드는 job.method 러너가 job.workers 만큼 병렬로 실행하고,
+    DB 갱신은 이 함수(단일 스레드)에서만 한다. 러너의 iter_run()이 완료 순서대로
+    결과를 내보내면 ProgressBuffer에 모아 두었다가 JOB_PROGRESS_FLUSH_COUNT장 또는
+    JOB_PROGRESS_FLUSH_SECONDS마다 한 트랜잭션(bulk UPDATE + processed_count)으로 기록한다.
+
+    동시에 처리 중인 이미지 메가픽셀은 러너가 공유 메모리 예산(MAX_INFLIGHT_MEGAPIXELS)으로
+    제한하므로 여러 job이 함께 돌아도 제출이 기다릴 뿐 메모리가 예산 이상 늘지 않는다.
+    처리 동안의 peak RSS는 job.peak_rss_mb에 기록한다.
+
+    출력은 image_service.process_image와 같은 결과 캐시를 쓴다. 이미 결과 파일이 있는
+    이미지는 러너에 넘기지 않고 바로 완료 처리하고, 나머지만 캐시 키 경로로 처리한다.
+
+    상태 변화와 이미지 완료는 job_events로 publish한다 (SSE 스트림용). 이미지 이벤트는
+    DB flush를 기다리지 않고 바로 보내고, 최종 status 이벤트는 commit 뒤에 보낸다.
+
+    이미지 하나가 실패해도(깨진 파일 등) 작업 전체를 실패시키지 않는다. 러너 스트림이 예외로
+    끝나면 아직 끝나지 않은 이미지를 반씩 나눠 다시 제출해 실패한 이미지만 골라내고,
+    그 이미지의 JobImage 행에 failed와 에러를 기록한다 (_run_isolated). 일부만 실패한 작업은
+    failed_count > 0인 completed, 모든 이미지가 실패하면 failed로 끝난다.
+    JobImage가 이미 completed인 이미지는 처리하지 않으므로 retry_job이나 lease 만료 후
+    재처리는 남은 이미지만 처리한다. flush 전에 끝난 이미지도 결과 캐시(RESULT_CACHE_ENABLED)에
+    파일이 있어 다시 계산하지 않는다 (결과는 임시 파일 + os.replace로 써서 반쯤 쓴 파일이 없다).
+
+    JOB_FAIR_SCHEDULING이면 남은 이미지를 JOB_SLICE_IMAGES장씩 나눠 조각마다
+    fair_scheduler에서 차례를 받고 제출한다 (사용자 사이 round-robin).
+    취소(cancel_job)는 이미지 사이와 조각 사이에서 확인한다. 이미 실행 중인 이미지는 끝까지
+    처리하고, 아직 시작하지 않은 이미지는 제출을 취소한 뒤 cancelled로 끝낸다.
+
+    owner는 JOB_QUEUE=db에서 작업을 claim한 워커 ID다. 작업 행에 쓰는 모든 트랜잭션은
+    lease_owner가 owner일 때만 commit된다 (job_progress.fence). lease를 잃으면
+    (signal_lease_lost 또는 fence 실패) 이미지 사이에서 멈추고 최종 상태를 쓰지 않는다.
+    작업은 lease를 가져간 워커가 마저 처리한다.
     """
     with Session(get_engine()) as session:
         job = session.get(Job, job_id)
-        if not job:
+        if not job or job.status == "cancelled":
             return
+        with _cancel_lock:
+            cancel = _cancel_flags.setdefault(job_id, threading.Event())
+            _lease_lost.discard(job_id)
+        try:
+            _process(session, job, cancel, owner)
+        except LeaseLost as e:
+            logger.warning(f"{e}: 기록하지 않고 중단합니다")
+        finally:
+            with _cancel_lock:
+                _cancel_flags.pop(job_id, None)
+                _lease_lost.discard(job_id)
 
-        job.status = "processing"
-        session.commit()
 
-        image_ids = job.image_id_list
-        params = job.params_dict
+def _turn(user_id: int, priority: int, cost: int, cancel: threading.Event):
+    if not settings.JOB_FAIR_SCHEDULING:
+        return nullcontext(True)
+    return scheduler.turn(user_id, cost, priority, cancel)
+
+
+def _job_items(session: Session, job: Job) -> list[JobImage]:
+    """작업의 이미지별 행을 image_ids 순서로 반환한다. 없는 행은 pending으로 추가한다 (commit 전).
+
+    create_job을 거치지 않고 만든 작업(벤치마크 스크립트 등)도 같은 방식으로 처리하기 위함.
+    """
+    items = {
+        item.image_id: item
+        for item in session.exec(select(JobImage).where(JobImage.job_id == job.id)).all()
+    }
+    for iid in job.image_id_list:
+        if iid not in items:
+            items[iid] = JobImage(job_id=job.id, image_id=iid)
+            session.add(items[iid])
+    return [items[iid] for iid in dict.fromkeys(job.image_id_list)]
+
+
+def _error_text(error: Exception) -> str:
+    return str(error) or type(error).__name__
+
+
+def _check_lease(job_id: int) -> None:
+    with _cancel_lock:
+        lost = job_id in _lease_lost
+    if lost:
+        raise LeaseLost(f"job #{job_id}: lease를 잃었습니다")
+
+
+def _process(
+    session: Session, job: Job, cancel: threading.Event, owner: str | None = None
+) -> None:
+    job_id = job.id
+    if job.cancel_requested:
+        # 처리 시작 전에 취소됨 (워커가 claim한 뒤 취소 요청이 들어온 경우)
+        job.status = "cancelled"
+        job.completed_at = datetime.now(UTC)
+        fence(session, job_id, owner)
+        session.commit()
+        events.publish(job_id, "status", job_snapshot(job))
+        return
+
+    # completed 행은 건너뛰고 나머지(pending/failed)만 처리한다
+    items = _job_items(session, job)
+    todo = [item.image_id for item in items if item.status != "completed"]
+    finished = len(items) - len(todo)
+
+    # 읽은 뒤 queued 상태에서 취소됐을 수 있으므로 cancelled가 아닐 때만 시작한다.
+    # 진행률은 이미 completed인 이미지부터 센다 (재시도, lease 만료로 다시 claim된 작업)
+    conditions = [Job.id == job_id, Job.status != "cancelled"]
+    if owner is not None:
+        conditions.append(Job.lease_owner == owner)
+    started = session.exec(
+        update(Job)
+        .where(*conditions)
+        .values(status="processing", processed_count=finished, failed_count=0)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    session.commit()
+    if not started:
+        return
+    events.publish(job_id, "status", job_snapshot(job))
+
+    params = registry.get_default_params(job.operation, job.params_dict)
+    try:
+        compile_transform(job.operation, params)
+    except (ValueError, KeyError) as e:
+        job.status = "failed"
+        job.error_message = str(e)
+        fence(session, job_id, owner)
+        session.commit()
+        events.publish(job_id, "status", job_snapshot(job))
+        return
+
+    # flush(commit)가 job/레코드를 expire시키므로 반복해서 쓰는 값은 먼저 꺼내 둔다
+    user_id, priority = job.user_id, job.priority
+    method, workers, operation = job.method, job.workers, job.operation
+    image_count = job.image_count
+    executor = pool_manager.get(method, workers)  # 공유 풀에서 동시 실행 workers개 (풀 크기까지)
+    op_label = label(operation, params)
+
+    progress = ProgressBuffer()
+    counts = {"completed": finished, "failed": 0}
+
+    def _record(record_id: int, output_path: str | None, error: str | None = None) -> None:
+        status = "completed" if error is None else "failed"
+        counts[status] += 1
+        if error is None:
+            progress.add(record_id, output_path)
+        else:
+            progress.fail(record_id, error)
+        events.publish(
+            job_id,
+            "image",
+            {
+                "image_id": record_id,
+                "status": status,
+                "output_path": output_path,
+                "error": error,
+                "processed_count": counts["completed"],
+                "failed_count": counts["failed"],
+                "image_count": image_count,
+            },
+        )
+        if progress.due():
+            # flush가 어차피 job 행을 다시 읽으므로 다른 프로세스의 취소 요청도 여기서 확인된다
+            if job.cancel_requested:
+                cancel.set()
+            progress.flush(session, job, op_label, owner)
+
+    def _run_isolated(part: list[tuple[int, str, str, str]]) -> None:
+        """part(record_id, 원본, 출력, 캐시 키)를 러너로 처리한다.
+
+        러너는 이미지 하나가 실패하면 스트림 전체를 예외로 끝내므로, 아직 결과를 받지 못한
+        이미지를 반으로 나눠 다시 처리한다. 한 장만 남으면 그 이미지가 실패한 것이다.
+        예외 직전에 끝났지만 받지 못한 이미지는 결과 캐시에서 찾아 다시 계산하지 않는다.
+        """
+        results = runners.iter_run(
+            method,
+            [source_path for _, source_path, _, _ in part],
+            operation,
+            params,
+            workers=workers,
+            output_paths=[path for _, _, path, _ in part],
+            executor=executor,
+            use_cache=True,
+        )
+        received: set[int] = set()
         try:
-            op_func = operations.get_operation(job.operation)
-        except ValueError as e:
+            while True:
+                # 러너(이미지 처리)의 예외만 이미지 실패로 본다. DB 기록 실패는 그대로 올린다
+                try:
+                    idx, output_path = next(results)
+                except StopIteration:
+                    return
+                except Exception as e:
+                    error = e
+                    break
+                received.add(idx)
+                _record(part[idx][0], output_path)
+                if cancel.is_set():
+                    return
+        finally:
+            results.close()  # 아직 시작하지 않은 제출은 취소
+
+        rest = [item for idx, item in enumerate(part) if idx not in received]
+        if len(rest) == 1:
+            _record(rest[0][0], None, _error_text(error))
+            return
+        retry = []
+        for item in rest:
+            cached = result_cache.cache.lookup(item[3])
+            if cached is not None:
+                _record(item[0], cached)
+            else:
+                retry.append(item)
+        half = (len(retry) + 1) // 2
+        for sub in (retry[:half], retry[half:]):
+            if sub and not cancel.is_set():
+                _run_isolated(sub)
+
+    start = time.perf_counter()
+    with RssMonitor() as rss:
+        try:
+            # 캐시 적중/실패는 레코드를 다 읽은 뒤 기록한다 (중간 flush로 레코드가 expire되지 않게)
+            settled: list[tuple[int, str | None, str | None]] = []
+            pending: list[tuple[int, str, str, str]] = []
+            for iid in todo:
+                record = session.get(ImageRecord, iid)
+                if record is None:
+                    settled.append((iid, None, f"이미지 #{iid}을(를) 찾을 수 없습니다"))
+                    continue
+                try:
+                    source = ensure_content_hash(record)
+                except OSError as e:  # 원본 파일이 없거나 읽을 수 없음
+                    settled.append((iid, None, _error_text(e)))
+                    continue
+                key = result_cache.result_key(source, operation, params)
+                cached = result_cache.cache.lookup(key)
+                if cached is not None:
+                    settled.append((iid, cached, None))
+                else:
+                    path = output_path_for(record, operation, params, key, f"_job{job_id}")
+                    pending.append((iid, record.original_path, path, key))
+            for record_id, output_path, error in settled:
+                _record(record_id, output_path, error)
+
+            size = settings.JOB_SLICE_IMAGES if settings.JOB_FAIR_SCHEDULING else len(pending)
+            size = max(size, 1)
+            for begin in range(0, len(pending), size):
+                if cancel.is_set():
+                    break
+                part = pending[begin : begin + size]
+                with _turn(user_id, priority, len(part), cancel) as granted:
+                    if not granted:
+                        break
+                    _run_isolated(part)
+
+            failed = counts["failed"]
+            if cancel.is_set():
+                job.status = "cancelled"
+            elif failed and not counts["completed"]:
+                job.status = "failed"
+                job.error_message = f"모든 이미지 처리 실패 ({failed}장)"
+            else:
+                job.status = "completed"
+                job.error_message = (
+                    f"이미지 {failed}장 처리 실패 (POST /api/jobs/{job_id}/retry로 재시도)"
+                    if failed
+                    else None
+                )
+        except LeaseLost:
+            raise
+        except Exception as e:
             job.status = "failed"
             job.error_message = str(e)
-            session.commit()
+
+    _check_lease(job_id)  # lease를 잃어 멈춘 경우: 취소로 기록하지 않는다
+    job.peak_rss_mb = rss.peak_mb
+    job.duration = round(time.perf_counter() - start, 4)
+    job.completed_at = datetime.now(UTC)
+    # 남은 진행률과 최종 상태를 한 트랜잭션으로 기록 (실패/취소해도 끝난 이미지는 남긴다)
+    progress.flush(session, job, op_label, owner, final=True)
+    events.publish(job_id, "status", job_snapshot(job))
+
+
+def signal_cancel(job_id: int) -> None:
+    """이 프로세스에서 처리 중인 작업에 취소를 알린다 (없으면 아무 일도 하지 않음)."""
+    with _cancel_lock:
+        flag = _cancel_flags.get(job_id)
+    if flag is not None:
+        flag.set()
+        scheduler.wake()
+
+
+def signal_lease_lost(job_id: int) -> None:
+    """처리 중인 작업의 lease를 잃었음을 알린다. 이미지 사이에서 멈추고 상태를 쓰지 않는다."""
+    with _cancel_lock:
+        if job_id not in _cancel_flags:
             return
+        _lease_lost.add(job_id)
+    signal_cancel(job_id)
 
-        params = get_default_params(job.operation, params)
 
-        os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
-        start = time.perf_counter()
+def cancel_job(job_id: int, user_id: int, session: Session) -> Job:
+    """작업을 취소한다.
 
-        try:
-            for iid in image_ids:
-                record = session.get(ImageRecord, iid)
-                if not record:
-                    continue
+    queued면 바로 cancelled로 바꾼다 (BackgroundTasks/워커가 가져가도 처리하지 않음).
+    processing이면 cancel_requested만 기록하고, 처리하는 쪽이 이미지 사이에서 멈춘 뒤
+    cancelled로 끝낸다. 다른 프로세스(worker.py)가 처리 중이면 다음 flush 또는 heartbeat 때 본다.
+    """
+    job = get_job(job_id, user_id, session)
+    if job.status in TERMINAL_STATUSES:
+        raise JobNotCancellable(f"이미 끝난 작업은 취소할 수 없습니다 (현재: {job.status})")
+
+    # 조건부 UPDATE: 같은 순간 claim/처리 시작과 겹쳐도 둘 중 하나만 상태를 바꾼다
+    cancelled = session.exec(
+        update(Job)
+        .where(Job.id == job_id, Job.status == "queued")
+        .values(status="cancelled", cancel_requested=True, completed_at=datetime.now(UTC))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not cancelled:
+        session.exec(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(cancel_requested=True)
+            .execution_options(synchronize_session=False)
+        )
+    session.commit()
+    session.refresh(job)
 
-                img = Image.open(record.original_path).convert("RGB")
-                result = op_func(img, **params)
+    signal_cancel(job_id)
+    if cancelled:
+        events.publish(job_id, "status", job_snapshot(job))
+    return job
 
-                name = os.path.splitext(os.path.basename(record.original_path))[0]
-                output_name = f"{name}_{job.operation}_job{job.id}.jpg"
-                output_path = os.path.join(settings.OUTPUT_DIR, output_name)
-                result.save(output_path, "JPEG", quality=85)
 
-                record.output_path = output_path
-                record.operation = job.operation
-                record.status = "completed"
+def retry_job(job_id: int, user_id: int, session: Session) -> Job:
+    """끝난 작업에서 completed가 아닌 이미지만 다시 처리하도록 queued로 되돌린다.
 
-                job.processed_count += 1
-                session.commit()
+    failed 이미지(그리고 취소로 처리하지 못한 pending 이미지)만 pending으로 바꾸고
+    completed 이미지는 그대로 두므로, process_job은 남은 이미지만 다시 계산한다.
+    처리 중인 작업이거나 다시 처리할 이미지가 없으면 409 에러.
+    """
+    job = get_job(job_id, user_id, session)
+    if job.status not in TERMINAL_STATUSES:
+        raise JobNotRetryable(f"끝난 작업만 재시도할 수 있습니다 (현재: {job.status})")
+
+    # 조건부 UPDATE: 같은 작업의 재시도 요청이 겹쳐도 한 번만 queued로 바뀐다
+    requeued = session.exec(
+        update(Job)
+        .where(Job.id == job_id, Job.status.in_(TERMINAL_STATUSES))
+        .values(
+            status="queued",
+            failed_count=0,
+            error_message=None,
+            cancel_requested=False,
+            attempts=0,
+            lease_owner=None,
+            lease_expires_at=None,
+            duration=None,
+            completed_at=None,
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    reset = session.exec(
+        update(JobImage)
+        .where(JobImage.job_id == job_id, JobImage.status != "completed")
+        .values(status="pending", error_message=None, retries=JobImage.retries + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not requeued:
+        session.rollback()
+        raise JobNotRetryable("이미 재시도 중인 작업입니다")
+    if not reset:
+        session.rollback()
+        raise JobNotRetryable
+    session.commit()
+    session.refresh(job)
+    events.publish(job_id, "status", job_snapshot(job))
+    return job
 
-            job.status = "completed"
-        except Exception as e:
-            job.status = "failed"
-            job.error_message = str(e)
 
-        job.duration = round(time.perf_counter() - start, 4)
-        job.completed_at = datetime.now(UTC)
-        session.commit()
+def list_job_images(job_id: int, user_id: int, session: Session) -> list[JobImage]:
+    """작업의 이미지별 처리 결과(상태, 결과 경로, 에러)를 반환한다."""
+    job = get_job(job_id, user_id, session)
+    return list(
+        session.exec(
+            select(JobImage).where(JobImage.job_id == job.id).order_by(JobImage.image_id)
+        ).all()
+    )
+
+
+def load_snapshot(job_id: int) -> dict | None:
+    """작업 상태를 새 세션으로 읽는다 (SSE 스트림용). 작업이 없으면 None."""
+    with Session(get_engine()) as session:
+        job = session.get(Job, job_id)
+        return job_snapshot(job) if job else None
+
+
+def job_snapshot(job: Job) -> dict:
+    """진행 이벤트(status)로 보내는 작업 상태."""
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "processed_count": job.processed_count,
+        "failed_count": job.failed_count,
+        "image_count": job.image_count,
+        "error_message": job.error_message,
+        "duration": job.duration,
+    }
 
 
 def list_jobs(user_id: int, session: Session) -> list[Job]:
@@ -151,13 +553,12 @@ def get_job(job_id: int, user_id: int, session: Session) -> Job:
 
 
 def get_job_result(job_id: int, user_id: int, session: Session) -> list[ImageRecord]:
-    """완료된 작업의 처리된 이미지 목록을 반환한다."""
+    """완료된 작업에서 처리에 성공한 이미지 목록을 반환한다 (실패한 이미지는 list_job_images)."""
     job = get_job(job_id, user_id, session)
     if job.status != "completed":
         raise JobNotCompleted(f"작업이 아직 완료되지 않았습니다 (현재: {job.status})")
 
-    return list(
-        session.exec(
-            select(ImageRecord).where(ImageRecord.id.in_(job.image_id_list))
-        ).all()
+    completed = select(JobImage.image_id).where(
+        JobImage.job_id == job.id, JobImage.status == "completed"
     )
+    return list(session.exec(select(ImageRecord).where(ImageRecord.id.in_(completed))).all())
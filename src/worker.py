@@ -0,0 +1,62 @@
+"""배치 작업 워커 프로세스 (JOB_QUEUE="db").
+
+API 서버와 따로 실행되어 Job 테이블에서 작업을 claim하고 job_service.process_job으로 처리한다.
+큐/lease 동작은 service.job_queue 참고. 같은 DB를 보는 워커를 여러 개 띄우면 처리량이 늘어난다.
+
+SIGTERM/SIGINT를 받으면 처리 중인 작업을 끝낸 뒤 종료한다.
+처리 중에 강제 종료되면 lease가 만료된 뒤 다른 워커가 그 작업을 다시 가져간다
+(이미 끝난 이미지는 결과 캐시에 있어 다시 계산하지 않는다).
+
+사용법 (컨테이너 내부):
+    cd /app/src && uv run python worker.py
+    cd /app/src && uv run python worker.py --once   # 대기 중 작업을 모두 처리하고 종료
+"""
+
+import argparse
+import signal
+import threading
+
+from loguru import logger
+
+import model.benchmark  # noqa: F401 — 테이블 등록
+import model.image  # noqa: F401 — 테이블 등록
+import model.job  # noqa: F401 — 테이블 등록
+import model.user  # noqa: F401 — 테이블 등록
+from core.config import settings
+from model.database import create_db_and_tables
+from processor.pool_manager import pool_manager
+from service import job_queue, job_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="nogil-bench 배치 작업 워커")
+    parser.add_argument("--once", action="store_true", help="큐가 비면 종료")
+    args = parser.parse_args()
+
+    owner = job_queue.worker_id()
+    stop = threading.Event()
+
+    def _stop(signum, _frame):
+        logger.info(f"signal {signum}: 처리 중인 작업을 끝내고 종료합니다")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    create_db_and_tables()
+    if settings.POOL_ENABLED:
+        pool_manager.start(settings.pool_prewarm)
+    logger.info(
+        f"worker {owner} 시작 (GIL enabled: {settings.gil_enabled}, "
+        f"lease {settings.JOB_LEASE_SECONDS}s, poll {settings.JOB_POLL_SECONDS}s)"
+    )
+
+    try:
+        processed = job_queue.serve(job_service.get_engine(), owner, stop, once=args.once)
+    finally:
+        pool_manager.shutdown()
+    logger.info(f"worker {owner} 종료 (처리한 작업 {processed}개)")
+
+
+if __name__ == "__main__":
+    main()
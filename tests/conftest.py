@@ -1,7 +1,7 @@
 """pytest 공용 fixture.
 
 모든 API 테스트는 in-memory SQLite DB를 사용하여 격리된다.
-- client: TestClient (인증 없음)
+- client: TestClient (인증 없음, 테스트별 OUTPUT_DIR)
 - auth_headers: 회원가입 + 로그인한 유저의 Authorization 헤더
 - second_user_headers: 소유권 테스트용 두 번째 유저 헤더
 """
@@ -44,7 +44,17 @@ def session():
 
 
 @pytest.fixture()
-def client(session):
+def output_dir(tmp_path, monkeypatch):
+    """테스트마다 빈 OUTPUT_DIR. 결과 캐시 파일이 테스트 사이에 적중하지 않게 한다."""
+    from core.config import settings
+
+    path = tmp_path / "outputs"
+    monkeypatch.setattr(settings, "OUTPUT_DIR", str(path))
+    return path
+
+
+@pytest.fixture()
+def client(session, output_dir):
     """get_session을 테스트용 세션으로 오버라이드한 TestClient."""
 
     def _override():
@@ -21,6 +21,7 @@ class TestRunBenchmark:
         assert data["workers"] == 1  # sync는 항상 1
         assert data["image_count"] == 2
         assert data["duration"] > 0
+        assert data["cold_duration"] is None  # sync는 풀을 쓰지 않음
         assert data["id"] is not None
 
     def test_run_threading(self, client, auth_headers):
@@ -33,6 +34,9 @@ class TestRunBenchmark:
         data = resp.json()
         assert data["method"] == "threading"
         assert data["workers"] == 2
+        # 풀 생성 포함(cold)과 영구 풀(warm) 시간을 따로 기록
+        assert data["cold_duration"] > 0
+        assert data["duration"] > 0
 
     def test_run_multiprocessing(self, client, auth_headers):
         resp = client.post(
@@ -41,7 +45,31 @@ class TestRunBenchmark:
             headers=auth_headers,
         )
         assert resp.status_code == 201
-        assert resp.json()["method"] == "multiprocessing"
+        data = resp.json()
+        assert data["method"] == "multiprocessing"
+        assert data["ipc_ms"] is not None  # 워커 → 부모 결과 전송 시간
+
+    def test_recorded_workers_match_spawned(self, client, auth_headers, monkeypatch):
+        """MP_AUTO_WORKERS를 켜도 벤치마크는 요청(기록)한 워커 수 그대로 프로세스를 띄운다."""
+        from processor import mp_runner
+
+        monkeypatch.setattr(mp_runner.settings, "MP_AUTO_WORKERS", True)
+        spawned = []
+        original = mp_runner.create_executor
+
+        def _spy(workers, *args, **kwargs):
+            spawned.append(workers)
+            return original(workers, *args, **kwargs)
+
+        monkeypatch.setattr(mp_runner, "create_executor", _spy)
+        resp = client.post(
+            "/api/benchmarks/run",
+            json={"method": "multiprocessing", "operation": "blur", "workers": 4, "image_count": 2},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        assert resp.json()["workers"] == 4
+        assert spawned and set(spawned) == {4}
 
     def test_run_frethread(self, client, auth_headers):
         resp = client.post(
@@ -52,6 +80,60 @@ class TestRunBenchmark:
         assert resp.status_code == 201
         assert resp.json()["method"] == "frethread"
 
+    def test_run_async(self, client, auth_headers):
+        """async는 서버 이벤트 루프에서 실행되고 루프 지연이 함께 기록된다."""
+        resp = client.post(
+            "/api/benchmarks/run",
+            json={"method": "async", "operation": "blur", "workers": 2, "image_count": 4},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["method"] == "async"
+        assert data["cold_duration"] > 0
+        assert data["loop_lag_max_ms"] is not None
+        assert data["loop_lag_max_ms"] >= data["loop_lag_mean_ms"] >= 0
+        assert data["peak_rss_mb"] > 0
+
+    def test_run_decode_cache(self, client, auth_headers):
+        """decode_cache=true면 캐시 사용 여부가 기록되고, 기본값은 캐시를 우회한다."""
+        body = {"method": "threading", "operation": "grayscale", "workers": 2, "image_count": 4}
+        default = client.post("/api/benchmarks/run", json=body, headers=auth_headers).json()
+        cached = client.post(
+            "/api/benchmarks/run", json={**body, "decode_cache": True}, headers=auth_headers
+        ).json()
+        assert default["decode_cache"] is False
+        assert cached["decode_cache"] is True
+
+    def test_run_stage_timings(self, client, auth_headers):
+        """기본으로 단계별 시간을 기록하고, stage_timings=false면 기록하지 않는다."""
+        body = {"method": "threading", "operation": "blur", "workers": 2, "image_count": 2}
+        data = client.post("/api/benchmarks/run", json=body, headers=auth_headers).json()
+        assert data["decode_ms"] > 0
+        assert data["convert_ms"] >= 0
+        assert data["op_ms"] > 0
+        assert data["encode_ms"] is None  # 벤치마크는 인코딩하지 않음
+        assert data["ipc_ms"] is None
+
+        off = client.post(
+            "/api/benchmarks/run", json={**body, "stage_timings": False}, headers=auth_headers
+        ).json()
+        assert off["decode_ms"] is None and off["op_ms"] is None
+
+    def test_run_auto(self, client, auth_headers):
+        """auto는 실제 method로 실행되고 선택 근거/예측 시간이 함께 저장된다."""
+        resp = client.post(
+            "/api/benchmarks/run",
+            json={"method": "auto", "operation": "blur", "workers": 4, "image_count": 4},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["method"] in ("sync", "threading", "multiprocessing", "frethread")
+        assert data["workers"] <= 4
+        assert data["predicted_duration"] > 0
+        assert data["decision"]
+
     def test_run_invalid_method(self, client, auth_headers):
         resp = client.post(
             "/api/benchmarks/run",
@@ -156,6 +238,7 @@ class TestCompareBenchmarks:
         assert len(data) == 2
         methods = {d["method"] for d in data}
         assert methods == {"sync", "threading"}
+        assert all(d["op_ms"] > 0 for d in data)
 
     def test_compare_not_found(self, client, auth_headers):
         resp = client.get(
@@ -0,0 +1,61 @@
+"""processor.cost_model 테스트.
+
+사전값만으로도 환경(GIL 상태)에 맞는 method를 고르고,
+벤치마크 기록이 있으면 그 실측치 쪽으로 선택이 바뀌는지 검증한다.
+"""
+
+import pytest
+
+from processor.cost_model import CostModel, Sample, work
+
+
+def test_work_shrinks_after_resize():
+    steps = {"steps": [{"operation": "resize", "params": {"width": 100, "height": 100}},
+                       {"operation": "blur"}]}
+    resized, _ = work("pipeline", steps, megapixels=4.0)
+    full, _ = work("blur", None, megapixels=4.0)
+    assert resized < full
+
+
+def test_watermark_holds_gil():
+    total, released = work("watermark", None, megapixels=1.0)
+    assert released < total
+
+
+def test_single_image_prefers_sync():
+    model = CostModel(gil_enabled=True)
+    assert model.choose("blur", None, image_count=1, megapixels=1.0).method == "sync"
+
+
+def test_frethread_only_without_gil():
+    assert "frethread" not in CostModel(gil_enabled=True).methods()
+    decision = CostModel(gil_enabled=False).choose("blur", None, image_count=32, megapixels=2.0)
+    assert decision.method in ("frethread", "threading")
+    assert decision.workers > 1
+    assert decision.source == "prior"
+
+
+def test_gil_bound_operation_penalized_with_gil():
+    """GIL=1이면 GIL을 잡는 구간만큼 threading 병렬 효율을 깎는다."""
+    with_gil, _ = CostModel(gil_enabled=True).predict("threading", 4, "watermark", None, 32, 1.0)
+    no_gil, _ = CostModel(gil_enabled=False).predict("threading", 4, "watermark", None, 32, 1.0)
+    assert with_gil > no_gil
+
+
+def test_history_overrides_prior():
+    """기록상 multiprocessing이 sync보다 느리면 선택하지 않는다."""
+    history = [
+        Sample("sync", "blur", 1, 10, duration=1.0),
+        Sample("threading", "blur", 4, 10, duration=0.3, cold_duration=0.31),
+        Sample("multiprocessing", "blur", 4, 10, duration=2.0, cold_duration=2.5),
+    ]
+    model = CostModel(gil_enabled=True, samples=history, reference_megapixels=1.0)
+    decision = model.choose("blur", None, image_count=10, megapixels=1.0, max_workers=4)
+    assert decision.method == "threading"
+    assert decision.source == "history"
+    assert decision.predicted == pytest.approx(0.3, rel=0.2)
+
+
+def test_max_workers_cap():
+    decision = CostModel(gil_enabled=False).choose("blur", None, 64, 4.0, max_workers=2)
+    assert decision.workers <= 2
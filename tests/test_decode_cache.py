@@ -0,0 +1,135 @@
+"""processor.decode_cache 테스트.
+
+적중/미스 카운터, 파일 변경 시 무효화, 바이트 상한 축출,
+러너의 캐시 사용/우회(use_cache, DECODE_CACHE_ENABLED)를 검증한다.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from processor import decode_cache, sync_runner, thread_runner
+from processor.decode_cache import DecodeCache, image_bytes
+from processor.image_io import decode_rgb, load_rgb
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture()
+def png(tmp_path):
+    path = tmp_path / "a.png"
+    Image.new("RGB", (40, 30), (10, 20, 30)).save(path)
+    return str(path)
+
+
+@pytest.fixture()
+def shared_cache(monkeypatch):
+    """image_io가 쓰는 전역 캐시를 테스트 전용 인스턴스로 바꾼다."""
+    cache = DecodeCache(max_bytes=64 * 1024 * 1024)
+    monkeypatch.setattr("processor.image_io.decode_cache", cache)
+    return cache
+
+
+def test_hit_after_miss(png):
+    cache = DecodeCache(max_bytes=1024 * 1024)
+    first = cache.get(png, None, decode_rgb)
+    second = cache.get(png, None, decode_rgb)
+    assert second is first
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+    assert stats["bytes"] == 40 * 30 * 3
+
+
+def test_size_hint_is_part_of_key(png):
+    cache = DecodeCache(max_bytes=1024 * 1024)
+    cache.get(png, None, decode_rgb)
+    cache.get(png, (20, 15), decode_rgb)
+    assert cache.stats()["misses"] == 2
+
+
+def test_modified_file_is_reloaded(png):
+    cache = DecodeCache(max_bytes=1024 * 1024)
+    cache.get(png, None, decode_rgb)
+    Image.new("RGB", (50, 30), (0, 0, 0)).save(png)
+    stat = os.stat(png)
+    os.utime(png, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get(png, None, decode_rgb).size == (50, 30)
+    assert cache.stats()["misses"] == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", (10, 10)).save(path)
+        paths.append(str(path))
+    cache = DecodeCache(max_bytes=2 * 10 * 10 * 3)
+
+    cache.get(paths[0], None, decode_rgb)
+    cache.get(paths[1], None, decode_rgb)
+    cache.get(paths[0], None, decode_rgb)  # 0을 최근 사용으로
+    cache.get(paths[2], None, decode_rgb)  # 1이 축출됨
+
+    assert cache.stats()["evictions"] == 1
+    cache.get(paths[0], None, decode_rgb)
+    assert cache.stats()["hits"] == 2
+    cache.get(paths[1], None, decode_rgb)
+    assert cache.stats()["misses"] == 4
+
+
+def test_oversized_image_not_cached(png):
+    cache = DecodeCache(max_bytes=100)
+    cache.get(png, None, decode_rgb)
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["uncacheable"] == 1
+
+
+def test_concurrent_access(png):
+    cache = DecodeCache(max_bytes=1024 * 1024)
+
+    def _read():
+        for _ in range(50):
+            assert cache.get(png, None, decode_rgb).size == (40, 30)
+
+    threads = [threading.Thread(target=_read) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 400
+    assert stats["entries"] == 1
+    assert stats["bytes"] == image_bytes(cache.get(png, None, decode_rgb))
+
+
+def test_load_rgb_bypass_by_default(png, shared_cache):
+    load_rgb(png)
+    load_rgb(png, use_cache=True)
+    load_rgb(png, use_cache=True)
+    assert shared_cache.stats()["hits"] == 1
+    assert shared_cache.stats()["misses"] == 1
+
+
+def test_disabled_setting_skips_cache(png, shared_cache, monkeypatch):
+    monkeypatch.setattr("processor.image_io.settings.DECODE_CACHE_ENABLED", False)
+    load_rgb(png, use_cache=True)
+    assert shared_cache.stats()["misses"] == 0
+
+
+@pytest.mark.parametrize("runner", [sync_runner, thread_runner])
+def test_runner_use_cache(runner, shared_cache):
+    paths = sorted(str(p) for p in FIXTURES_DIR.glob("*.png"))
+    cached = runner.run(paths * 2, "grayscale", use_cache=True)
+    uncached = runner.run(paths, "grayscale")
+    stats = shared_cache.stats()
+    # 스레드가 같은 이미지를 동시에 처음 읽으면 둘 다 미스일 수 있다
+    assert stats["hits"] + stats["misses"] == len(paths) * 2
+    assert stats["entries"] == len(paths)
+    assert [r.tobytes() for r in cached[: len(paths)]] == [r.tobytes() for r in uncached]
+
+
+def test_module_singleton():
+    assert isinstance(decode_cache.cache, DecodeCache)
@@ -0,0 +1,97 @@
+"""processor.fair_scheduler 테스트.
+
+사용자 사이 deficit round-robin 순서, priority 가중치, slots 동시 실행,
+기다리는 중 취소를 검증한다.
+"""
+
+import threading
+import time
+
+from processor.fair_scheduler import FairScheduler
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timeout"
+        time.sleep(0.001)
+
+
+def _grant_order(scheduler: FairScheduler, tickets: list[tuple[str, int, int]]) -> list[str]:
+    """슬롯을 막아 둔 채 tickets(이름, user_id, priority)를 순서대로 대기시킨 뒤 풀어 준다."""
+    order: list[str] = []
+    blocker = scheduler.turn(user_id=0, cost=1)
+    assert blocker.__enter__() is True
+
+    def _run(name: str, user_id: int, priority: int) -> None:
+        with scheduler.turn(user_id, cost=1, priority=priority) as granted:
+            assert granted
+            order.append(name)
+
+    threads = []
+    for n, ticket in enumerate(tickets, start=1):
+        t = threading.Thread(target=_run, args=ticket)
+        t.start()
+        threads.append(t)
+        _wait_until(lambda n=n: scheduler.stats()["waiting"] == n)
+
+    blocker.__exit__(None, None, None)
+    for t in threads:
+        t.join()
+    return order
+
+
+def test_round_robin_across_users():
+    """먼저 온 사용자의 조각이 많아도 다른 사용자 조각이 사이에 끼어든다."""
+    scheduler = FairScheduler(slots=1, quantum=1)
+    order = _grant_order(
+        scheduler, [("a1", 1, 0), ("a2", 1, 0), ("a3", 1, 0), ("b1", 2, 0)]
+    )
+    assert order == ["a1", "b1", "a2", "a3"]
+    assert scheduler.stats()["users"] == 0
+
+
+def test_priority_weight():
+    """priority 1인 사용자는 한 라운드에 두 조각씩 받는다."""
+    scheduler = FairScheduler(slots=1, quantum=1)
+    order = _grant_order(
+        scheduler,
+        [("a1", 1, 1), ("a2", 1, 1), ("a3", 1, 1), ("b1", 2, 0), ("b2", 2, 0)],
+    )
+    assert order == ["a1", "a2", "b1", "a3", "b2"]
+
+
+def test_priority_within_user():
+    scheduler = FairScheduler(slots=1, quantum=1)
+    order = _grant_order(scheduler, [("low", 1, 0), ("high", 1, 3)])
+    assert order == ["high", "low"]
+
+
+def test_slots_run_concurrently():
+    scheduler = FairScheduler(slots=2, quantum=4)
+    with scheduler.turn(1, cost=4) as first, scheduler.turn(2, cost=4) as second:
+        assert first and second
+        assert scheduler.stats()["running"] == 2
+    assert scheduler.stats()["running"] == 0
+
+
+def test_cancel_while_waiting():
+    scheduler = FairScheduler(slots=1, quantum=1)
+    cancel = threading.Event()
+    result = []
+
+    def _wait() -> None:
+        with scheduler.turn(2, cost=1, cancel=cancel) as granted:
+            result.append(granted)
+
+    with scheduler.turn(1, cost=1):
+        t = threading.Thread(target=_wait)
+        t.start()
+        _wait_until(lambda: scheduler.stats()["waiting"] == 1)
+        cancel.set()
+        scheduler.wake()
+        t.join()
+
+    assert result == [False]
+    stats = scheduler.stats()
+    assert (stats["cancelled"], stats["waiting"], stats["users"]) == (1, 0, 0)
@@ -1,6 +1,7 @@
 """이미지 API (upload, list, get, process, download, delete) + 소유권 테스트."""
 
 import io
+import os
 
 from PIL import Image
 
@@ -71,6 +72,227 @@ class TestProcess:
         assert resp.status_code == 200
         assert resp.json()["status"] == "completed"
 
+    def test_process_pipeline(self, client, auth_headers):
+        """steps로 여러 작업을 한 번에 적용한다."""
+        upload = client.post(
+            "/api/images/upload",
+            headers=auth_headers,
+            files={"file": _make_upload_file()},
+        )
+        image_id = upload.json()["id"]
+
+        resp = client.post(
+            f"/api/images/{image_id}/process",
+            headers=auth_headers,
+            json={
+                "steps": [
+                    {"operation": "resize", "params": {"width": 60, "height": 40}},
+                    {"operation": "sharpen"},
+                    {"operation": "watermark"},
+                ]
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["operation"] == "resize+sharpen+watermark"
+        assert Image.open(data["output_path"]).size == (60, 40)
+
+    def test_process_requires_operation_or_steps(self, client, auth_headers):
+        resp = client.post(
+            "/api/images/1/process",
+            headers=auth_headers,
+            json={"operation": "blur", "steps": [{"operation": "sharpen"}]},
+        )
+        assert resp.status_code == 422
+        resp = client.post("/api/images/1/process", headers=auth_headers, json={})
+        assert resp.status_code == 422
+
+    def test_process_invalid_params(self, client, auth_headers):
+        """레지스트리 스키마에 맞지 않는 params → 400 INVALID_OPERATION."""
+        upload = client.post(
+            "/api/images/upload",
+            headers=auth_headers,
+            files={"file": _make_upload_file()},
+        )
+        image_id = upload.json()["id"]
+        resp = client.post(
+            f"/api/images/{image_id}/process",
+            headers=auth_headers,
+            json={"operation": "blur", "params": {"radius": -1}},
+        )
+        assert resp.status_code == 400
+        assert resp.json()["error_code"] == "INVALID_OPERATION"
+
+    def test_process_tiled(self, client, auth_headers, monkeypatch):
+        """TILE_MIN_MEGAPIXELS 이상이면 strip 병렬 처리 경로를 탄다."""
+        from core.config import settings
+        from processor import tile_runner
+
+        calls = []
+        original = tile_runner.run_tiled
+
+        def _spy(*args, **kwargs):
+            calls.append(args[1])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(settings, "TILE_MIN_MEGAPIXELS", 0.0)
+        monkeypatch.setattr(tile_runner, "run_tiled", _spy)
+
+        upload = client.post(
+            "/api/images/upload",
+            headers=auth_headers,
+            files={"file": _make_upload_file()},
+        )
+        image_id = upload.json()["id"]
+
+        resp = client.post(
+            f"/api/images/{image_id}/process",
+            headers=auth_headers,
+            json={"operation": "sharpen"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "completed"
+        assert calls == ["sharpen"]
+
+    def test_process_result_cache(self, client, auth_headers, monkeypatch):
+        """같은 원본 + 같은 params면 디코드 없이 기존 결과를, params가 다르면 새 결과를 준다."""
+        from service import image_service
+
+        ids = [
+            client.post(
+                "/api/images/upload",
+                headers=auth_headers,
+                files={"file": _make_upload_file(name)},
+            ).json()["id"]
+            for name in ("a.png", "b.png")  # 내용이 같은 두 업로드
+        ]
+
+        def _process(image_id, params):
+            resp = client.post(
+                f"/api/images/{image_id}/process",
+                headers=auth_headers,
+                json={"operation": "blur", "params": params},
+            )
+            assert resp.status_code == 200
+            return resp.json()["output_path"]
+
+        first = _process(ids[0], {"radius": 3})
+        decodes = []
+        original = image_service.load_rgb
+
+        def _spy(*args, **kwargs):
+            decodes.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(image_service, "load_rgb", _spy)
+
+        assert _process(ids[1], {"radius": 3}) == first
+        assert decodes == []
+        second = _process(ids[0], {"radius": 5})
+        assert second != first
+        assert len(decodes) == 1
+        assert Image.open(first).size == Image.open(second).size == (100, 100)
+
+    def test_process_result_cache_disabled(self, client, auth_headers, monkeypatch):
+        """RESULT_CACHE_ENABLED=False면 결과 파일이 이미 있어도 다시 처리한다."""
+        from core.config import settings
+        from service import image_service
+
+        image_id = client.post(
+            "/api/images/upload",
+            headers=auth_headers,
+            files={"file": _make_upload_file()},
+        ).json()["id"]
+
+        def _process():
+            resp = client.post(
+                f"/api/images/{image_id}/process",
+                headers=auth_headers,
+                json={"operation": "blur", "params": {"radius": 3}},
+            )
+            assert resp.status_code == 200
+            return resp.json()["output_path"]
+
+        cached = _process()
+        decodes = []
+        original = image_service.load_rgb
+
+        def _spy(*args, **kwargs):
+            decodes.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(image_service, "load_rgb", _spy)
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+
+        output = _process()
+        assert len(decodes) == 1
+        assert output != cached
+        assert os.path.dirname(output) == settings.OUTPUT_DIR
+        assert _process() == output
+        assert len(decodes) == 2
+
+    def test_process_coalesces_per_record_when_cache_disabled(
+        self, client, auth_headers, monkeypatch
+    ):
+        """결과 캐시가 꺼져 있으면 내용이 같은 다른 레코드와 출력 경로를 공유하지 않는다."""
+        from core.config import settings
+        from processor.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        keys = []
+        original = flight.do
+
+        def _do(key, fn):
+            keys.append(key)
+            return original(key, fn)
+
+        monkeypatch.setattr(flight, "do", _do)
+        monkeypatch.setattr("service.image_service.inflight", flight)
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        outputs = []
+        for name in ("a.png", "b.png"):  # 내용이 같은 두 업로드
+            image_id = client.post(
+                "/api/images/upload", headers=auth_headers, files={"file": _make_upload_file(name)}
+            ).json()["id"]
+            resp = client.post(
+                f"/api/images/{image_id}/process",
+                headers=auth_headers,
+                json={"operation": "blur", "params": {"radius": 3}},
+            )
+            outputs.append(resp.json()["output_path"])
+        assert keys[0] != keys[1]
+        assert outputs[0] != outputs[1]
+
+    def test_process_coalesces_in_flight(self, client, auth_headers, monkeypatch):
+        """결과 캐시 미스면 결과 키로 single-flight를 거친다 (끄면 거치지 않음)."""
+        from core.config import settings
+        from processor.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        monkeypatch.setattr("service.image_service.inflight", flight)
+        image_id = client.post(
+            "/api/images/upload",
+            headers=auth_headers,
+            files={"file": _make_upload_file()},
+        ).json()["id"]
+
+        for radius in (3, 3):  # 두 번째는 결과 캐시 적중
+            client.post(
+                f"/api/images/{image_id}/process",
+                headers=auth_headers,
+                json={"operation": "blur", "params": {"radius": radius}},
+            )
+        assert flight.stats()["leaders"] == 1
+
+        monkeypatch.setattr(settings, "COALESCE_REQUESTS", False)
+        resp = client.post(
+            f"/api/images/{image_id}/process",
+            headers=auth_headers,
+            json={"operation": "blur", "params": {"radius": 4}},
+        )
+        assert resp.status_code == 200
+        assert flight.stats()["leaders"] == 1
+
     def test_download_not_processed(self, client, auth_headers):
         """미처리 이미지 다운로드 → 400 IMAGE_NOT_PROCESSED."""
         upload = client.post(
@@ -104,6 +326,31 @@ class TestDelete:
         resp = client.get(f"/api/images/{image_id}", headers=auth_headers)
         assert resp.status_code == 404
 
+    def test_delete_keeps_shared_output(self, client, auth_headers):
+        """다른 레코드가 같은 결과 파일을 가리키면 파일은 남긴다."""
+        ids = [
+            client.post(
+                "/api/images/upload",
+                headers=auth_headers,
+                files={"file": _make_upload_file()},
+            ).json()["id"]
+            for _ in range(2)
+        ]
+        outputs = [
+            client.post(
+                f"/api/images/{image_id}/process",
+                headers=auth_headers,
+                json={"operation": "grayscale"},
+            ).json()["output_path"]
+            for image_id in ids
+        ]
+        assert outputs[0] == outputs[1]
+
+        client.delete(f"/api/images/{ids[0]}", headers=auth_headers)
+        assert os.path.exists(outputs[0])
+        client.delete(f"/api/images/{ids[1]}", headers=auth_headers)
+        assert not os.path.exists(outputs[0])
+
 
 class TestAuthRequired:
     def test_list_without_token(self, client):
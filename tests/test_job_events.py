@@ -0,0 +1,194 @@
+"""작업 진행 이벤트 테스트.
+
+service.job_events의 publish/subscribe와 GET /api/jobs/{id}/events(SSE) 스트림을 검증한다.
+"""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+from sqlmodel import Session
+
+from core.config import settings
+from model.job import Job
+from router import job_router
+from service import job_queue, job_service
+from service.job_events import JobEvents, JobPoller, pollers
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+async def test_publish_from_thread():
+    bus = JobEvents()
+    with bus.subscribe(1) as sub, bus.subscribe(2) as other:
+        thread = threading.Thread(target=bus.publish, args=(1, "image", {"image_id": 7}))
+        thread.start()
+        thread.join()
+        assert await sub.get(timeout=1) == ("image", {"image_id": 7})
+        assert await other.get(timeout=0.01) is None
+        assert bus.stats() == {"published": 1, "delivered": 1, "subscribers": 2}
+    assert bus.stats()["subscribers"] == 0
+
+
+async def test_publish_without_subscribers():
+    bus = JobEvents()
+    bus.publish(1, "status", {"status": "processing"})
+    with bus.subscribe(1) as sub:
+        assert await sub.get(timeout=0.01) is None
+        await asyncio.sleep(0)
+    assert bus.stats()["delivered"] == 0
+
+
+async def test_poller_shared_per_job():
+    """같은 작업을 보는 구독자가 여럿이어도 폴링은 하나이고, 끝난 상태를 보내면 멈춘다."""
+    bus = JobEvents()
+    poller = JobPoller(bus)
+    states = iter(["processing", "processing", "completed"])
+    calls = []
+
+    def _load(job_id):
+        calls.append(job_id)
+        return {"job_id": job_id, "status": next(states)}
+
+    with bus.subscribe(1) as a, bus.subscribe(1) as b:
+        with poller.watch(1, _load, 0.01), poller.watch(1, _load, 0.01):
+            assert poller.stats()["pollers"] == 1
+            for sub in (a, b):
+                assert (await sub.get(timeout=1))[1]["status"] == "processing"
+                assert (await sub.get(timeout=1))[1]["status"] == "completed"
+            await asyncio.sleep(0.05)
+    assert calls == [1, 1, 1]
+    assert poller.stats() == {"polls": 3, "pollers": 0}
+
+
+def _upload(client, auth_headers) -> int:
+    with open(FIXTURES_DIR / "test_cat.png", "rb") as f:
+        resp = client.post(
+            "/api/images/upload",
+            files={"file": ("test_cat.png", f, "image/png")},
+            headers=auth_headers,
+        )
+    return resp.json()["id"]
+
+
+def _create_job(client, auth_headers) -> int:
+    image_id = _upload(client, auth_headers)
+    resp = client.post(
+        "/api/jobs/batch",
+        json={"image_ids": [image_id], "operation": "grayscale", "method": "threading"},
+        headers=auth_headers,
+    )
+    return resp.json()["id"]
+
+
+def _read_events(lines) -> list[tuple[str, dict]]:
+    events, name = [], None
+    for line in lines:
+        if line.startswith("event: "):
+            name = line.removeprefix("event: ")
+        elif line.startswith("data: "):
+            events.append((name, json.loads(line.removeprefix("data: "))))
+    return events
+
+
+def test_stream_finished_job(client, auth_headers):
+    """이미 끝난 작업은 현재 상태 하나를 보내고 닫는다."""
+    job_id = _create_job(client, auth_headers)
+    with client.stream("GET", f"/api/jobs/{job_id}/events", headers=auth_headers) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _read_events(resp.iter_lines())
+    assert len(events) == 1
+    name, data = events[0]
+    assert name == "status"
+    assert (data["job_id"], data["status"], data["processed_count"]) == (job_id, "completed", 1)
+
+
+async def test_stream_live_progress(client, auth_headers, monkeypatch):
+    """처리 중에 연결하면 이미지 완료와 최종 상태를 push로 받는다.
+
+    TestClient는 응답을 끝까지 모은 뒤 돌려주므로 스트림 생성기를 직접 읽는다.
+    """
+    monkeypatch.setattr(settings, "JOB_QUEUE", "db")
+    monkeypatch.setattr(settings, "JOB_POLL_SECONDS", 30.0)  # 이벤트만으로 끝나야 한다
+    job_id = _create_job(client, auth_headers)
+    worker = threading.Thread(
+        target=job_queue.run_next, args=(job_service.get_engine(), "worker-1")
+    )
+
+    chunks = []
+    async for chunk in job_router._event_stream(job_id):
+        chunks.append(chunk)
+        if len(chunks) == 1:
+            worker.start()
+    worker.join()
+    events = _read_events("".join(chunks).splitlines())
+
+    names = [name for name, _ in events]
+    assert names == ["status", "status", "image", "status"]
+    assert events[0][1]["status"] == "queued"
+    assert events[1][1]["status"] == "processing"
+    assert events[2][1]["processed_count"] == 1 and events[2][1]["image_count"] == 1
+    assert Path(events[2][1]["output_path"]).exists()
+    assert events[3][1]["status"] == "completed"
+    assert events[3][1]["processed_count"] == 1
+
+
+async def test_stream_db_mode_shares_poller(client, auth_headers, monkeypatch):
+    """JOB_QUEUE=db에서 다른 프로세스가 바꾼 상태는 작업당 하나의 poller로 모든 스트림에 간다."""
+    monkeypatch.setattr(settings, "JOB_QUEUE", "db")
+    monkeypatch.setattr(settings, "JOB_POLL_SECONDS", 0.01)
+    job_id = _create_job(client, auth_headers)
+
+    streams = [job_router._event_stream(job_id) for _ in range(3)]
+    first = [await anext(stream) for stream in streams]
+    assert pollers.stats()["pollers"] == 1
+
+    # 워커 프로세스가 끝낸 것처럼 publish 없이 행만 바꾼다
+    with Session(job_service.get_engine()) as session:
+        job = session.get(Job, job_id)
+        job.status = "completed"
+        session.add(job)
+        session.commit()
+
+    for head, stream in zip(first, streams, strict=True):
+        events = _read_events((head + "".join([c async for c in stream])).splitlines())
+        assert [data["status"] for _, data in events] == ["queued", "completed"]
+    assert pollers.stats()["pollers"] == 0
+
+
+def test_stream_other_user(client, auth_headers, second_user_headers):
+    job_id = _create_job(client, auth_headers)
+    resp = client.get(f"/api/jobs/{job_id}/events", headers=second_user_headers)
+    assert resp.status_code in (403, 404)
+
+
+def test_stream_without_auth(client):
+    assert client.get("/api/jobs/1/events").status_code == 401
+
+
+def test_stream_releases_session(client, auth_headers, session, monkeypatch):
+    """요청 세션은 스트림을 보내기 전에 닫힌다 (연결이 커넥션 풀을 잡고 있지 않음)."""
+    from main import app
+    from model.database import get_session
+
+    job_id = _create_job(client, auth_headers)
+    log = []
+
+    def _tracked():
+        log.append("open")
+        yield session
+        log.append("close")
+
+    original = job_router._event_stream
+
+    async def _stream(job_id):
+        log.append("stream")
+        async for chunk in original(job_id):
+            yield chunk
+
+    app.dependency_overrides[get_session] = _tracked
+    monkeypatch.setattr(job_router, "_event_stream", _stream)
+    client.get(f"/api/jobs/{job_id}/events", headers=auth_headers)
+    assert log == ["open", "close", "stream"]
@@ -0,0 +1,154 @@
+"""service.job_progress 테스트.
+
+ProgressBuffer의 flush 시점(개수/시간), 여러 스레드의 add, 완료/실패의 bulk UPDATE 기록과
+process_job의 commit 횟수가 이미지 수와 무관한지 검증한다.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import select
+
+from core.config import settings
+from model.image import ImageRecord
+from model.job import Job, JobImage
+from model.user import User
+from service import job_service
+from service.job_progress import LeaseLost, ProgressBuffer
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def test_due_by_count():
+    progress = ProgressBuffer(flush_count=3, flush_seconds=60)
+    assert not progress.due()
+    progress.add(1, "a")
+    progress.add(2, "b")
+    assert not progress.due()
+    progress.add(3, "c")
+    assert progress.due()
+    assert progress.drain() == [(1, "a", None), (2, "b", None), (3, "c", None)]
+    assert progress.pending() == 0 and not progress.due()
+
+
+def test_due_by_time():
+    progress = ProgressBuffer(flush_count=100, flush_seconds=0.02)
+    progress.add(1, "a")
+    assert not progress.due()
+    time.sleep(0.05)
+    assert progress.due()
+
+
+def test_concurrent_add():
+    progress = ProgressBuffer(flush_count=10_000)
+    barrier = threading.Barrier(8)
+
+    def _add(n: int) -> None:
+        barrier.wait()
+        for i in range(500):
+            progress.add(n * 1000 + i, "")
+
+    threads = [threading.Thread(target=_add, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    drained = progress.drain()
+    assert len(drained) == 4000
+    assert len({record_id for record_id, _, _ in drained}) == 4000
+
+
+def test_flush_bulk_updates(session):
+    session.add(User(id=1, email="p@test.com", hashed_password="-"))
+    records = [ImageRecord(filename=str(i), original_path="x", user_id=1) for i in range(3)]
+    job = Job(user_id=1, operation="grayscale", image_ids="[]", image_count=3)
+    session.add_all([*records, job])
+    session.commit()
+    session.add_all(JobImage(job_id=job.id, image_id=r.id) for r in records)
+    session.commit()
+
+    progress = ProgressBuffer()
+    for record in records[:2]:
+        progress.add(record.id, f"/out/{record.id}.jpg")
+    progress.fail(records[2].id, "broken")
+    assert progress.flush(session, job, "grayscale") == 3
+    assert progress.flush(session, job, "grayscale") == 0
+
+    assert (job.processed_count, job.failed_count) == (2, 1)
+    rows = session.exec(select(ImageRecord).order_by(ImageRecord.id)).all()
+    assert [(r.status, r.operation) for r in rows] == [
+        ("completed", "grayscale"),
+        ("completed", "grayscale"),
+        ("uploaded", None),
+    ]
+    assert [r.output_path for r in rows] == [f"/out/{r.id}.jpg" for r in records[:2]] + [None]
+    items = session.exec(select(JobImage).order_by(JobImage.image_id)).all()
+    assert [(i.status, i.error_message) for i in items] == [
+        ("completed", None),
+        ("completed", None),
+        ("failed", "broken"),
+    ]
+
+
+def test_flush_fenced_by_lease_owner(session):
+    session.add(User(id=1, email="p@test.com", hashed_password="-"))
+    record = ImageRecord(filename="0", original_path="x", user_id=1)
+    job = Job(user_id=1, operation="grayscale", image_ids="[]", image_count=1, lease_owner="w2")
+    session.add_all([record, job])
+    session.commit()
+    session.add(JobImage(job_id=job.id, image_id=record.id))
+    session.commit()
+
+    progress = ProgressBuffer()
+    progress.add(record.id, "/out/0.jpg")
+    with pytest.raises(LeaseLost):
+        progress.flush(session, job, "grayscale", owner="w1")
+    session.refresh(job)
+    assert job.processed_count == 0
+    assert session.get(JobImage, (job.id, record.id)).status == "pending"
+
+
+def _upload(client, auth_headers, name: str) -> int:
+    with open(FIXTURES_DIR / name, "rb") as f:
+        resp = client.post(
+            "/api/images/upload",
+            files={"file": (name, f, "image/png")},
+            headers=auth_headers,
+        )
+    return resp.json()["id"]
+
+
+def _batch_commits(client, auth_headers, image_ids: list[int]) -> int:
+    commits = 0
+
+    def _count(_conn):
+        nonlocal commits
+        commits += 1
+
+    engine = job_service.get_engine()
+    event.listen(engine, "commit", _count)
+    try:
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": image_ids, "operation": "grayscale", "method": "threading"},
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine, "commit", _count)
+    job = client.get(f"/api/jobs/{resp.json()['id']}", headers=auth_headers).json()
+    assert job["status"] == "completed"
+    assert job["processed_count"] == len(image_ids)
+    return commits
+
+
+def test_process_job_commits(client, auth_headers, monkeypatch):
+    """작업 생성 1 + 시작 1 + 마지막 flush(최종 상태 포함) 1 — 이미지 수와 무관."""
+    ids = [_upload(client, auth_headers, name) for name in ("test_cat.png", "test_landscape.png")]
+    assert _batch_commits(client, auth_headers, ids) == 3
+
+    monkeypatch.setattr(settings, "JOB_PROGRESS_FLUSH_COUNT", 1)
+    monkeypatch.setattr(settings, "OUTPUT_DIR", str(Path(settings.OUTPUT_DIR) / "again"))
+    assert _batch_commits(client, auth_headers, ids) == 3 + len(ids)
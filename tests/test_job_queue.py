@@ -0,0 +1,243 @@
+"""service.job_queue 테스트.
+
+claim 순서/상태, 여러 워커의 동시 claim(같은 작업을 두 번 가져가지 않음),
+lease 만료 회수와 시도 횟수 상한, heartbeat, lease를 잃은 워커가 기록하지 않고 멈추는지,
+JOB_QUEUE=db에서 워커가 작업을 끝내는 흐름을 검증한다.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, create_engine
+
+from core.config import settings
+from model.job import Job
+from model.user import User
+from service import job_queue, job_service
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    """스레드마다 별도 커넥션을 쓰도록 파일 SQLite를 사용한다."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/queue.db",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _add_jobs(engine: Engine, count: int) -> list[int]:
+    with Session(engine) as session:
+        user = session.get(User, 1)
+        if user is None:
+            session.add(User(id=1, email="queue@test.com", hashed_password="-"))
+        jobs = [
+            Job(user_id=1, operation="grayscale", image_ids="[]", image_count=0)
+            for _ in range(count)
+        ]
+        session.add_all(jobs)
+        session.commit()
+        return [job.id for job in jobs]
+
+
+def _claim(engine: Engine, owner: str, lease: float | None = None) -> Job | None:
+    with Session(engine) as session:
+        return job_queue.claim(session, owner, lease)
+
+
+def _get(engine: Engine, job_id: int) -> Job:
+    with Session(engine) as session:
+        return session.get(Job, job_id)
+
+
+def test_claim_oldest_first(engine):
+    first, second = _add_jobs(engine, 2)
+    job = _claim(engine, "w1")
+    assert job.id == first
+    assert (job.status, job.lease_owner, job.attempts) == ("processing", "w1", 1)
+    assert job.lease_expires_at is not None
+    assert _claim(engine, "w2").id == second
+    assert _claim(engine, "w3") is None
+
+
+def test_concurrent_claims_are_exclusive(engine):
+    ids = _add_jobs(engine, 30)
+    claimed: list[int] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(6)
+
+    def _worker(n: int) -> None:
+        barrier.wait()
+        while (job := _claim(engine, f"w{n}")) is not None:
+            with lock:
+                claimed.append(job.id)
+
+    threads = [threading.Thread(target=_worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(claimed) == ids
+
+
+def test_expired_lease_is_reclaimed(engine):
+    (job_id,) = _add_jobs(engine, 1)
+    _claim(engine, "crashed", lease=0.01)
+    time.sleep(0.05)
+
+    job = _claim(engine, "w2")
+    assert job.id == job_id
+    assert (job.lease_owner, job.attempts) == ("w2", 2)
+    with Session(engine) as session:
+        assert job_queue.heartbeat(session, job_id, "crashed") is False
+
+
+def test_heartbeat_keeps_lease(engine):
+    (job_id,) = _add_jobs(engine, 1)
+    _claim(engine, "w1", lease=0.05)
+    with Session(engine) as session:
+        assert job_queue.heartbeat(session, job_id, "w1", lease_seconds=60) is True
+    time.sleep(0.1)
+    assert _claim(engine, "w2") is None
+
+
+def test_max_attempts_marks_failed(engine, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 2)
+    (job_id,) = _add_jobs(engine, 1)
+    for owner in ("a", "b"):
+        assert _claim(engine, owner, lease=0.01).id == job_id
+        time.sleep(0.05)
+
+    assert _claim(engine, "c") is None
+    job = _get(engine, job_id)
+    assert job.status == "failed"
+    assert job.lease_owner is None
+    assert "2번" in job.error_message
+
+
+def test_lease_keeper_releases(engine):
+    (job_id,) = _add_jobs(engine, 1)
+    _claim(engine, "w1", lease=0.05)
+    with job_queue.LeaseKeeper(engine, job_id, "w1", interval=0.01) as keeper:
+        time.sleep(0.1)  # 만료 시간보다 길게 처리해도 연장된다
+        assert _claim(engine, "w2") is None
+    assert keeper.lost is False
+    job = _get(engine, job_id)
+    assert job.lease_owner is None and job.lease_expires_at is None
+
+
+def _upload(client, auth_headers) -> int:
+    with open(FIXTURES_DIR / "test_cat.png", "rb") as f:
+        resp = client.post(
+            "/api/images/upload",
+            files={"file": ("test_cat.png", f, "image/png")},
+            headers=auth_headers,
+        )
+    return resp.json()["id"]
+
+
+def test_db_queue_processed_by_worker(client, auth_headers, monkeypatch):
+    """JOB_QUEUE=db면 API는 queued로만 저장하고 워커(run_next)가 처리한다."""
+    monkeypatch.setattr(settings, "JOB_QUEUE", "db")
+    image_id = _upload(client, auth_headers)
+    job_id = client.post(
+        "/api/jobs/batch",
+        json={"image_ids": [image_id], "operation": "grayscale", "method": "threading"},
+        headers=auth_headers,
+    ).json()["id"]
+    assert client.get(f"/api/jobs/{job_id}", headers=auth_headers).json()["status"] == "queued"
+
+    engine = job_service.get_engine()
+    assert job_queue.run_next(engine, "worker-1") == job_id
+    assert job_queue.run_next(engine, "worker-1") is None
+
+    data = client.get(f"/api/jobs/{job_id}", headers=auth_headers).json()
+    assert data["status"] == "completed"
+    assert data["processed_count"] == 1
+    assert data["attempts"] == 1
+    assert data["lease_owner"] is None
+
+
+def test_lost_lease_stops_without_writing(engine, output_dir, monkeypatch):
+    """처리 중 다른 워커가 lease를 가져가면 이미지 사이에서 멈추고 상태/진행률을 쓰지 않는다.
+
+    heartbeat 스레드가 따로 DB에 쓰므로 커넥션을 공유하는 in-memory DB 대신 파일 DB를 쓴다.
+    """
+    from model.image import ImageRecord
+    from processor import runners
+
+    monkeypatch.setattr(settings, "JOB_SLICE_IMAGES", 1)
+    monkeypatch.setattr(settings, "JOB_PROGRESS_FLUSH_COUNT", 1)
+    monkeypatch.setattr(settings, "JOB_HEARTBEAT_SECONDS", 0.01)
+    monkeypatch.setattr(job_service, "_engine", engine)
+    _add_jobs(engine, 0)  # 사용자만 만든다
+    with Session(engine) as session:
+        records = [
+            ImageRecord(
+                filename="test_cat.png",
+                original_path=str(FIXTURES_DIR / "test_cat.png"),
+                user_id=1,
+            )
+            for _ in range(3)
+        ]
+        session.add_all(records)
+        session.commit()
+        ids = [record.id for record in records]
+        job_id = job_service.create_job(ids, "grayscale", None, "threading", 4, 1, session).id
+    calls = []
+    original = runners.iter_run
+
+    def _spy(*args, **kwargs):
+        calls.append(1)
+        for item in original(*args, **kwargs):
+            yield item
+            # 첫 이미지가 기록된 뒤 lease 만료 → 다른 워커가 claim한 상황
+            with Session(engine) as session:
+                session.get(Job, job_id).lease_owner = "worker-2"
+                session.commit()
+            deadline = time.monotonic() + 5
+            while job_id not in job_service._lease_lost:
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+
+    monkeypatch.setattr(runners, "iter_run", _spy)
+    assert job_queue.run_next(engine, "worker-1") == job_id
+
+    assert len(calls) == 1
+    job = _get(engine, job_id)
+    assert (job.status, job.lease_owner, job.processed_count) == ("processing", "worker-2", 1)
+    assert job.completed_at is None
+
+
+def test_serve_once_drains_queue(engine, monkeypatch):
+    ids = _add_jobs(engine, 3)
+    monkeypatch.setattr(job_service, "_engine", engine)
+    processed = job_queue.serve(engine, "w1", threading.Event(), once=True)
+    assert processed == 3
+    assert all(_get(engine, job_id).status == "completed" for job_id in ids)
+
+
+def test_postgres_skip_locked(pg_engine):
+    """PostgreSQL에서도 동시 claim이 겹치지 않는다 (TEST_DATABASE_URL 필요)."""
+    ids = _add_jobs(pg_engine, 10)
+    claimed: list[int] = []
+    lock = threading.Lock()
+
+    def _worker(n: int) -> None:
+        while (job := _claim(pg_engine, f"pg{n}")) is not None:
+            with lock:
+                claimed.append(job.id)
+
+    threads = [threading.Thread(target=_worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(claimed) == ids
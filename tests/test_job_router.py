@@ -4,6 +4,8 @@ POST /api/jobs/batch        — 배치 작업 생성 (202)
 GET  /api/jobs/              — 작업 목록
 GET  /api/jobs/{id}          — 작업 상태
 GET  /api/jobs/{id}/result   — 완료된 결과
+GET  /api/jobs/{id}/images   — 이미지별 처리 결과
+POST /api/jobs/{id}/retry    — 실패한 이미지만 재처리
 
 Note: TestClient에서 BackgroundTasks는 응답 반환 전에 동기적으로 실행된다.
 따라서 202 응답 직후 작업이 이미 completed 상태임.
@@ -72,6 +74,158 @@ class TestCreateBatchJob:
         status_resp = client.get(f"/api/jobs/{job_id}", headers=auth_headers)
         assert status_resp.json()["processed_count"] == 2
 
+    def test_batch_threading(self, client, auth_headers):
+        """method/workers가 러너로 전달되어 병렬 처리된다."""
+        ids = [
+            _upload_image(client, auth_headers, "test_cat.png"),
+            _upload_image(client, auth_headers, "test_landscape.png"),
+        ]
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": ids, "operation": "blur", "method": "threading", "workers": 2},
+            headers=auth_headers,
+        )
+        job_id = resp.json()["id"]
+
+        status_resp = client.get(f"/api/jobs/{job_id}", headers=auth_headers)
+        assert status_resp.json()["status"] == "completed"
+        assert status_resp.json()["processed_count"] == 2
+
+        result = client.get(f"/api/jobs/{job_id}/result", headers=auth_headers).json()
+        assert all(r["status"] == "completed" for r in result)
+        assert all(Path(r["output_path"]).exists() for r in result)
+
+    def test_batch_async(self, client, auth_headers):
+        """async → 서버 이벤트 루프에서 스트리밍 처리되어 이미지마다 기록된다."""
+        ids = [
+            _upload_image(client, auth_headers, "test_cat.png"),
+            _upload_image(client, auth_headers, "test_landscape.png"),
+        ]
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": ids, "operation": "grayscale", "method": "async", "workers": 2},
+            headers=auth_headers,
+        )
+        job_id = resp.json()["id"]
+        status_resp = client.get(f"/api/jobs/{job_id}", headers=auth_headers)
+        assert status_resp.json()["status"] == "completed"
+        assert status_resp.json()["processed_count"] == 2
+        assert status_resp.json()["peak_rss_mb"] > 0
+
+        result = client.get(f"/api/jobs/{job_id}/result", headers=auth_headers).json()
+        assert all(Path(r["output_path"]).exists() for r in result)
+
+    def test_batch_auto(self, client, auth_headers):
+        """auto → 비용 모델이 고른 method/workers와 예측 시간이 Job에 기록된다."""
+        ids = [
+            _upload_image(client, auth_headers, "test_cat.png"),
+            _upload_image(client, auth_headers, "test_landscape.png"),
+        ]
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": ids, "operation": "blur", "method": "auto", "workers": 2},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 202
+        data = client.get(f"/api/jobs/{resp.json()['id']}", headers=auth_headers).json()
+        assert data["method"] != "auto"
+        assert data["workers"] <= 2
+        assert data["predicted_duration"] > 0
+        assert data["decision"].startswith(data["method"])
+        assert data["status"] == "completed"
+
+    def test_batch_multiprocessing(self, client, auth_headers):
+        img_id = _upload_image(client, auth_headers)
+        resp = client.post(
+            "/api/jobs/batch",
+            json={
+                "image_ids": [img_id],
+                "operation": "grayscale",
+                "method": "multiprocessing",
+                "workers": 2,
+            },
+            headers=auth_headers,
+        )
+        job_id = resp.json()["id"]
+
+        status_resp = client.get(f"/api/jobs/{job_id}", headers=auth_headers)
+        assert status_resp.json()["status"] == "completed"
+        assert status_resp.json()["processed_count"] == 1
+
+    def test_batch_pipeline(self, client, auth_headers):
+        img_id = _upload_image(client, auth_headers)
+        resp = client.post(
+            "/api/jobs/batch",
+            json={
+                "image_ids": [img_id],
+                "steps": [{"operation": "grayscale"}, {"operation": "blur"}],
+                "method": "threading",
+                "workers": 2,
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 202
+        assert resp.json()["operation"] == "pipeline"
+        job_id = resp.json()["id"]
+
+        result = client.get(f"/api/jobs/{job_id}/result", headers=auth_headers).json()
+        assert result[0]["operation"] == "grayscale+blur"
+        assert Path(result[0]["output_path"]).parent.name == "results"
+
+    def test_batch_operation_or_steps(self, client, auth_headers):
+        """operation과 steps는 함께 줄 수 없다. 둘 다 없으면 blur."""
+        img_id = _upload_image(client, auth_headers)
+        resp = client.post(
+            "/api/jobs/batch",
+            json={
+                "image_ids": [img_id],
+                "operation": "grayscale",
+                "steps": [{"operation": "sharpen"}],
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 422
+
+        resp = client.post("/api/jobs/batch", json={"image_ids": [img_id]}, headers=auth_headers)
+        assert resp.status_code == 202
+        assert resp.json()["operation"] == "blur"
+
+    def test_batch_reuses_cached_results(self, client, auth_headers, monkeypatch):
+        """이미 처리된 이미지(같은 원본 + 같은 params)는 러너에 넘기지 않는다."""
+        from processor import runners
+
+        img_id = _upload_image(client, auth_headers)
+        processed = client.post(
+            f"/api/images/{img_id}/process",
+            json={"operation": "blur", "params": {"radius": 10}},
+            headers=auth_headers,
+        ).json()
+        other_id = _upload_image(client, auth_headers, "test_landscape.png")
+
+        calls = []
+        original = runners.iter_run
+
+        def _spy(method, image_paths, *args, **kwargs):
+            calls.append(len(image_paths))
+            return original(method, image_paths, *args, **kwargs)
+
+        monkeypatch.setattr(runners, "iter_run", _spy)
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": [img_id, other_id], "operation": "blur"},  # 기본 radius=10
+            headers=auth_headers,
+        )
+        job_id = resp.json()["id"]
+
+        assert calls == [1]
+        assert client.get(f"/api/jobs/{job_id}", headers=auth_headers).json()[
+            "processed_count"
+        ] == 2
+        result = client.get(f"/api/jobs/{job_id}/result", headers=auth_headers).json()
+        by_id = {r["id"]: r["output_path"] for r in result}
+        assert by_id[img_id] == processed["output_path"]
+        assert Path(by_id[other_id]).exists()
+
     def test_batch_invalid_image(self, client, auth_headers):
         resp = client.post(
             "/api/jobs/batch",
@@ -192,3 +346,187 @@ class TestGetJobResult:
     def test_result_not_found(self, client, auth_headers):
         resp = client.get("/api/jobs/9999/result", headers=auth_headers)
         assert resp.status_code == 404
+
+
+class TestCancelJob:
+    def _queued_job(self, client, auth_headers, monkeypatch, count=1):
+        """JOB_QUEUE=db면 작업이 queued로 남는다 (처리는 워커가 run_next로)."""
+        from core.config import settings
+
+        monkeypatch.setattr(settings, "JOB_QUEUE", "db")
+        names = ["test_cat.png", "test_landscape.png"]
+        ids = [_upload_image(client, auth_headers, names[i % 2]) for i in range(count)]
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": ids, "operation": "grayscale", "method": "threading"},
+            headers=auth_headers,
+        )
+        return resp.json()["id"]
+
+    def test_cancel_queued(self, client, auth_headers, monkeypatch):
+        from service import job_queue, job_service
+
+        job_id = self._queued_job(client, auth_headers, monkeypatch)
+        resp = client.post(f"/api/jobs/{job_id}/cancel", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "cancelled"
+        # 워커가 가져가지 않고, 직접 실행해도 처리하지 않는다
+        assert job_queue.run_next(job_service.get_engine(), "worker-1") is None
+        job_service.process_job(job_id)
+        data = client.get(f"/api/jobs/{job_id}", headers=auth_headers).json()
+        assert (data["status"], data["processed_count"]) == ("cancelled", 0)
+
+    def test_cancel_between_images(self, client, auth_headers, monkeypatch):
+        """처리 중 취소하면 실행 중인 이미지까지만 처리하고 멈춘다."""
+        from core.config import settings
+        from processor import runners
+        from service import job_queue, job_service
+
+        monkeypatch.setattr(settings, "JOB_SLICE_IMAGES", 1)
+        job_id = self._queued_job(client, auth_headers, monkeypatch, count=3)
+        calls = []
+        original = runners.iter_run
+
+        def _spy(*args, **kwargs):
+            calls.append(1)
+            for item in original(*args, **kwargs):
+                yield item
+                resp = client.post(f"/api/jobs/{job_id}/cancel", headers=auth_headers)
+                assert resp.json()["cancel_requested"] is True
+
+        monkeypatch.setattr(runners, "iter_run", _spy)
+        assert job_queue.run_next(job_service.get_engine(), "worker-1") == job_id
+
+        assert len(calls) == 1
+        data = client.get(f"/api/jobs/{job_id}", headers=auth_headers).json()
+        assert (data["status"], data["processed_count"]) == ("cancelled", 1)
+        resp = client.get(f"/api/jobs/{job_id}/result", headers=auth_headers)
+        assert resp.status_code == 400
+
+    def test_cancel_finished(self, client, auth_headers):
+        img_id = _upload_image(client, auth_headers)
+        job_id = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": [img_id], "operation": "grayscale"},
+            headers=auth_headers,
+        ).json()["id"]
+        resp = client.post(f"/api/jobs/{job_id}/cancel", headers=auth_headers)
+        assert resp.status_code == 409
+        assert resp.json()["error_code"] == "JOB_NOT_CANCELLABLE"
+
+    def test_cancel_other_user(self, client, auth_headers, second_user_headers, monkeypatch):
+        job_id = self._queued_job(client, auth_headers, monkeypatch)
+        resp = client.post(f"/api/jobs/{job_id}/cancel", headers=second_user_headers)
+        assert resp.status_code == 404
+
+    def test_priority_claimed_first(self, client, auth_headers, monkeypatch):
+        from core.config import settings
+        from service import job_queue, job_service
+
+        monkeypatch.setattr(settings, "JOB_QUEUE", "db")
+        img_id = _upload_image(client, auth_headers)
+        low = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": [img_id], "operation": "grayscale"},
+            headers=auth_headers,
+        ).json()
+        high = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": [img_id], "operation": "grayscale", "priority": 5},
+            headers=auth_headers,
+        ).json()
+        assert (low["priority"], high["priority"]) == (0, 5)
+        engine = job_service.get_engine()
+        assert job_queue.run_next(engine, "worker-1") == high["id"]
+        assert job_queue.run_next(engine, "worker-1") == low["id"]
+
+
+class TestPartialFailure:
+    def _corrupt(self, client, auth_headers, image_id: int) -> str:
+        """업로드한 원본 파일을 디코드할 수 없는 내용으로 바꾸고 경로를 반환한다."""
+        path = client.get(f"/api/images/{image_id}", headers=auth_headers).json()["original_path"]
+        Path(path).write_bytes(b"not an image")
+        return path
+
+    def _batch(self, client, auth_headers, ids):
+        resp = client.post(
+            "/api/jobs/batch",
+            json={"image_ids": ids, "operation": "grayscale", "method": "threading"},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 202
+        return client.get(f"/api/jobs/{resp.json()['id']}", headers=auth_headers).json()
+
+    def test_corrupt_image_isolated(self, client, auth_headers, monkeypatch):
+        """깨진 이미지 하나는 그 이미지만 실패하고 작업은 completed로 끝난다."""
+        from core.config import settings
+
+        monkeypatch.setattr(settings, "JOB_FAIR_SCHEDULING", False)  # 한 번에 제출 → 분할 재시도
+        ids = [_upload_image(client, auth_headers) for _ in range(4)]
+        bad = _upload_image(client, auth_headers, "test_landscape.png")
+        self._corrupt(client, auth_headers, bad)
+        ids.insert(2, bad)
+
+        job = self._batch(client, auth_headers, ids)
+        assert (job["status"], job["processed_count"], job["failed_count"]) == ("completed", 4, 1)
+        assert "retry" in job["error_message"]
+
+        items = client.get(f"/api/jobs/{job['id']}/images", headers=auth_headers).json()
+        failed = [i for i in items if i["status"] == "failed"]
+        assert [i["image_id"] for i in failed] == [bad]
+        assert failed[0]["error_message"] and failed[0]["output_path"] is None
+        result = client.get(f"/api/jobs/{job['id']}/result", headers=auth_headers).json()
+        assert sorted(r["id"] for r in result) == sorted(i for i in ids if i != bad)
+
+    def test_all_images_failed(self, client, auth_headers):
+        bad = _upload_image(client, auth_headers, "test_landscape.png")
+        self._corrupt(client, auth_headers, bad)
+        job = self._batch(client, auth_headers, [bad])
+        assert (job["status"], job["processed_count"], job["failed_count"]) == ("failed", 0, 1)
+
+    def test_retry_only_failed(self, client, auth_headers, monkeypatch):
+        """재시도는 실패한 이미지만 러너에 넘긴다. 완료된 이미지는 다시 계산하지 않는다."""
+        from core.config import settings
+        from processor import runners
+
+        monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", False)
+        good = _upload_image(client, auth_headers)
+        bad = _upload_image(client, auth_headers, "test_landscape.png")
+        path = self._corrupt(client, auth_headers, bad)
+        job = self._batch(client, auth_headers, [good, bad])
+        assert (job["processed_count"], job["failed_count"]) == (1, 1)
+
+        Path(path).write_bytes((FIXTURES_DIR / "test_landscape.png").read_bytes())
+        submitted = []
+        original = runners.iter_run
+
+        def _spy(method, image_paths, *args, **kwargs):
+            submitted.extend(image_paths)
+            return original(method, image_paths, *args, **kwargs)
+
+        monkeypatch.setattr(runners, "iter_run", _spy)
+        resp = client.post(f"/api/jobs/{job['id']}/retry", headers=auth_headers)
+        assert resp.status_code == 202
+        job = client.get(f"/api/jobs/{job['id']}", headers=auth_headers).json()
+        assert submitted == [path]
+        assert (job["status"], job["processed_count"], job["failed_count"]) == ("completed", 2, 0)
+        assert job["error_message"] is None
+        items = client.get(f"/api/jobs/{job['id']}/images", headers=auth_headers).json()
+        assert {(i["image_id"], i["status"], i["retries"]) for i in items} == {
+            (good, "completed", 0),
+            (bad, "completed", 1),
+        }
+
+    def test_retry_nothing_failed(self, client, auth_headers):
+        img_id = _upload_image(client, auth_headers)
+        job = self._batch(client, auth_headers, [img_id])
+        resp = client.post(f"/api/jobs/{job['id']}/retry", headers=auth_headers)
+        assert resp.status_code == 409
+        assert resp.json()["error_code"] == "JOB_NOT_RETRYABLE"
+
+    def test_retry_other_user(self, client, auth_headers, second_user_headers):
+        bad = _upload_image(client, auth_headers, "test_landscape.png")
+        self._corrupt(client, auth_headers, bad)
+        job = self._batch(client, auth_headers, [bad])
+        resp = client.post(f"/api/jobs/{job['id']}/retry", headers=second_user_headers)
+        assert resp.status_code == 404
@@ -0,0 +1,111 @@
+"""processor.memory 테스트.
+
+메가픽셀 예산이 제출을 막고 완료 시 반납되는지, 러너가 예산을 지키는지,
+RssMonitor가 peak RSS를 기록하는지 검증한다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from processor import memory, sync_runner, thread_runner
+from processor.memory import MemoryBudget, RssMonitor
+from processor.streaming import bounded_completion
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture()
+def image_paths():
+    return sorted(str(p) for p in FIXTURES_DIR.glob("*.png"))
+
+
+def test_disabled_budget_never_blocks():
+    budget = MemoryBudget(limit=0)
+    assert budget.acquire(1000.0) == 0.0
+    assert budget.in_use == 0.0
+
+
+def test_oversized_task_runs_alone():
+    """예산보다 큰 작업은 예산 전체를 잡고 실행된다 (막히지 않음)."""
+    budget = MemoryBudget(limit=10)
+    granted = budget.acquire(50.0)
+    assert granted == 10
+    assert budget.try_acquire(1.0) is None
+    budget.release(granted)
+    assert budget.in_use == 0.0
+
+
+def test_acquire_waits_for_release():
+    budget = MemoryBudget(limit=10)
+    first = budget.acquire(8.0)
+    acquired = threading.Event()
+
+    def _second():
+        budget.release(budget.acquire(5.0))
+        acquired.set()
+
+    thread = threading.Thread(target=_second)
+    thread.start()
+    assert not acquired.wait(0.1)
+    budget.release(first)
+    assert acquired.wait(2)
+    thread.join()
+    assert budget.waits == 1
+    assert budget.peak <= 10
+
+
+def test_bounded_completion_respects_budget(monkeypatch):
+    budget = MemoryBudget(limit=10)
+    monkeypatch.setattr(memory, "budget", budget)
+    running = peak = 0
+    lock = threading.Lock()
+
+    def _task(x):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return x
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = dict(bounded_completion(pool, _task, range(12), 12, weights=[4.0] * 12))
+
+    assert results == {i: i for i in range(12)}
+    assert peak <= 2  # 4MP 작업 2개 = 8MP ≤ 10MP
+    assert budget.peak <= 10
+    assert budget.in_use == 0.0
+
+
+def test_thread_runner_respects_budget(monkeypatch, image_paths):
+    """이미지 1장 크기의 예산이면 thread_runner도 한 번에 1장씩만 처리한다."""
+    budget = MemoryBudget(limit=max(memory.task_weights(image_paths) or [0.001]))
+    monkeypatch.setattr(memory, "budget", budget)
+
+    results = thread_runner.run(image_paths * 3, "grayscale", workers=4)
+    assert all(isinstance(r, Image.Image) for r in results)
+    assert budget.peak <= budget.limit
+    assert budget.in_use == 0.0
+
+
+def test_sync_runner_releases_budget(monkeypatch, image_paths):
+    budget = MemoryBudget(limit=100)
+    monkeypatch.setattr(memory, "budget", budget)
+    sync_runner.run(image_paths, "grayscale")
+    assert budget.peak > 0
+    assert budget.in_use == 0.0
+
+
+def test_rss_monitor_records_peak():
+    with RssMonitor(interval=0.005) as rss:
+        data = bytearray(32 * 1024 * 1024)
+        time.sleep(0.02)
+        del data
+    assert rss.peak_mb >= 32
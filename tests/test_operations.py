@@ -1,8 +1,11 @@
 """이미지 처리 함수 단위 테스트."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from PIL import Image
 
-from processor.operations import blur, grayscale, resize
+from processor import resources
+from processor.operations import blur, grayscale, resize, watermark
 
 
 def _make_image(width: int = 100, height: int = 100) -> Image.Image:
@@ -37,3 +40,47 @@ def test_grayscale():
     # 단색 빨간 이미지를 그레이스케일하면 모든 채널이 동일해야 한다
     r, g, b = result.getpixel((0, 0))
     assert r == g == b
+
+
+def test_watermark_reuses_cached_mask():
+    """같은 텍스트 watermark는 폰트 파싱/렌더링을 한 번만 한다."""
+    resources.clear()
+    img = _make_image(300, 120)
+
+    first = watermark(img)
+    second = watermark(img)
+
+    stats = resources.stats()
+    assert stats["mask_misses"] == 1
+    assert stats["mask_hits"] == 1
+    assert stats["font_misses"] == 1
+    assert first.tobytes() == second.tobytes()
+    assert first.tobytes() != img.tobytes()
+
+
+def test_text_mask_cache_thread_safe():
+    """여러 스레드가 동시에 요청해도 마스크는 키마다 한 번만 만들어진다."""
+    resources.clear()
+    texts = [f"label-{i % 4}" for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        masks = list(pool.map(resources.get_text_mask, texts))
+
+    assert resources.stats()["mask_misses"] == 4
+    assert all(m is masks[i % 4] for i, m in enumerate(masks))
+
+
+def test_text_mask_cache_bounded(monkeypatch):
+    """서로 다른 텍스트가 계속 와도 마스크는 MAX_TEXT_MASKS개까지만 남는다 (LRU)."""
+    resources.clear()
+    monkeypatch.setattr(resources, "MAX_TEXT_MASKS", 3)
+
+    first = resources.get_text_mask("text-0")
+    for i in range(1, 6):
+        resources.get_text_mask(f"text-{i}")
+        resources.get_text_mask("text-0")  # 자주 쓰는 텍스트는 남는다
+
+    stats = resources.stats()
+    assert stats["masks"] == 3
+    assert stats["evictions"] == 3
+    assert resources.get_text_mask("text-0") is first
@@ -0,0 +1,111 @@
+"""processor.pipeline 테스트.
+
+파이프라인 결과가 단계별로 따로 적용한 결과와 같고,
+fusion 규칙이 결과를 바꾸지 않는지 검증한다.
+"""
+
+import pytest
+from PIL import Image
+
+from processor import operations
+from processor.pipeline import (
+    PIPELINE,
+    build,
+    compile_transform,
+    fuse,
+    label,
+    normalize_steps,
+    size_hint,
+)
+
+
+@pytest.fixture()
+def image():
+    return Image.effect_noise((64, 48), 80).convert("RGB")
+
+
+def _apply_each(image, steps):
+    for name, params in steps:
+        image = operations.get_operation(name)(image, **params)
+    return image
+
+
+def test_normalize_fills_defaults():
+    steps = normalize_steps([{"operation": "resize"}, {"operation": "sharpen", "params": None}])
+    assert steps == [("resize", {"width": 200, "height": 200}), ("sharpen", {})]
+
+
+def test_normalize_rejects_unknown():
+    with pytest.raises(ValueError):
+        normalize_steps([{"operation": "explode"}])
+
+
+def test_normalize_rejects_empty():
+    with pytest.raises(ValueError):
+        normalize_steps([])
+
+
+def test_fuse_rotations_and_grayscale():
+    steps = [
+        ("grayscale", {}),
+        ("grayscale", {}),
+        ("rotate", {"degrees": 90}),
+        ("rotate", {"degrees": 270}),
+        ("blur", {"radius": 2}),
+    ]
+    assert fuse(steps) == [("grayscale", {}), ("blur", {"radius": 2})]
+
+
+def test_fuse_keeps_non_right_angle_rotations():
+    steps = [("rotate", {"degrees": 45}), ("rotate", {"degrees": 90})]
+    assert fuse(steps) == steps
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [("grayscale", {}), ("blur", {"radius": 3})],
+        [("grayscale", {}), ("sharpen", {}), ("resize", {"width": 30, "height": 20})],
+        [("resize", {"width": 32, "height": 32}), ("sharpen", {}), ("watermark", {})],
+        [("grayscale", {}), ("watermark", {}), ("rotate", {"degrees": 90})],
+    ],
+)
+def test_pipeline_matches_step_by_step(image, steps):
+    expected = _apply_each(image, steps)
+    result = build(steps)(image)
+    assert result.mode == "RGB"
+    assert result.size == expected.size
+    assert result.tobytes() == expected.tobytes()
+
+
+def test_compile_single_operation(image):
+    result = compile_transform("resize", {"width": 10, "height": 10})(image)
+    assert result.size == (10, 10)
+
+
+def test_label():
+    params = {"steps": [{"operation": "resize"}, {"operation": "watermark"}]}
+    assert label(PIPELINE, params) == "resize+watermark"
+    assert label("blur", {"radius": 3}) == "blur"
+
+
+def test_size_hint_from_leading_resize():
+    assert size_hint("resize", {"width": 120, "height": 80}) == (120, 80)
+    steps = [
+        {"operation": "grayscale"},
+        {"operation": "resize", "params": {"width": 50, "height": 50}},
+    ]
+    assert size_hint(PIPELINE, {"steps": steps}) == (50, 50)
+
+
+def test_size_hint_none_when_pixel_dependent_step_first():
+    steps = [{"operation": "blur"}, {"operation": "resize"}]
+    assert size_hint(PIPELINE, {"steps": steps}) is None
+    assert size_hint("blur", {"radius": 3}) is None
+
+
+def test_size_hint_disabled(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "DECODE_DRAFT", False)
+    assert size_hint("resize", {"width": 120, "height": 80}) is None
@@ -0,0 +1,114 @@
+"""PoolManager 테스트.
+
+method마다 풀이 하나만 생기고, 요청의 workers가 동시 실행 수로 지켜지며,
+러너가 전달받은 풀로 동일한 결과를 내는지 검증한다.
+"""
+
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from processor import mp_runner, thread_runner
+from processor.pool_manager import PoolManager
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture()
+def manager():
+    m = PoolManager()
+    m.start({"threading": 4})
+    yield m
+    m.shutdown()
+
+
+@pytest.fixture()
+def image_paths():
+    return sorted(str(p) for p in FIXTURES_DIR.glob("*.png"))
+
+
+def test_not_started_returns_none():
+    assert PoolManager().get("threading", 2) is None
+
+
+def test_sync_has_no_pool(manager):
+    assert manager.get("sync", 1) is None
+
+
+def test_no_pool_outside_start(manager):
+    """start()에서 만들지 않은 method는 요청이 와도 풀을 만들지 않는다."""
+    assert manager.get("multiprocessing", 2) is None
+    assert manager.size("multiprocessing") == 0
+
+
+def test_one_pool_per_method(manager):
+    pool = manager.get("threading", 4)
+    assert isinstance(pool, ThreadPoolExecutor)
+    assert manager.get("threading", 4) is pool
+    assert manager.get("threading", 16) is pool  # 풀 크기까지만
+    assert manager.warm_keys() == [("threading", w) for w in range(1, 5)]
+    assert manager.is_warm("threading", 4) and not manager.is_warm("threading", 5)
+
+
+def test_workers_limit_inflight(manager):
+    """풀보다 작은 workers는 공유 풀에 동시에 workers개까지만 넣는다."""
+    view = manager.get("threading", 2)
+    lock = threading.Lock()
+    running = peak = 0
+
+    def _task(n: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return n * 2
+
+    futures = [view.submit(_task, n) for n in range(8)]
+    assert [f.result() for f in futures] == [n * 2 for n in range(8)]
+    assert peak == 2
+
+
+def test_queued_submission_cancel(manager):
+    view = manager.get("threading", 1)
+    release = threading.Event()
+    first = view.submit(release.wait)
+    second = view.submit(int, "2")
+    assert second.cancel()
+    third = view.submit(int, "3")
+    release.set()
+    assert first.result() is True
+    assert third.result() == 3
+
+
+def test_prewarm_on_start():
+    m = PoolManager()
+    m.start({"multiprocessing": 2})
+    try:
+        assert m.is_warm("multiprocessing", 2)
+        assert isinstance(m.get("multiprocessing", 2), ProcessPoolExecutor)
+    finally:
+        m.shutdown()
+    assert not m.started
+    assert not m.is_warm("multiprocessing", 2)
+
+
+def test_runners_use_shared_pool(image_paths):
+    params = {"width": 40, "height": 40}
+    m = PoolManager()
+    m.start({"threading": 2, "multiprocessing": 2})
+    try:
+        for method, runner in [("threading", thread_runner), ("multiprocessing", mp_runner)]:
+            for workers in (1, 2):  # 1이면 공유 풀의 제한된 뷰
+                pool = m.get(method, workers)
+                results = runner.run(image_paths, "resize", params, workers=workers, executor=pool)
+                assert all(r.size == (40, 40) for r in results)
+                # 풀은 러너 호출 후에도 살아 있어야 한다
+                assert pool.submit(int, "1").result() == 1
+    finally:
+        m.shutdown()
@@ -0,0 +1,84 @@
+"""processor.registry 테스트.
+
+operation 이름/기본값/메타데이터가 레지스트리 한곳에서 파생되는지,
+새 operation을 등록하면 타일/파이프라인 경로에 바로 반영되는지 검증한다.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageOps
+
+from processor import registry
+from processor.operations import OPERATION_NAMES
+from processor.pipeline import compile_transform
+from processor.tile_runner import is_tileable, run_tiled
+
+
+@pytest.fixture()
+def temp_operation():
+    """테스트용 operation을 등록하고 끝나면 제거한다."""
+    registry.register(tile_halo=lambda params: 0, mode_agnostic=True, name="invert")(
+        lambda image: ImageOps.invert(image)
+    )
+    yield "invert"
+    registry._REGISTRY.pop("invert", None)
+
+
+def test_core_does_not_import_processor():
+    """core는 processor에 의존하지 않는다 (operation 이름은 processor.operations에 있다)."""
+    code = "import sys, core.constants; print(any(m.startswith('processor') for m in sys.modules))"
+    src = Path(__file__).resolve().parent.parent / "src"
+    out = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True)
+    assert out.stdout.strip() == "False", out.stderr
+
+
+def test_constants_follow_registry():
+    assert OPERATION_NAMES == set(registry.names())
+    assert {"blur", "grayscale", "resize", "rotate", "sharpen", "watermark"} <= OPERATION_NAMES
+
+
+def test_default_params_from_schema():
+    assert registry.get_default_params("resize", None) == {"width": 200, "height": 200}
+    assert registry.get_default_params("blur", {}) == {"radius": 10}
+    assert registry.get_default_params("sharpen", None) == {}
+    assert registry.get_default_params("blur", {"radius": 3}) == {"radius": 3}
+
+
+def test_bind_fills_and_validates():
+    assert registry.get("resize").bind({"width": 50}) == {"width": 50, "height": 200}
+    with pytest.raises(ValueError):
+        registry.get("blur").bind({"radius": -1})
+    with pytest.raises(ValueError):
+        registry.get("sharpen").bind({"amount": 2})
+
+
+def test_unknown_operation():
+    with pytest.raises(ValueError):
+        registry.get("explode")
+
+
+def test_metadata():
+    assert registry.get("blur").tileable
+    assert not registry.get("resize").tileable
+    assert not registry.get("watermark").releases_gil
+    assert registry.get("blur").cost_per_mp > registry.get("grayscale").cost_per_mp
+
+
+def test_duplicate_register_rejected():
+    with pytest.raises(ValueError):
+        registry.register(name="blur")(lambda image: image)
+
+
+def test_registered_operation_is_usable(temp_operation):
+    image = Image.effect_noise((32, 24), 80).convert("RGB")
+    expected = ImageOps.invert(image)
+
+    assert is_tileable(temp_operation)
+    assert run_tiled(image, temp_operation, workers=3).tobytes() == expected.tobytes()
+
+    steps = {"steps": [{"operation": "grayscale"}, {"operation": temp_operation}]}
+    result = compile_transform("pipeline", steps)(image)
+    assert result.tobytes() == ImageOps.invert(image.convert("L")).convert("RGB").tobytes()
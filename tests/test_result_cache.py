@@ -0,0 +1,86 @@
+"""processor.result_cache 테스트.
+
+operation/params 정규화, 결과 키가 원본/params/디코드 힌트에 따라 달라지는지,
+파일 기반 적중/미스와 save_jpeg의 원자적 저장을 검증한다.
+"""
+
+import hashlib
+import os
+
+import pytest
+from PIL import Image
+
+from processor import result_cache
+from processor.image_io import save_jpeg
+from processor.result_cache import ResultCache, canonical, file_sha256, result_key
+
+
+def test_canonical_fills_defaults():
+    assert canonical("blur", {}) == canonical("blur", {"radius": 10})
+    assert canonical("blur", {"radius": 2}) != canonical("blur", {"radius": 3})
+
+
+def test_canonical_ignores_key_order():
+    a = canonical("resize", {"width": 10, "height": 20})
+    b = canonical("resize", {"height": 20, "width": 10})
+    assert a == b
+
+
+def test_canonical_pipeline():
+    steps = [{"operation": "grayscale"}, {"operation": "blur", "params": {"radius": 10}}]
+    same = [{"operation": "grayscale"}, {"operation": "blur"}]
+    assert canonical("pipeline", {"steps": steps}) == canonical("pipeline", {"steps": same})
+    assert canonical("pipeline", {"steps": steps}) != canonical("blur", {"radius": 10})
+
+
+def test_canonical_invalid_params():
+    with pytest.raises(ValueError):
+        canonical("blur", {"radius": -1})
+
+
+def test_result_key_depends_on_source_and_hint(monkeypatch):
+    key = result_key("a" * 64, "resize", {"width": 10, "height": 10})
+    assert key == result_key("a" * 64, "resize", {"width": 10, "height": 10})
+    assert key != result_key("b" * 64, "resize", {"width": 10, "height": 10})
+
+    # draft 디코드 여부에 따라 resize 결과 픽셀이 달라지므로 키도 달라야 한다
+    monkeypatch.setattr("processor.pipeline.settings.DECODE_DRAFT", False)
+    assert key != result_key("a" * 64, "resize", {"width": 10, "height": 10})
+
+
+def test_file_sha256(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"nogil")
+    assert file_sha256(str(path)) == hashlib.sha256(b"nogil").hexdigest()
+
+
+def test_lookup_hit_after_save(tmp_path):
+    cache = ResultCache(root=str(tmp_path / "results"))
+    key = result_key("a" * 64, "grayscale")
+    assert cache.lookup(key) is None
+
+    save_jpeg(Image.new("RGB", (8, 8)), cache.path(key))
+    assert cache.lookup(key) == cache.path(key)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_disabled_never_hits(tmp_path, monkeypatch):
+    cache = ResultCache(root=str(tmp_path))
+    key = result_key("a" * 64, "grayscale")
+    save_jpeg(Image.new("RGB", (8, 8)), cache.path(key))
+    monkeypatch.setattr("processor.result_cache.settings.RESULT_CACHE_ENABLED", False)
+    assert cache.lookup(key) is None
+    assert cache.stats()["misses"] == 0
+
+
+def test_save_jpeg_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "out.jpg"
+    save_jpeg(Image.new("RGB", (8, 8)), str(path))
+    save_jpeg(Image.new("RGB", (4, 4)), str(path))  # 덮어쓰기
+    assert os.listdir(tmp_path) == ["out.jpg"]
+    assert Image.open(path).size == (4, 4)
+
+
+def test_module_singleton():
+    assert isinstance(result_cache.cache, ResultCache)
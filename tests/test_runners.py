@@ -1,16 +1,32 @@
 """processor 러너 모듈 테스트.
 
-sync_runner, thread_runner, mp_runner, frethread_runner가
+sync_runner, thread_runner, mp_runner, frethread_runner, interpreter_runner가
 동일한 인터페이스로 동작하고 올바른 결과를 반환하는지 검증한다.
 """
 
+import importlib
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from PIL import Image
 
-from processor import frethread_runner, mp_runner, sync_runner, thread_runner
+from processor import (
+    async_runner,
+    frethread_runner,
+    interpreter_runner,
+    loop_runner,
+    mp_runner,
+    resources,
+    sync_runner,
+    thread_runner,
+)
+from processor.image_io import load_rgb
+from processor.streaming import bounded_completion
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -59,6 +75,119 @@ class TestMpRunner:
         results = mp_runner.run(image_paths, "resize", {"width": 80, "height": 80}, workers=2)
         assert all(r.size == (80, 80) for r in results)
 
+    def test_chunked_same_as_single(self, image_paths):
+        """청크 크기와 무관하게 입력 순서대로 같은 결과."""
+        paths = image_paths * 3
+        single = mp_runner.run(paths, "grayscale", workers=2, chunksize=1)
+        chunked = mp_runner.run(paths, "grayscale", workers=2, chunksize=4)
+        assert [r.tobytes() for r in single] == [r.tobytes() for r in chunked]
+
+    def test_iter_run_chunked(self, image_paths):
+        paths = image_paths * 3
+        results = dict(mp_runner.iter_run(paths, "grayscale", workers=2, chunksize=2))
+        assert sorted(results) == list(range(len(paths)))
+
+    def test_records_task_cost(self, image_paths):
+        mp_runner.run(image_paths, "rotate", {"degrees": 45}, workers=2)
+        seconds, source = mp_runner.estimate_task_seconds(image_paths, "rotate", {"degrees": 45})
+        assert source == "measured"
+        assert seconds > 0
+
+
+class TestMpStartMethod:
+    @pytest.mark.parametrize("start_method", ["forkserver", "spawn"])
+    def test_same_pixels_as_fork(self, image_paths, start_method):
+        fork = mp_runner.run(image_paths, "blur", {"radius": 2}, workers=2, start_method="fork")
+        other = mp_runner.run(
+            image_paths, "blur", {"radius": 2}, workers=2, start_method=start_method
+        )
+        assert [r.tobytes() for r in fork] == [r.tobytes() for r in other]
+
+    def test_auto_follows_gil(self):
+        expected = "fork" if sys._is_gil_enabled() else "forkserver"
+        assert mp_runner.resolve_start_method("auto") == expected
+
+    def test_invalid_start_method(self, image_paths):
+        with pytest.raises(ValueError, match="Unknown start method"):
+            mp_runner.run(image_paths, "blur", workers=1, start_method="clone")
+
+    def test_preload_warms_resources(self):
+        """forkserver preload 모듈은 import만으로 폰트 캐시를 채운다."""
+        resources.clear()
+        importlib.reload(importlib.import_module("processor.preload"))
+        assert resources.stats()["fonts"] >= 1
+
+
+class TestMpPlan:
+    def test_cheap_tasks_are_chunked(self, monkeypatch):
+        monkeypatch.setattr(mp_runner.os, "cpu_count", lambda: 4)
+        plan = mp_runner.plan(1000, 0.001, workers=4, fixed_workers=True)
+        assert plan.chunksize == 20  # TARGET_CHUNK_SECONDS / 0.001
+        assert plan.round_trips(1000) == 50
+
+    def test_chunks_leave_room_for_balancing(self, monkeypatch):
+        monkeypatch.setattr(mp_runner.os, "cpu_count", lambda: 4)
+        plan = mp_runner.plan(32, 0.0001, workers=4, fixed_workers=True)
+        assert plan.chunksize == 2  # 32 / (4 워커 × CHUNKS_PER_WORKER)
+
+    def test_expensive_tasks_are_not_chunked(self):
+        assert mp_runner.plan(100, 0.5, workers=4).chunksize == 1
+
+    def test_workers_capped_by_cpu_and_tasks(self, monkeypatch):
+        monkeypatch.setattr(mp_runner.settings, "MP_AUTO_WORKERS", True)
+        monkeypatch.setattr(mp_runner.os, "cpu_count", lambda: 4)
+        assert mp_runner.plan(100, 1.0, workers=16).workers == 4
+        assert mp_runner.plan(2, 1.0, workers=16).workers == 2
+
+    def test_tiny_batch_uses_fewer_workers(self, monkeypatch):
+        monkeypatch.setattr(mp_runner.settings, "MP_AUTO_WORKERS", True)
+        monkeypatch.setattr(mp_runner.os, "cpu_count", lambda: 16)
+        assert mp_runner.plan(4, 0.001, workers=16).workers == 1
+
+    def test_fixed_workers_kept(self, monkeypatch):
+        monkeypatch.setattr(mp_runner.os, "cpu_count", lambda: 2)
+        assert mp_runner.plan(100, 1.0, workers=8, fixed_workers=True).workers == 8
+
+    def test_overrides(self, monkeypatch):
+        assert mp_runner.plan(100, 0.001, workers=4, chunksize=3).chunksize == 3
+        monkeypatch.setattr(mp_runner.settings, "MP_CHUNKSIZE", 5)
+        assert mp_runner.plan(100, 0.001, workers=4).chunksize == 5
+        # 워커 수 자동 결정은 기본으로 꺼져 있다
+        assert mp_runner.plan(2, 0.001, workers=8).workers == 8
+
+
+class TestMpSharedMemoryTransport:
+    """transport="shm"은 pickle과 같은 픽셀을 돌려준다."""
+
+    def test_same_pixels_as_pickle(self, image_paths):
+        params = {"radius": 2}
+        pickled = mp_runner.run(image_paths, "blur", params, workers=2, transport="pickle")
+        shared = mp_runner.run(image_paths, "blur", params, workers=2, transport="shm")
+        for p, s in zip(pickled, shared):
+            assert p.size == s.size
+            assert p.tobytes() == s.tobytes()
+
+    def test_iter_run(self, image_paths):
+        results = dict(mp_runner.iter_run(image_paths, "grayscale", workers=2, transport="shm"))
+        assert sorted(results) == list(range(len(image_paths)))
+        assert all(isinstance(r, Image.Image) for r in results.values())
+
+    @pytest.mark.skipif(not Path("/dev/shm").is_dir(), reason="/dev/shm 없음")
+    def test_iter_run_early_exit_frees_blocks(self, image_paths):
+        """소비자가 중간에 멈춰도 실행 중이던 청크의 shm 블록이 남지 않는다."""
+        before = set(os.listdir("/dev/shm"))
+        stream = mp_runner.iter_run(
+            image_paths * 4, "grayscale", workers=2, max_inflight=4, chunksize=1, transport="shm"
+        )
+        for _ in stream:
+            break
+        stream.close()
+        assert set(os.listdir("/dev/shm")) - before == set()
+
+    def test_invalid_transport(self, image_paths):
+        with pytest.raises(ValueError, match="Unknown transport"):
+            mp_runner.run(image_paths, "blur", workers=1, transport="pipe")
+
 
 class TestFrethreadRunner:
     def test_requires_gil_disabled(self):
@@ -83,6 +212,40 @@ class TestFrethreadRunner:
         results = frethread_runner.run(image_paths, "resize", params, workers=2)
         assert all(r.size == (60, 60) for r in results)
 
+    def test_schedulers_match(self, image_paths):
+        """work stealing과 fifo 스케줄링 결과가 입력 순서대로 같다."""
+        if sys._is_gil_enabled():
+            pytest.skip("GIL=0 환경에서만 실행 가능")
+        paths = image_paths * 3
+        steal = frethread_runner.run(paths, "grayscale", workers=3, scheduler="steal")
+        fifo = frethread_runner.run(paths, "grayscale", workers=3, scheduler="fifo")
+        assert [r.tobytes() for r in steal] == [r.tobytes() for r in fifo]
+
+
+class TestInterpreterRunner:
+    def test_requires_interpreter_pool(self):
+        """InterpreterPoolExecutor가 없는 Python(<3.14)에서는 RuntimeError."""
+        if interpreter_runner.is_available():
+            pytest.skip("InterpreterPoolExecutor 사용 가능 — 에러 경로 테스트 불가")
+        with pytest.raises(RuntimeError, match="InterpreterPoolExecutor"):
+            interpreter_runner.run(["/nonexistent"], "blur")
+
+    def test_returns_images(self, image_paths):
+        if not interpreter_runner.is_available():
+            pytest.skip("Python 3.14+에서만 실행 가능")
+        results = interpreter_runner.run(image_paths, "blur", {"radius": 3}, workers=2)
+        assert len(results) == len(image_paths)
+        assert all(isinstance(r, Image.Image) for r in results)
+
+    def test_matches_sync(self, image_paths):
+        if not interpreter_runner.is_available():
+            pytest.skip("Python 3.14+에서만 실행 가능")
+        params = {"width": 60, "height": 60}
+        expected = sync_runner.run(image_paths, "resize", params)
+        results = list(interpreter_runner.iter_run(image_paths, "resize", params, workers=2))
+        for idx, result in results:
+            assert result.tobytes() == expected[idx].tobytes()
+
 
 class TestRunnerConsistency:
     """모든 러너가 동일한 결과를 반환하는지 비교."""
@@ -96,3 +259,157 @@ class TestRunnerConsistency:
         assert len(sync_results) == len(thread_results) == len(mp_results)
         for s, t, m in zip(sync_results, thread_results, mp_results):
             assert s.size == t.size == m.size == (120, 120)
+
+
+class TestOutputPaths:
+    """output_paths를 주면 워커에서 인코딩까지 끝내고 경로를 반환한다."""
+
+    def test_sync_writes_files(self, image_paths, tmp_path):
+        outs = [str(tmp_path / f"out_{i}.jpg") for i in range(len(image_paths))]
+        results = sync_runner.run(image_paths, "grayscale", output_paths=outs)
+        assert results == outs
+        assert all(Path(p).exists() for p in outs)
+
+    def test_thread_writes_files(self, image_paths, tmp_path):
+        outs = [str(tmp_path / f"out_{i}.jpg") for i in range(len(image_paths))]
+        results = thread_runner.run(image_paths, "blur", {"radius": 2}, 2, output_paths=outs)
+        assert results == outs
+        assert all(Image.open(p).format == "JPEG" for p in outs)
+
+    def test_mp_writes_files(self, image_paths, tmp_path):
+        outs = [str(tmp_path / f"out_{i}.jpg") for i in range(len(image_paths))]
+        results = mp_runner.run(image_paths, "blur", {"radius": 2}, 2, output_paths=outs)
+        assert results == outs
+        assert all(Path(p).exists() for p in outs)
+
+
+class TestIterRun:
+    """iter_run은 (index, result)를 완료 순서대로 yield한다."""
+
+    def test_sync_yields_in_order(self, image_paths):
+        results = list(sync_runner.iter_run(image_paths, "grayscale"))
+        assert [i for i, _ in results] == list(range(len(image_paths)))
+
+    def test_thread_yields_all_indexes(self, image_paths):
+        paths = image_paths * 3
+        results = dict(thread_runner.iter_run(paths, "resize", {"width": 30, "height": 30}, 2))
+        assert sorted(results) == list(range(len(paths)))
+        assert all(r.size == (30, 30) for r in results.values())
+
+    def test_mp_yields_all_indexes(self, image_paths):
+        results = dict(mp_runner.iter_run(image_paths, "grayscale", workers=2))
+        assert sorted(results) == list(range(len(image_paths)))
+
+    async def test_async_yields_all_indexes(self, image_paths):
+        results = {}
+        async for idx, img in async_runner.iter_with_executor(image_paths, "grayscale", workers=2):
+            results[idx] = img
+        assert sorted(results) == list(range(len(image_paths)))
+
+    def test_loop_runner_outside_server(self, image_paths):
+        """서버 루프가 없으면 전용 스레드의 임시 루프에서 실행된다."""
+        results = dict(loop_runner.iter_run(image_paths * 2, "grayscale", workers=2))
+        assert sorted(results) == list(range(len(image_paths) * 2))
+        expected = sync_runner.run(image_paths, "grayscale")
+        assert loop_runner.run(image_paths, "grayscale", workers=2)[0].tobytes() == (
+            expected[0].tobytes()
+        )
+
+    def test_loop_runner_early_stop(self, image_paths, monkeypatch):
+        """소비자가 중간에 멈춰도 루프 쪽 generator 정리가 끝난 뒤 반환된다."""
+        import asyncio
+
+        closed = []
+        original = async_runner.iter_with_executor
+
+        async def _tracked(*args, **kwargs):
+            try:
+                async for item in original(*args, **kwargs):
+                    yield item
+            finally:
+                await asyncio.sleep(0.05)  # 정리에 시간이 걸려도 기다려야 한다
+                closed.append(True)
+
+        monkeypatch.setattr(async_runner, "iter_with_executor", _tracked)
+        stream = loop_runner.iter_run(image_paths * 5, "grayscale", workers=2, max_inflight=2)
+        next(stream)
+        stream.close()
+        assert closed == [True]
+
+    async def test_async_semaphore_bounds_inflight(self, image_paths, monkeypatch):
+        """공유 semaphore가 요청별 max_inflight보다 작으면 semaphore가 상한이 된다."""
+        import asyncio
+
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def _process(path, transform, out, hint, use_cache=False, timings=None):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return path
+
+        monkeypatch.setattr(async_runner, "process_file", _process)
+        semaphore = asyncio.Semaphore(2)
+        results = {}
+        async for idx, path in async_runner.iter_with_executor(
+            image_paths * 4, "grayscale", workers=4, max_inflight=4, semaphore=semaphore
+        ):
+            results[idx] = path
+        assert len(results) == len(image_paths) * 4
+        assert state["peak"] <= 2
+
+    async def test_loop_lag_probe(self):
+        import asyncio
+
+        probe = async_runner.LoopLagProbe(interval=0.001)
+        await probe.start()
+        await asyncio.sleep(0.005)
+        time.sleep(0.02)  # 루프를 막는 CPU 작업 흉내
+        await asyncio.sleep(0.01)
+        await probe.stop()
+        assert probe.max_ms >= 10
+
+    def test_bounded_inflight(self):
+        """동시에 실행 중인 작업 수가 max_inflight를 넘지 않는다."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def _task(x: int) -> int:
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return x * 2
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = dict(bounded_completion(pool, _task, range(20), max_inflight=3))
+
+        assert results == {i: i * 2 for i in range(20)}
+        assert state["peak"] <= 3
+
+
+class TestDecodeDraft:
+    """resize 목표 크기를 힌트로 JPEG를 축소 디코드한다."""
+
+    @pytest.fixture()
+    def jpeg_path(self, tmp_path):
+        path = tmp_path / "large.jpg"
+        Image.effect_noise((1600, 1200), 60).convert("RGB").save(path, quality=90)
+        return str(path)
+
+    def test_load_with_hint_decodes_smaller(self, jpeg_path):
+        full = load_rgb(jpeg_path)
+        draft = load_rgb(jpeg_path, (200, 150))
+        assert full.size == (1600, 1200)
+        # draft는 요청 크기 이상인 가장 작은 1/2^n 스케일을 고른다
+        assert draft.size == (200, 150)
+
+    def test_runner_resize_with_draft(self, jpeg_path):
+        results = sync_runner.run([jpeg_path], "resize", {"width": 300, "height": 100})
+        assert results[0].size == (300, 100)
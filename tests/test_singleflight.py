@@ -0,0 +1,86 @@
+"""processor.singleflight 테스트.
+
+동시에 들어온 같은 키 요청이 한 번만 실행되고 결과/예외를 공유하는지,
+완료 후에는 새로 실행되는지 검증한다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from processor import singleflight
+from processor.singleflight import SingleFlight
+
+
+def _concurrent(flight: SingleFlight, key, fn, n: int) -> list:
+    barrier = threading.Barrier(n)
+
+    def _call(_):
+        barrier.wait()
+        return flight.do(key, fn)
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(_call, range(n)))
+
+
+def test_concurrent_calls_run_once():
+    flight = SingleFlight()
+    calls = 0
+
+    def _slow():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.1)
+        return "out.jpg"
+
+    results = _concurrent(flight, "k", _slow, 8)
+    assert calls == 1
+    assert [r for r, _ in results] == ["out.jpg"] * 8
+    assert sum(shared for _, shared in results) == 7
+    assert flight.stats() == {"leaders": 1, "coalesced": 7, "in_flight": 0}
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+    assert flight.do("a", lambda: 3) == (3, False)  # 완료된 키는 보관하지 않는다
+
+
+def test_error_is_shared():
+    flight = SingleFlight()
+
+    def _fail():
+        time.sleep(0.05)
+        raise ValueError("decode failed")
+
+    barrier = threading.Barrier(4)
+    errors = []
+
+    def _call():
+        barrier.wait()
+        try:
+            flight.do("k", _fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=_call) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == ["decode failed"] * 4
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_leader_error_propagates():
+    flight = SingleFlight()
+    with pytest.raises(KeyError):
+        flight.do("k", lambda: {}["missing"])
+    assert flight.do("k", lambda: "ok") == ("ok", False)
+
+
+def test_module_singleton():
+    assert isinstance(singleflight.inflight, SingleFlight)
@@ -0,0 +1,91 @@
+"""processor.stages 테스트.
+
+StageTimes 집계, process_file의 단계 측정, 러너별 timings 수집
+(multiprocessing은 ipc 포함)을 검증한다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from processor import interpreter_runner, mp_runner, runners
+from processor.image_io import process_file
+from processor.pipeline import compile_transform
+from processor.stages import StageTimes
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture()
+def image_paths():
+    return sorted(str(p) for p in FIXTURES_DIR.glob("*.png"))
+
+
+def test_mean_ms_and_merge():
+    timings = StageTimes()
+    timings.add(decode=0.002, op=0.010)
+    timings.add(decode=0.004, op=0.020)
+    timings.merge({"decode": (0.006, 1)})
+    timings.add(count=4, ipc=0.004)
+
+    means = timings.mean_ms()
+    assert means["decode"] == 4.0
+    assert means["op"] == 15.0
+    assert means["ipc"] == 1.0
+    assert means["encode"] is None
+    assert timings.snapshot()["decode"] == (pytest.approx(0.012), 3)
+
+
+def test_process_file_records_stages(image_paths, tmp_path):
+    transform = compile_transform("grayscale")
+    timings = StageTimes()
+    timed = process_file(image_paths[0], transform, timings=timings)
+    assert timed.tobytes() == process_file(image_paths[0], transform).tobytes()
+
+    process_file(image_paths[0], transform, str(tmp_path / "out.jpg"), timings=timings)
+    snapshot = timings.snapshot()
+    assert {s: c for s, (_, c) in snapshot.items()} == {
+        "decode": 2, "convert": 2, "op": 2, "encode": 1
+    }
+
+
+def _available(method: str) -> bool:
+    if method == "frethread":
+        return not sys._is_gil_enabled()
+    if method == "interpreter":
+        return interpreter_runner.is_available()
+    return True
+
+
+@pytest.mark.parametrize("method", list(runners.METHODS))
+def test_runner_collects_timings(method, image_paths):
+    if not _available(method):
+        pytest.skip(f"{method} 사용 불가 환경")
+    timings = StageTimes()
+    results = runners.run(method, image_paths, "grayscale", workers=2, timings=timings)
+    assert all(isinstance(r, Image.Image) for r in results)
+
+    means = timings.mean_ms()
+    counts = {s: c for s, (_, c) in timings.snapshot().items()}
+    assert counts["decode"] == counts["op"] == len(image_paths)
+    assert means["op"] > 0
+    assert means["encode"] is None
+    assert (means["ipc"] is not None) == (method == "multiprocessing")
+
+
+def test_runner_without_timings_unchanged(image_paths):
+    plain = runners.run("threading", image_paths, "grayscale", workers=2)
+    timed = runners.run("threading", image_paths, "grayscale", workers=2, timings=StageTimes())
+    assert [r.tobytes() for r in plain] == [r.tobytes() for r in timed]
+
+
+def test_ipc_excludes_consumer_time(image_paths):
+    """ipc는 결과 도착 시각으로 재므로 소비자가 늦게 꺼내도 늘어나지 않는다."""
+    timings = StageTimes()
+    paths = image_paths * 3
+    for _ in mp_runner.iter_run(paths, "grayscale", workers=2, chunksize=1, timings=timings):
+        time.sleep(0.1)  # DB 기록 등 느린 소비자
+    assert timings.mean_ms()["ipc"] < 50
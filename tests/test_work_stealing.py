@@ -0,0 +1,69 @@
+"""processor.work_stealing 테스트.
+
+모든 작업이 정확히 한 번 처리되는지, 큰 작업부터 시작하는지,
+한 워커에 작업이 몰리면 다른 워커가 훔쳐 가는지 검증한다.
+"""
+
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from processor.work_stealing import WorkStealingScheduler, image_weight
+
+
+def test_processes_every_task_once():
+    tasks = list(range(50))
+    results = dict(WorkStealingScheduler(4).run(lambda x: x * 2, tasks, [1.0] * len(tasks)))
+    assert results == {i: i * 2 for i in tasks}
+
+
+def test_largest_first():
+    """워커 1개면 무게 내림차순으로 실행된다."""
+    started = []
+    weights = [1.0, 5.0, 3.0, 4.0, 2.0]
+    list(WorkStealingScheduler(1).run(started.append, list(range(5)), weights))
+    assert started == [1, 3, 2, 4, 0]
+
+
+def test_idle_worker_steals():
+    """워커 0이 느린 작업을 잡고 있는 동안 나머지 작업은 다른 워커가 훔쳐서 처리한다."""
+    def _task(x: int) -> int:
+        time.sleep(0.2 if x == 0 else 0.005)
+        return x
+
+    scheduler = WorkStealingScheduler(2)
+    # 작업 0이 가장 무거워 워커 0의 첫 작업이 되고, 워커 0 deque의 나머지는 워커 1이 훔친다
+    weights = [100.0] + [1.0] * 20
+    results = dict(scheduler.run(_task, list(range(21)), weights))
+    assert sorted(results) == list(range(21))
+    assert scheduler.stats["steals"] > 0
+    assert scheduler.stats["per_worker"][1] > scheduler.stats["per_worker"][0]
+
+
+def test_error_propagates():
+    def _task(x: int) -> int:
+        if x == 3:
+            raise ValueError("boom")
+        return x
+
+    with pytest.raises(ValueError, match="boom"):
+        list(WorkStealingScheduler(3).run(_task, list(range(10)), [1.0] * 10))
+
+
+def test_early_close_releases_workers():
+    """소비자가 중간에 멈춰도 결과 queue에서 기다리던 워커가 풀려나 종료된다."""
+    before = threading.active_count()
+    stream = WorkStealingScheduler(3).run(lambda x: x, list(range(30)), [1.0] * 30, max_inflight=1)
+    next(stream)
+    stream.close()
+    time.sleep(0.05)
+    assert threading.active_count() <= before
+
+
+def test_image_weight_reads_header(tmp_path):
+    path = tmp_path / "big.png"
+    Image.new("RGB", (2000, 500)).save(path)
+    assert image_weight(str(path)) == pytest.approx(1.0)
+    assert image_weight(str(tmp_path / "missing.png")) == 0.0